@@ -36,6 +36,18 @@ class ForecastSettings:
     changepoint_prior_scale: float = 0.05  # Flexibility of trend changes
     seasonality_prior_scale: float = 10.0  # Flexibility of seasonality
     uncertainty_samples: int = 1000  # Samples for uncertainty estimation
+    interval_mode: str = "sampled"  # "sampled" or "analytic" (closed form, no samples)
+    parallel_fitting: bool = False  # Fit metrics and MSAs on a process pool
+    num_workers: Optional[int] = None  # Defaults to os.cpu_count()
+    fit_timeout_seconds: float = 600.0  # Per Stan fit, CmdStan terminated; 0 disables
+    # "background", "eager" (inline) or "skip"; process pool workers validate eagerly
+    validation_mode: str = "background"
+    validation_holdout_years: int = 3
+    validation_cache_size: int = 256  # Holdout results kept by data fingerprint
+    warm_start: bool = True  # Initialize refits from the previous fit's parameters
+    warm_start_max_new_points: int = 3  # Longer appends refit from a cold start
+    model_store: bool = True  # Reuse serialized fits of unchanged series
+    model_store_path: Optional[str] = None  # Defaults to data/cache/prophet_models
 
 
 @dataclass
@@ -44,8 +56,27 @@ class MonteCarloSettings:
 
     default_num_simulations: int = 10000
     correlation_window_years: int = 5
-    seed: int = 42
+    seed: Optional[int] = None  # Default root seed; None draws fresh OS entropy
     percentiles: Optional[List[float]] = None
+    vectorized: bool = True  # Sample all scenarios as one NumPy tensor
+    percentile_method: str = "exact"  # "exact" or "tdigest" (mergeable sketch)
+    tdigest_compression: float = 200.0
+    parallel: bool = False  # Shard scenarios across a process pool
+    shard_size: int = 10000  # Scenarios per shard (fixes the seed streams)
+    num_workers: Optional[int] = None  # Defaults to os.cpu_count()
+    sampler: str = "pseudo_random"  # "pseudo_random", "sobol" or "latin_hypercube"
+    antithetic: bool = False  # Mirror each standard-normal draw
+    control_variates: bool = False  # Correct scores with known forecast means
+    adaptive_tolerance: float = 0.02  # Percentile standard error / metric std
+    adaptive_batch_size: int = 1000
+    adaptive_min_batches: int = 4
+    adaptive_max_scenarios: int = 50000
+    stream_chunk_size: int = 1000  # Scenarios per chunk on streaming endpoints
+    stream_percentile_method: str = "tdigest"  # "exact" retains every streamed value
+    persist_scenarios: bool = False  # save_results also writes the scenario columns
+    scenario_store_path: Optional[str] = None  # Defaults to data/simulations
+    forecast_cache_size: int = 64  # MSA/horizon forecast sets kept in memory
+    forecast_cache_ttl_seconds: float = 3600.0  # 0 disables expiry
 
     def __post_init__(self) -> None:
         if self.percentiles is None:
@@ -268,6 +299,7 @@ class Settings:
                 "default_num_simulations": self.monte_carlo.default_num_simulations,
                 "correlation_window_years": self.monte_carlo.correlation_window_years,
                 "percentiles": self.monte_carlo.percentiles,
+                "percentile_method": self.monte_carlo.percentile_method,
             },
             "database": {
                 "base_path": self.database.base_path,
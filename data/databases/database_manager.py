@@ -11,7 +11,7 @@ import sqlite3
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TypedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TypedDict
 
 from config.settings import settings
 
@@ -363,6 +363,177 @@ class DatabaseManager:
 
         return None
 
+    def get_cached_prophet_forecasts(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        forecast_horizon_years: int,
+        max_age_days: int = 30,
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Retrieve the latest cached forecast for many (parameter, geography) pairs.
+
+        Equivalent to calling ``get_cached_prophet_forecast`` per pair, but runs
+        one query on one connection. Pairs without a fresh forecast are absent
+        from the result.
+        """
+        if not pairs:
+            return {}
+
+        requested = ", ".join("(?, ?)" for _ in pairs)
+        query = f"""
+            WITH requested(parameter_name, geographic_code) AS (VALUES {requested})
+            SELECT * FROM (
+                SELECT f.*, ROW_NUMBER() OVER (
+                    PARTITION BY f.parameter_name, f.geographic_code
+                    ORDER BY f.forecast_date DESC
+                ) AS recency
+                FROM prophet_forecasts f
+                JOIN requested r
+                    ON f.parameter_name = r.parameter_name
+                    AND f.geographic_code = r.geographic_code
+                WHERE f.forecast_horizon_years = ?
+                AND DATE(f.forecast_date) >= DATE('now', ?)
+            )
+            WHERE recency = 1
+        """
+
+        params: List[Any] = [value for pair in pairs for value in pair]
+        params += [forecast_horizon_years, f"-{int(max_age_days)} days"]
+        results = self.query_data("forecast_cache", query, tuple(params))
+
+        forecasts = {}
+        for row in results:
+            row.pop("recency", None)
+            forecasts[(row["parameter_name"], row["geographic_code"])] = row
+        return forecasts
+
+    def save_prophet_model_params(
+        self,
+        parameter_name: str,
+        geographic_code: str,
+        params: Dict[str, Any],
+        data_points: int,
+        series_fingerprint: str,
+    ) -> None:
+        """Save the Stan parameters of a Prophet fit, replacing older ones."""
+
+        params_data = {
+            "parameter_name": parameter_name,
+            "geographic_code": geographic_code,
+            "fitted_at": datetime.now().isoformat(),
+            "data_points": data_points,
+            "series_fingerprint": series_fingerprint,
+            "params": json.dumps(
+                {
+                    name: value.tolist() if hasattr(value, "tolist") else value
+                    for name, value in params.items()
+                }
+            ),
+        }
+
+        self.insert_data("forecast_cache", "prophet_model_params", params_data)
+
+    def get_prophet_model_params(
+        self, parameter_name: str, geographic_code: str
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve the latest stored Prophet fit parameters, with params parsed."""
+
+        results = self.query_data(
+            "forecast_cache",
+            """
+            SELECT * FROM prophet_model_params
+            WHERE parameter_name = ? AND geographic_code = ?
+            """,
+            (parameter_name, geographic_code),
+        )
+
+        if not results:
+            return None
+
+        record = results[0]
+        record["params"] = json.loads(record["params"])
+        return record
+
+    def save_prophet_validation(
+        self,
+        parameter_name: str,
+        geographic_code: str,
+        validation_fingerprint: str,
+        mape: float,
+        rmse: float,
+        mae: float,
+    ) -> None:
+        """Save the holdout validation of a Prophet fit, replacing older ones."""
+
+        validation_data = {
+            "parameter_name": parameter_name,
+            "geographic_code": geographic_code,
+            "validated_at": datetime.now().isoformat(),
+            "validation_fingerprint": validation_fingerprint,
+            "mape": float(mape),
+            "rmse": float(rmse),
+            "mae": float(mae),
+        }
+
+        self.insert_data("forecast_cache", "prophet_validations", validation_data)
+
+    def get_prophet_validation(
+        self, parameter_name: str, geographic_code: str
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve the latest stored holdout validation of a Prophet fit."""
+
+        results = self.query_data(
+            "forecast_cache",
+            """
+            SELECT * FROM prophet_validations
+            WHERE parameter_name = ? AND geographic_code = ?
+            """,
+            (parameter_name, geographic_code),
+        )
+
+        return results[0] if results else None
+
+    def update_prophet_forecast_performance(
+        self,
+        parameter_name: str,
+        geographic_code: str,
+        forecast_horizon_years: int,
+        historical_data_points: int,
+        model_performance: Dict[str, Any],
+    ) -> bool:
+        """
+        Merge metrics into the latest saved forecast's model performance.
+
+        Only a forecast fitted to ``historical_data_points`` observations is
+        updated, so metrics of an older series never land on a newer forecast.
+
+        Returns:
+            Whether a saved forecast was updated
+        """
+        with self.get_connection("forecast_cache") as conn:
+            row = conn.execute(
+                """
+                SELECT rowid, model_performance, historical_data_points
+                FROM prophet_forecasts
+                WHERE parameter_name = ? AND geographic_code = ?
+                AND forecast_horizon_years = ?
+                ORDER BY forecast_date DESC
+                LIMIT 1
+                """,
+                (parameter_name, geographic_code, forecast_horizon_years),
+            ).fetchone()
+            if row is None or row["historical_data_points"] != historical_data_points:
+                return False
+
+            performance = json.loads(row["model_performance"])
+            performance.update(model_performance)
+            conn.execute(
+                "UPDATE prophet_forecasts SET model_performance = ? WHERE rowid = ?",
+                (json.dumps(performance), row["rowid"]),
+            )
+            conn.commit()
+            return True
+
     def save_correlations(
         self,
         geographic_code: str,
@@ -21,6 +21,29 @@ CREATE TABLE IF NOT EXISTS prophet_forecasts (
     PRIMARY KEY(parameter_name, geographic_code, forecast_date, forecast_horizon_years)
 );
 
+-- Stan parameters of the latest Prophet fit, used to warm-start refits
+CREATE TABLE IF NOT EXISTS prophet_model_params (
+    parameter_name TEXT NOT NULL,
+    geographic_code TEXT NOT NULL,
+    fitted_at TIMESTAMP NOT NULL,
+    data_points INTEGER NOT NULL,  -- Length of the fitted series
+    series_fingerprint TEXT NOT NULL,  -- SHA-256 of the fitted series
+    params TEXT NOT NULL,  -- JSON object with k, m, sigma_obs, delta, beta
+    PRIMARY KEY(parameter_name, geographic_code)
+);
+
+-- Holdout validation of the latest Prophet fit, reused while the series is unchanged
+CREATE TABLE IF NOT EXISTS prophet_validations (
+    parameter_name TEXT NOT NULL,
+    geographic_code TEXT NOT NULL,
+    validated_at TIMESTAMP NOT NULL,
+    validation_fingerprint TEXT NOT NULL,  -- SHA-256 of the series and holdout
+    mape REAL NOT NULL,
+    rmse REAL NOT NULL,
+    mae REAL NOT NULL,
+    PRIMARY KEY(parameter_name, geographic_code)
+);
+
 -- =============================================================================
 -- PARAMETER CORRELATIONS TABLE
 -- =============================================================================
@@ -24,6 +24,7 @@ from data.collectors.data_orchestrator import (
     create_orchestrator,
 )
 from data.databases.database_manager import db_manager
+from monte_carlo.forecast_cache import invalidate_forecasts
 
 
 class UpdateFrequency(Enum):
@@ -332,6 +333,10 @@ class LiveDataScheduler:
             failed_jobs = [r for r in results if not r.success]
             total_records = sum(r.records_collected for r in successful_jobs)
 
+            # Cached Monte Carlo forecasts for refreshed geographies are stale
+            for geo_code in {r.job.geographic_code for r in successful_jobs}:
+                invalidate_forecasts(geo_code)
+
             # Update configuration
             update_config.last_update = datetime.now()
             update_config.update_count += 1
@@ -0,0 +1,106 @@
+"""
+Prophet Model Store
+
+On-disk cache of fitted Prophet models serialized with Prophet's JSON
+serializer. Models are keyed by parameter, geography and a fingerprint of the
+input series and model configuration, so a forecast of an unchanged series
+reloads the previous fit instead of running Stan again. Only the latest fit
+per parameter and geography is kept.
+"""
+
+import re
+import uuid
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from prophet.serialize import model_from_json, model_to_json
+
+from config.settings import settings
+from core.exceptions import ValidationError
+from core.logging_config import get_logger
+
+MODEL_SUFFIX = ".json"
+
+# Parameter names, geographic codes and fingerprints become path components
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+logger = get_logger(__name__)
+
+
+class ProphetModelStore:
+    """Saves and reloads fitted Prophet models keyed by data fingerprint."""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        if root is None:
+            root = settings.forecast.model_store_path or settings.get_cache_path(
+                "prophet_models"
+            )
+        self.root = Path(root)
+
+    def path_for(
+        self, parameter_name: str, geographic_code: str, fingerprint: str
+    ) -> Path:
+        """File holding the model fitted to one series and configuration."""
+        for key in (parameter_name, geographic_code, fingerprint):
+            if not _KEY_PATTERN.match(key):
+                raise ValidationError(
+                    f"Invalid model store key '{key}'",
+                    field_name="model_key",
+                    field_value=key,
+                )
+        return self.root / parameter_name / geographic_code / f"{fingerprint}.json"
+
+    def load(
+        self, parameter_name: str, geographic_code: str, fingerprint: str
+    ) -> Optional[Any]:
+        """
+        Reload the model fitted to a fingerprint.
+
+        Returns:
+            Fitted Prophet model, or None if none is stored or it cannot be
+            deserialized (e.g. it was written by another Prophet version)
+        """
+        path = self.path_for(parameter_name, geographic_code, fingerprint)
+        if not path.exists():
+            return None
+        try:
+            return model_from_json(path.read_text())
+        except Exception as e:
+            logger.warning(f"Discarding unreadable Prophet model {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def save(
+        self, parameter_name: str, geographic_code: str, fingerprint: str, model: Any
+    ) -> Path:
+        """
+        Serialize a fitted model, replacing older fits of the same series.
+
+        The JSON is written to a temporary sibling file that is renamed into
+        place, so concurrent readers never see a partial model.
+        """
+        path = self.path_for(parameter_name, geographic_code, fingerprint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            staging.write_text(model_to_json(model))
+            staging.replace(path)
+        except Exception:
+            staging.unlink(missing_ok=True)
+            raise
+
+        for stale in path.parent.glob(f"*{MODEL_SUFFIX}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return path
+
+    def delete(self, parameter_name: str, geographic_code: str) -> int:
+        """Remove every stored model of a series; returns how many existed."""
+        directory = self.path_for(parameter_name, geographic_code, "any").parent
+        if not directory.exists():
+            return 0
+        models = list(directory.glob(f"*{MODEL_SUFFIX}"))
+        for path in models:
+            path.unlink(missing_ok=True)
+        return len(models)
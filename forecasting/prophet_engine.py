@@ -7,10 +7,19 @@ Generates forecasts with uncertainty intervals and automatic
 trend/seasonality detection.
 """
 
+import copy
+import hashlib
+import json
+import os
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
@@ -19,6 +28,7 @@ import pandas as pd
 
 try:
     from prophet import Prophet
+    from prophet import __version__ as PROPHET_VERSION
 
     PROPHET_AVAILABLE = True
 except ImportError as e:
@@ -26,15 +36,30 @@ except ImportError as e:
         "Prophet is required for forecasting. Install with: pip install prophet==1.1.7"
     ) from e
 
-from core.exceptions import ValidationError
+from config.settings import settings
+from core.exceptions import ConfigurationError, ValidationError
 from core.logging_config import get_logger
 
 # Import from project modules
 from data.databases.database_manager import db_manager
+from forecasting.model_store import ProphetModelStore
+from monte_carlo.forecast_cache import invalidate_forecasts
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
+# Metrics forecast once for the whole country rather than per MSA
+NATIONAL_METRICS = ("treasury_10y", "commercial_mortgage_rate", "fed_funds_rate")
+
+# When generate_forecast runs the holdout validation
+VALIDATION_MODES = ("eager", "background", "skip")
+
+# How forecast intervals are derived
+INTERVAL_MODES = ("sampled", "analytic")
+
+# Prophet's default sample count, the reference for fast interval modes
+INTERVAL_BASELINE_SAMPLES = 1000
+
 
 @dataclass
 class ProphetForecastResult:
@@ -60,21 +85,219 @@ class ValidationResult:
     mae: float  # Mean Absolute Error
 
 
+# Holdout ValidationResults and interval accuracy checks by data fingerprint,
+# least recently used first
+_validation_cache: "OrderedDict[str, ValidationResult]" = OrderedDict()
+_interval_accuracy_cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+_validation_lock = threading.Lock()
+_validation_executor: Optional[ThreadPoolExecutor] = None
+
+
+def clear_validation_cache() -> None:
+    """Forget every cached holdout validation and interval accuracy check."""
+    with _validation_lock:
+        _validation_cache.clear()
+        _interval_accuracy_cache.clear()
+
+
+def _lookup(cache: "OrderedDict[str, Any]", fingerprint: str) -> Optional[Any]:
+    """Cached result for a fingerprint, marked as recently used."""
+    with _validation_lock:
+        result = cache.get(fingerprint)
+        if result is not None:
+            cache.move_to_end(fingerprint)
+    return result
+
+
+def _remember(cache: "OrderedDict[str, Any]", fingerprint: str, result: Any) -> None:
+    """Cache a result, evicting the least recently used beyond the limit."""
+    with _validation_lock:
+        cache[fingerprint] = result
+        while len(cache) > max(1, settings.forecast.validation_cache_size):
+            cache.popitem(last=False)
+
+
+def _background_executor() -> ThreadPoolExecutor:
+    """Shared worker threads for deferred model diagnostics."""
+    global _validation_executor
+    with _validation_lock:
+        if _validation_executor is None:
+            _validation_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="prophet-validation"
+            )
+    return _validation_executor
+
+
+def interval_mode() -> str:
+    """Configured ``forecast.interval_mode``, validated."""
+    mode = settings.forecast.interval_mode
+    if mode not in INTERVAL_MODES:
+        raise ConfigurationError(
+            f"Unknown interval mode '{mode}', expected one of {INTERVAL_MODES}",
+            config_key="forecast.interval_mode",
+        )
+    return mode
+
+
+def analytic_intervals(
+    model: Any, forecast: pd.DataFrame
+) -> Tuple[List[float], List[float]]:
+    """
+    Normal approximation of Prophet's sampled uncertainty intervals.
+
+    For linear growth Prophet simulates future changepoints as a Poisson
+    process with the historical changepoint rate, each changing the slope by
+    a Laplace draw scaled by the mean absolute fitted ``delta``, and adds
+    Gaussian observation noise. Both variances have a closed form: at scaled
+    time ``t`` past the history (``t > 1``) the trend variance is
+    ``2 * scale**2 * rate * (t - 1)**3 / 3``.
+
+    Args:
+        model: Fitted Prophet model
+        forecast: Rows of ``model.predict`` output with ``ds`` and ``yhat``
+
+    Returns:
+        (lower_bound, upper_bound) at the model's ``interval_width``
+    """
+    t = ((pd.to_datetime(forecast["ds"]) - model.start) / model.t_scale).to_numpy()
+    rate = len(model.changepoints_t)
+    scale = np.mean(np.abs(model.params["delta"])) + 1e-8  # Prophet's epsilon
+    sigma_obs = float(np.ravel(model.params["sigma_obs"])[0])
+
+    horizon = np.clip(t.astype(float) - 1.0, 0.0, None)
+    trend_variance = 2 * scale**2 * rate * horizon**3 / 3
+    std = model.y_scale * np.sqrt(trend_variance + sigma_obs**2)
+    z = NormalDist().inv_cdf(0.5 + model.interval_width / 2)
+
+    yhat = forecast["yhat"].to_numpy()
+    return (yhat - z * std).tolist(), (yhat + z * std).tolist()
+
+
+def series_fingerprint(data: pd.DataFrame, *parts: Any) -> str:
+    """SHA-256 of a ``ds``/``y`` series, salted with ``parts``."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode())
+    ds = pd.to_datetime(data["ds"]).astype("datetime64[ns]").astype("int64")
+    digest.update(ds.to_numpy().tobytes())
+    digest.update(data["y"].to_numpy(dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def warm_start_params(model: Any) -> Optional[Dict[str, Any]]:
+    """
+    Stan parameters of a fitted Prophet model, usable as ``fit(init=...)``.
+
+    Returns None if the model has no MAP parameters (e.g. it is not fitted).
+    Parameters whose shapes do not match the new fit are replaced by Prophet's
+    default initialization.
+    """
+    params = getattr(model, "params", None)
+    if not isinstance(params, dict) or not params:
+        return None
+    try:
+        return {
+            **{name: float(params[name][0][0]) for name in ("k", "m", "sigma_obs")},
+            **{name: np.asarray(params[name][0]) for name in ("delta", "beta")},
+        }
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def rescale_warm_start(
+    init: Dict[str, Any], source: Any, target: Any, data: pd.DataFrame
+) -> Dict[str, Any]:
+    """
+    Convert warm-start parameters from one fit's scaling to another's.
+
+    Stan parameters live on axes scaled by each fit's own data,
+    ``(y - y_min) / y_scale`` and ``(ds - start) / t_scale``. A holdout fit
+    on a prefix of the series has a shorter ``t_scale`` and may have another
+    ``y_scale``, so the slope, offset, changepoint deltas, noise and additive
+    seasonality are converted to describe the same curve in original units.
+    Both fits are assumed to share ``start``. If either model's scales are
+    unavailable, ``init`` is returned unchanged as a rough initialization.
+    """
+    try:
+        target.setup_dataframe(data.copy(), initialize_scales=True)
+        y_ratio = float(source.y_scale / target.y_scale)
+        t_ratio = float(target.t_scale / source.t_scale)
+        y_shift = float(
+            ((source.y_min or 0.0) - (target.y_min or 0.0)) / target.y_scale
+        )
+    except (AttributeError, TypeError, ValueError, ZeroDivisionError):
+        return init
+
+    rescaled = dict(init)
+    rescaled["k"] = init["k"] * y_ratio * t_ratio
+    rescaled["m"] = init["m"] * y_ratio + y_shift
+    rescaled["sigma_obs"] = init["sigma_obs"] * y_ratio
+    if "delta" in init:
+        rescaled["delta"] = np.asarray(init["delta"]) * y_ratio * t_ratio
+    if "beta" in init and getattr(source, "seasonality_mode", None) == "additive":
+        rescaled["beta"] = np.asarray(init["beta"]) * y_ratio
+    return rescaled
+
+
+def adapt_warm_start(
+    model: Any, init: Dict[str, Any], data_points: int
+) -> Dict[str, Any]:
+    """
+    Adapt warm-start parameters to an unfitted model and series length.
+
+    Prophet places fewer changepoints on short series, so one more yearly
+    point can change the length of ``delta``; Prophet would then discard it.
+    The previous slope changes are kept instead, padded with zeros for new
+    changepoints or truncated.
+    """
+    init = {name: np.asarray(value, dtype=float) for name, value in init.items()}
+    try:
+        # Mirrors Prophet.set_changepoints; no changepoints still uses one delta
+        hist_size = int(np.floor(data_points * model.changepoint_range))
+        num_changepoints = max(1, min(model.n_changepoints, hist_size - 1))
+    except TypeError:
+        return init
+
+    delta = init.get("delta")
+    if delta is not None and delta.shape != (num_changepoints,):
+        resized = np.zeros(num_changepoints)
+        kept = min(num_changepoints, delta.size)
+        resized[:kept] = delta.reshape(-1)[:kept]
+        init["delta"] = resized
+    return init
+
+
 class ProphetForecaster:
     """Prophet forecasting engine for pro forma metrics."""
 
-    def __init__(self, parameter_name: str, geographic_code: str):
+    def __init__(
+        self,
+        parameter_name: str,
+        geographic_code: str,
+        model_store: Optional[ProphetModelStore] = None,
+        fit_timeout_seconds: Optional[float] = None,
+        validation_mode: Optional[str] = None,
+    ):
         """
         Initialize forecaster for specific parameter and geography.
 
         Args:
             parameter_name: Name of the pro forma metric
             geographic_code: Geographic identifier (MSA code or 'NATIONAL')
+            model_store: Store of fitted models (defaults to settings)
+            fit_timeout_seconds: Limit for each Stan fit; 0 disables
+                (defaults to settings)
+            validation_mode: When holdout validation runs (defaults to
+                settings)
         """
         self.parameter_name = parameter_name
         self.geographic_code = geographic_code
         self.historical_data = None
         self.fitted_model = None
+        self.model_store = model_store
+        if fit_timeout_seconds is None:
+            fit_timeout_seconds = settings.forecast.fit_timeout_seconds
+        self.fit_timeout_seconds = fit_timeout_seconds
+        self.validation_mode = validation_mode
+        self._pending_validation: Optional["Future[ValidationResult]"] = None
         self.logger = get_logger(__name__)
 
         # Validate inputs
@@ -130,14 +353,31 @@ class ProphetForecaster:
         yearly_seasonality: bool = True,
         weekly_seasonality: bool = False,
         daily_seasonality: bool = False,
+        init: Optional[Dict[str, Any]] = None,
+        warm_start: Optional[bool] = None,
+        use_model_store: Optional[bool] = None,
     ) -> None:
         """
         Fit Prophet model to historical data.
 
+        If the model store holds a model fitted to the same series and
+        configuration, it is reloaded and no fit runs. Otherwise the fitted
+        model is serialized to the store, and its Stan parameters are stored
+        in the forecast cache. When the series has only gained a few points
+        since the stored fit (its earlier points are unchanged), the next fit
+        starts from those parameters instead of Prophet's cold-start guess and
+        converges in fewer iterations.
+
         Args:
             yearly_seasonality: Include yearly seasonality
             weekly_seasonality: Include weekly seasonality
             daily_seasonality: Include daily seasonality
+            init: Stan parameters (k, m, sigma_obs, delta, beta) to start from;
+                overrides the stored parameters
+            warm_start: Start from the stored parameters when applicable
+                (defaults to settings)
+            use_model_store: Reuse and save serialized fits (defaults to
+                settings)
         """
         if self.historical_data is None:
             raise ValueError(
@@ -146,30 +386,160 @@ class ProphetForecaster:
 
         try:
             # Configure Prophet model
-            self.fitted_model = Prophet(
-                yearly_seasonality=yearly_seasonality,
-                weekly_seasonality=weekly_seasonality,
-                daily_seasonality=daily_seasonality,
-                interval_width=0.95,  # 95% confidence intervals
-                changepoint_prior_scale=0.05,  # Flexibility of trend changes
-                seasonality_prior_scale=10.0,  # Flexibility of seasonality
-                uncertainty_samples=1000,  # Samples for uncertainty estimation
-            )
+            forecast_settings = settings.forecast
+            model_config = {
+                "yearly_seasonality": yearly_seasonality,
+                "weekly_seasonality": weekly_seasonality,
+                "daily_seasonality": daily_seasonality,
+                "interval_width": forecast_settings.confidence_interval,
+                "changepoint_prior_scale": forecast_settings.changepoint_prior_scale,
+                "seasonality_prior_scale": forecast_settings.seasonality_prior_scale,
+                # Analytic intervals need no simulated trend paths at predict time
+                "uncertainty_samples": (
+                    0
+                    if interval_mode() == "analytic"
+                    else forecast_settings.uncertainty_samples
+                ),
+            }
+
+            if use_model_store is None:
+                use_model_store = settings.forecast.model_store
+            fingerprint = None
+            if use_model_store:
+                fingerprint = self._model_fingerprint(model_config)
+                stored_model = self._load_stored_model(fingerprint)
+                if stored_model is not None:
+                    self.fitted_model = stored_model
+                    print("Loaded fitted Prophet model from the model store")
+                    return
+
+            self.fitted_model = Prophet(**model_config)
+
+            if warm_start is None:
+                warm_start = settings.forecast.warm_start
+            if init is None and warm_start:
+                init = self._stored_params()
 
             # Fit the model
-            self.fitted_model.fit(self.historical_data)
+            if init is not None:
+                init = adapt_warm_start(
+                    self.fitted_model, init, len(self.historical_data)
+                )
+                self.fitted_model.fit(
+                    self.historical_data, init=init, **self._fit_options()
+                )
+            else:
+                self.fitted_model.fit(self.historical_data, **self._fit_options())
 
             print("Fitted Prophet model successfully")
+            self._store_params()
+            if fingerprint is not None:
+                self._save_stored_model(fingerprint)
 
         except Exception as e:
             raise Exception(f"Failed to fit Prophet model: {str(e)}")
 
-    def validate_model(self, holdout_years: int = 3) -> ValidationResult:
+    def _fit_options(self) -> Dict[str, Any]:
+        """
+        Keyword arguments passed through ``Prophet.fit`` to cmdstanpy.
+
+        cmdstanpy terminates the CmdStan process once ``timeout`` expires and
+        raises TimeoutError, so a stuck fit leaves no optimizer running.
+        """
+        if not self.fit_timeout_seconds:
+            return {}
+        return {"timeout": self.fit_timeout_seconds}
+
+    def _model_fingerprint(self, model_config: Dict[str, Any]) -> str:
+        """Hash of the series and configuration a fitted model depends on."""
+        return series_fingerprint(
+            self.historical_data,
+            self.parameter_name,
+            self.geographic_code,
+            json.dumps(model_config, sort_keys=True),
+            PROPHET_VERSION,
+        )
+
+    def _load_stored_model(self, fingerprint: str) -> Optional[Any]:
+        """Model fitted to this fingerprint, if the store has one."""
+        store = self.model_store or ProphetModelStore()
+        try:
+            return store.load(self.parameter_name, self.geographic_code, fingerprint)
+        except Exception as e:
+            self.logger.warning(f"Could not load stored Prophet model: {e}")
+            return None
+
+    def _save_stored_model(self, fingerprint: str) -> None:
+        """Serialize the fitted model for unchanged-data reruns."""
+        store = self.model_store or ProphetModelStore()
+        try:
+            store.save(
+                self.parameter_name,
+                self.geographic_code,
+                fingerprint,
+                self.fitted_model,
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not store Prophet model: {e}")
+
+    def _stored_params(self) -> Optional[Dict[str, Any]]:
+        """Stored fit parameters, if the series only grew a little since that fit."""
+        try:
+            record = db_manager.get_prophet_model_params(
+                self.parameter_name, self.geographic_code
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not load stored Prophet parameters: {e}")
+            return None
+        if not isinstance(record, dict):
+            return None
+
+        data_points = record["data_points"]
+        new_points = len(self.historical_data) - data_points
+        if not 0 <= new_points <= settings.forecast.warm_start_max_new_points:
+            return None
+        if (
+            series_fingerprint(self.historical_data.iloc[:data_points])
+            != record["series_fingerprint"]
+        ):
+            self.logger.info(
+                f"History of {self.parameter_name} ({self.geographic_code}) "
+                "was revised; fitting from a cold start"
+            )
+            return None
+        return record["params"]
+
+    def _store_params(self) -> None:
+        """Persist the fitted Stan parameters for the next refit."""
+        params = warm_start_params(self.fitted_model)
+        if params is None:
+            return
+        try:
+            db_manager.save_prophet_model_params(
+                parameter_name=self.parameter_name,
+                geographic_code=self.geographic_code,
+                params=params,
+                data_points=len(self.historical_data),
+                series_fingerprint=series_fingerprint(self.historical_data),
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not store Prophet parameters: {e}")
+
+    def validate_model(
+        self, holdout_years: Optional[int] = None, use_cache: bool = True
+    ) -> ValidationResult:
         """
         Validate the fitted model using holdout data.
 
+        The holdout model is initialized from the main fit's parameters,
+        converted to the holdout fit's scaling, and results are cached and
+        stored by a fingerprint of the historical data, so an unchanged series
+        is only validated once, even across processes.
+
         Args:
             holdout_years: Number of years to hold out for validation
+                (defaults to settings)
+            use_cache: Reuse a cached result for identical data
 
         Returns:
             ValidationResult with validation metrics
@@ -177,24 +547,32 @@ class ProphetForecaster:
         if self.fitted_model is None:
             raise ValueError("No model fitted. Call fit_model() first.")
 
-        if len(self.historical_data) < holdout_years + 3:
-            print(
-                f"Warning: Not enough data for {holdout_years}-year holdout validation"
-            )
-            holdout_years = max(1, len(self.historical_data) // 3)
+        holdout_years = self._holdout_years(holdout_years)
+        fingerprint = self._validation_fingerprint(holdout_years)
+        if use_cache:
+            cached = self._cached_validation(fingerprint)
+            if cached is not None:
+                return cached
 
         # Split data
         train_data = self.historical_data[:-holdout_years].copy()
         test_data = self.historical_data[-holdout_years:].copy()
 
-        # Fit model on training data
+        # Fit model on training data, starting from the main fit's optimum
         train_model = Prophet(
             yearly_seasonality=True,
             weekly_seasonality=False,
             daily_seasonality=False,
             interval_width=0.95,
+            uncertainty_samples=0,  # Holdout metrics only use yhat
         )
-        train_model.fit(train_data)
+        init = warm_start_params(self.fitted_model)
+        if init is not None:
+            init = rescale_warm_start(init, self.fitted_model, train_model, train_data)
+            init = adapt_warm_start(train_model, init, len(train_data))
+            train_model.fit(train_data, init=init, **self._fit_options())
+        else:
+            train_model.fit(train_data, **self._fit_options())
 
         # Generate forecasts for test period
         future = train_model.make_future_dataframe(periods=holdout_years, freq="Y")
@@ -210,14 +588,208 @@ class ProphetForecaster:
         rmse = np.sqrt(np.mean(errors**2))
         mae = np.mean(np.abs(errors))
 
-        return ValidationResult(mape=mape, rmse=rmse, mae=mae)
+        result = ValidationResult(mape=mape, rmse=rmse, mae=mae)
+        _remember(_validation_cache, fingerprint, result)
+        self._store_validation(fingerprint, result)
+        return result
+
+    def cached_validation(
+        self, holdout_years: Optional[int] = None
+    ) -> Optional[ValidationResult]:
+        """Cached or stored holdout validation for the current data, if any."""
+        return self._cached_validation(
+            self._validation_fingerprint(self._holdout_years(holdout_years))
+        )
+
+    def _cached_validation(self, fingerprint: str) -> Optional[ValidationResult]:
+        """Validation for a fingerprint from memory, then from the database."""
+        cached = _lookup(_validation_cache, fingerprint)
+        if cached is not None:
+            return cached
+
+        try:
+            record = db_manager.get_prophet_validation(
+                self.parameter_name, self.geographic_code
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not load stored Prophet validation: {e}")
+            return None
+        if (
+            not isinstance(record, dict)
+            or record["validation_fingerprint"] != fingerprint
+        ):
+            return None
+
+        stored = ValidationResult(
+            mape=record["mape"], rmse=record["rmse"], mae=record["mae"]
+        )
+        _remember(_validation_cache, fingerprint, stored)
+        return stored
+
+    def _store_validation(self, fingerprint: str, result: ValidationResult) -> None:
+        """Persist a holdout validation for later processes."""
+        try:
+            db_manager.save_prophet_validation(
+                parameter_name=self.parameter_name,
+                geographic_code=self.geographic_code,
+                validation_fingerprint=fingerprint,
+                mape=result.mape,
+                rmse=result.rmse,
+                mae=result.mae,
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not store Prophet validation: {e}")
+
+    def validate_in_background(
+        self, holdout_years: Optional[int] = None
+    ) -> "Future[ValidationResult]":
+        """
+        Run ``validate_model`` on a shared worker thread.
 
-    def generate_forecast(self, horizon_years: int = 5) -> ProphetForecastResult:
+        The result is cached and stored, so the next forecast of the same data
+        reports it without refitting, and ``run_complete_forecast`` writes it
+        into the forecast it saved.
+        """
+        self._pending_validation = _background_executor().submit(
+            self.validate_model, holdout_years
+        )
+        return self._pending_validation
+
+    def _holdout_years(self, holdout_years: Optional[int]) -> int:
+        """Requested holdout, shortened when the series is too short."""
+        if holdout_years is None:
+            holdout_years = settings.forecast.validation_holdout_years
+        if len(self.historical_data) < holdout_years + 3:
+            print(
+                f"Warning: Not enough data for {holdout_years}-year holdout validation"
+            )
+            holdout_years = max(1, len(self.historical_data) // 3)
+        return holdout_years
+
+    def _validation_fingerprint(self, holdout_years: int) -> str:
+        """Hash of the series and holdout a validation result depends on."""
+        return series_fingerprint(
+            self.historical_data,
+            self.parameter_name,
+            self.geographic_code,
+            holdout_years,
+        )
+
+    def _validation_mode(self) -> str:
+        """This forecaster's validation mode, defaulting to the settings."""
+        return self.validation_mode or settings.forecast.validation_mode
+
+    def _model_performance(self) -> Dict[str, float]:
+        """Holdout metrics for the forecast, per ``forecast.validation_mode``."""
+        self._pending_validation = None
+        mode = self._validation_mode()
+        if mode not in VALIDATION_MODES:
+            raise ConfigurationError(
+                f"Unknown validation mode '{mode}', expected one of "
+                f"{VALIDATION_MODES}",
+                config_key="forecast.validation_mode",
+            )
+
+        if mode == "eager":
+            validation = self.validate_model()
+        else:
+            validation = self.cached_validation()
+            if validation is None and mode == "background":
+                self.validate_in_background()
+
+        if validation is None:
+            # Not validated yet; metrics are omitted rather than invented
+            return {}
+        return {
+            "mape": validation.mape,
+            "rmse": validation.rmse,
+            "mae": validation.mae,
+        }
+
+    def _interval_accuracy(
+        self,
+        future: pd.DataFrame,
+        lower_bound: List[float],
+        upper_bound: List[float],
+        wait: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Fast intervals compared with Prophet's 1000-sample intervals.
+
+        Checks are cached by data fingerprint. The comparison needs a second,
+        sampled prediction, so unless ``wait`` is set it never runs inline:
+        a cache miss schedules it on the background workers (only in
+        ``background`` validation mode) and returns no metrics until it is
+        cached.
+        """
+        forecast_settings = settings.forecast
+        fingerprint = series_fingerprint(
+            self.historical_data,
+            self.parameter_name,
+            self.geographic_code,
+            "intervals",
+            forecast_settings.interval_mode,
+            forecast_settings.uncertainty_samples,
+            forecast_settings.confidence_interval,
+            len(future),
+        )
+        accuracy = _lookup(_interval_accuracy_cache, fingerprint)
+        if accuracy is None:
+            if wait:
+                accuracy = self._compare_intervals(
+                    fingerprint, future, lower_bound, upper_bound
+                )
+            elif self._validation_mode() == "background":
+                _background_executor().submit(
+                    self._compare_intervals,
+                    fingerprint,
+                    future,
+                    lower_bound,
+                    upper_bound,
+                )
+
+        # Not compared yet; metrics are omitted rather than invented
+        return accuracy or {}
+
+    def _compare_intervals(
+        self,
+        fingerprint: str,
+        future: pd.DataFrame,
+        lower_bound: List[float],
+        upper_bound: List[float],
+    ) -> Dict[str, float]:
+        """Predict baseline intervals for ``future`` and cache the comparison."""
+        baseline_model = copy.copy(self.fitted_model)
+        baseline_model.uncertainty_samples = INTERVAL_BASELINE_SAMPLES
+        baseline = baseline_model.predict(future)
+
+        lower, upper = np.asarray(lower_bound), np.asarray(upper_bound)
+        baseline_lower = baseline["yhat_lower"].to_numpy()
+        baseline_upper = baseline["yhat_upper"].to_numpy()
+        baseline_width = np.mean(baseline_upper - baseline_lower)
+        bound_error = np.abs(lower - baseline_lower) + np.abs(upper - baseline_upper)
+
+        accuracy = {
+            # Mean fast/baseline interval width; 1.0 is identical width
+            "interval_width_ratio": float(np.mean(upper - lower) / baseline_width),
+            # Mean bound displacement, % of the baseline interval width
+            "interval_bound_error": float(
+                np.mean(bound_error) / (2 * baseline_width) * 100
+            ),
+        }
+        _remember(_interval_accuracy_cache, fingerprint, accuracy)
+        return accuracy
+
+    def generate_forecast(
+        self, horizon_years: int = 5, check_intervals: bool = False
+    ) -> ProphetForecastResult:
         """
         Generate forecast with uncertainty intervals.
 
         Args:
             horizon_years: Number of years to forecast
+            check_intervals: Compare fast intervals with Prophet's 1000-sample
+                intervals before returning instead of in the background
 
         Returns:
             ProphetForecastResult with forecasts and metadata
@@ -237,8 +809,14 @@ class ProphetForecaster:
             # Extract forecast values (only the future periods)
             forecast_data = forecast.tail(horizon_years)
             forecast_values = forecast_data["yhat"].tolist()
-            lower_bound = forecast_data["yhat_lower"].tolist()
-            upper_bound = forecast_data["yhat_upper"].tolist()
+            mode = interval_mode()
+            if mode == "analytic" or "yhat_lower" not in forecast_data:
+                lower_bound, upper_bound = analytic_intervals(
+                    self.fitted_model, forecast_data
+                )
+            else:
+                lower_bound = forecast_data["yhat_lower"].tolist()
+                upper_bound = forecast_data["yhat_upper"].tolist()
 
             # Generate forecast dates
             forecast_dates = []
@@ -248,12 +826,19 @@ class ProphetForecaster:
                 forecast_dates.append(f"{next_year}-01-01")
 
             # Model performance metrics
-            validation = self.validate_model()
-            model_performance = {
-                "mape": validation.mape,
-                "rmse": validation.rmse,
-                "mae": validation.mae,
-            }
+            model_performance = self._model_performance()
+            if (
+                mode == "analytic"
+                or settings.forecast.uncertainty_samples < INTERVAL_BASELINE_SAMPLES
+            ):
+                model_performance.update(
+                    self._interval_accuracy(
+                        future.tail(horizon_years),
+                        lower_bound,
+                        upper_bound,
+                        wait=check_intervals,
+                    )
+                )
 
             # Trend information
             trend_info = {
@@ -360,8 +945,10 @@ class ProphetForecaster:
         plt.xticks(rotation=45)
 
         # Add model info
+        mape = forecast_result.model_performance.get("mape")
+        mape_text = f"{mape:.2f}%" if mape is not None else "n/a"
         info_text = (
-            f"MAPE: {forecast_result.model_performance['mape']:.2f}%\\n"
+            f"MAPE: {mape_text}\\n"
             f"Trend: {forecast_result.trend_info['overall_trend']}\\n"
             f"Data Points: {forecast_result.historical_data_points}"
         )
@@ -422,8 +1009,12 @@ class ProphetForecaster:
             print(f"  {date}: {value:.4f}")
 
         print("\nModel Performance:")
-        print(f"  MAPE: {forecast_result.model_performance['mape']:.2f}%")
-        print(f"  RMSE: {forecast_result.model_performance['rmse']:.4f}")
+        performance = forecast_result.model_performance
+        if "mape" in performance:
+            print(f"  MAPE: {performance['mape']:.2f}%")
+            print(f"  RMSE: {performance['rmse']:.4f}")
+        else:
+            print("  Holdout validation not run yet")
         print(f"  Trend: {forecast_result.trend_info['overall_trend']}")
 
         # Step 5: Save forecast to database
@@ -441,6 +1032,12 @@ class ProphetForecaster:
                 historical_data_points=forecast_result.historical_data_points,
             )
             print("Forecast saved to database")
+            invalidate_forecasts(self.geographic_code)
+            if self._pending_validation is not None:
+                # Runs at once if the validation already finished
+                self._pending_validation.add_done_callback(
+                    partial(self._save_validated_performance, forecast_result)
+                )
         except Exception as e:
             print(f"Warning: Failed to save forecast to database: {e}")
 
@@ -459,6 +1056,28 @@ class ProphetForecaster:
 
         return forecast_result
 
+    def _save_validated_performance(
+        self,
+        forecast_result: ProphetForecastResult,
+        validation: "Future[ValidationResult]",
+    ) -> None:
+        """Write a finished background validation into the saved forecast."""
+        try:
+            result = validation.result()
+            db_manager.update_prophet_forecast_performance(
+                parameter_name=self.parameter_name,
+                geographic_code=self.geographic_code,
+                forecast_horizon_years=len(forecast_result.forecast_values),
+                historical_data_points=forecast_result.historical_data_points,
+                model_performance={
+                    "mape": result.mape,
+                    "rmse": result.rmse,
+                    "mae": result.mae,
+                },
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not save holdout validation metrics: {e}")
+
 
 class ProFormaProphetEngine:
     """Main engine for generating Prophet forecasts for all 11 pro forma metrics."""
@@ -484,7 +1103,12 @@ class ProFormaProphetEngine:
         ]
 
     def generate_forecasts_for_msa(
-        self, msa_code: str, horizon_years: int = 5
+        self,
+        msa_code: str,
+        horizon_years: int = 5,
+        parallel: Optional[bool] = None,
+        num_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
     ) -> Dict[str, ProphetForecastResult]:
         """
         Generate Prophet forecasts for all 11 metrics for a specific MSA.
@@ -492,52 +1116,135 @@ class ProFormaProphetEngine:
         Args:
             msa_code: MSA code (e.g., '35620' for NYC)
             horizon_years: Forecast horizon
+            parallel: Fit the metrics concurrently on a process pool
+                (defaults to settings)
+            num_workers: Pool size (defaults to settings, then CPU count)
+            timeout_seconds: Limit for each Stan fit; 0 disables (defaults to
+                settings)
 
         Returns:
             Dictionary mapping metric names to ProphetForecastResult objects
         """
-        forecasts = {}
-        errors = []
+        return self.generate_forecasts_for_msas(
+            [msa_code], horizon_years, parallel, num_workers, timeout_seconds
+        )[msa_code]
+
+    def generate_forecasts_for_msas(
+        self,
+        msa_codes: Sequence[str],
+        horizon_years: int = 5,
+        parallel: Optional[bool] = None,
+        num_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, Dict[str, ProphetForecastResult]]:
+        """
+        Generate Prophet forecasts for all 11 metrics across several MSAs.
+
+        National metrics are fitted once and shared by every MSA. In parallel
+        mode every (metric, geography) fit of the refresh is submitted to one
+        process pool, whose workers validate eagerly in ``background``
+        validation mode: a worker thread would hold up the process and its
+        result would not outlive it. Cached Monte Carlo forecasts of this
+        process are invalidated once the pool has saved its fits. In both modes
+        a Stan fit exceeding the timeout is terminated and recorded as an error
+        for that metric only.
+
+        Args:
+            msa_codes: MSA codes to forecast
+            horizon_years: Forecast horizon
+            parallel: Fit concurrently on a process pool (defaults to settings)
+            num_workers: Pool size (defaults to settings, then CPU count)
+            timeout_seconds: Limit for each Stan fit; 0 disables (defaults to
+                settings)
+
+        Returns:
+            Dictionary mapping MSA codes to their metric forecasts
+        """
+        forecast_settings = settings.forecast
+        if parallel is None:
+            parallel = forecast_settings.parallel_fitting
+        if timeout_seconds is None:
+            timeout_seconds = forecast_settings.fit_timeout_seconds
+
+        tasks: Dict[Tuple[str, str], _ForecastTask] = {}
+        for msa_code in msa_codes:
+            for metric_name in self.metrics_list:
+                geography = self._geography_for(metric_name, msa_code)
+                tasks.setdefault(
+                    (metric_name, geography),
+                    _ForecastTask(
+                        metric_name, geography, horizon_years, timeout_seconds
+                    ),
+                )
 
         print(f"\n{'#'*80}")
-        print(f"GENERATING PROPHET FORECASTS FOR MSA: {msa_code}")
+        print(f"GENERATING PROPHET FORECASTS FOR MSA: {', '.join(msa_codes)}")
         print(f"FORECAST HORIZON: {horizon_years} YEARS")
         print(f"{'#'*80}")
 
-        for metric_name in self.metrics_list:
-            try:
-                # Determine geography for this metric
-                if metric_name in [
-                    "treasury_10y",
-                    "commercial_mortgage_rate",
-                    "fed_funds_rate",
-                ]:
-                    geography = "NATIONAL"
-                else:
-                    geography = msa_code
+        results: Dict[Tuple[str, str], ProphetForecastResult] = {}
+        failures: Dict[Tuple[str, str], str] = {}
 
-                # Create forecaster and run forecast
-                forecaster = ProphetForecaster(metric_name, geography)
-                forecast_result = forecaster.run_complete_forecast(horizon_years)
+        if parallel and len(tasks) > 1:
+            num_workers = min(
+                num_workers or forecast_settings.num_workers or os.cpu_count() or 1,
+                len(tasks),
+            )
+            print(f"Fitting {len(tasks)} models on {num_workers} workers")
+            if forecast_settings.validation_mode == "background":
+                for task in tasks.values():
+                    task.validation_mode = "eager"
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = {
+                    key: executor.submit(_run_forecast_task, task)
+                    for key, task in tasks.items()
+                }
+                for key, future in futures.items():
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        failures[key] = str(e)
+
+            # Workers only cleared their own caches; clear this process's too
+            for geography in {geography for _, geography in results}:
+                invalidate_forecasts(geography)
+        else:
+            for key, task in tasks.items():
+                try:
+                    results[key] = _run_forecast_task(task)
+                except Exception as e:
+                    failures[key] = str(e)
+
+        all_forecasts = {}
+        for msa_code in msa_codes:
+            forecasts = {}
+            errors = []
+            for metric_name in self.metrics_list:
+                key = (metric_name, self._geography_for(metric_name, msa_code))
+                if key in results:
+                    forecasts[metric_name] = results[key]
+                else:
+                    error_msg = f"Failed to forecast {metric_name}: {failures[key]}"
+                    errors.append(error_msg)
+                    print(f"ERROR: {error_msg}")
 
-                forecasts[metric_name] = forecast_result
+            # Summary
+            print(f"\n{'='*80}")
+            print(f"FORECAST SUMMARY FOR MSA {msa_code}")
+            print(f"{'='*80}")
+            print(f"Successful forecasts: {len(forecasts)}/11 metrics")
+            if errors:
+                print(f"Errors: {len(errors)}")
+                for error in errors:
+                    print(f"  - {error}")
 
-            except Exception as e:
-                error_msg = f"Failed to forecast {metric_name}: {str(e)}"
-                errors.append(error_msg)
-                print(f"ERROR: {error_msg}")
+            all_forecasts[msa_code] = forecasts
 
-        # Summary
-        print(f"\n{'='*80}")
-        print(f"FORECAST SUMMARY FOR MSA {msa_code}")
-        print(f"{'='*80}")
-        print(f"Successful forecasts: {len(forecasts)}/11 metrics")
-        if errors:
-            print(f"Errors: {len(errors)}")
-            for error in errors:
-                print(f"  - {error}")
+        return all_forecasts
 
-        return forecasts
+    def _geography_for(self, metric_name: str, msa_code: str) -> str:
+        """Geography a metric is forecast for."""
+        return "NATIONAL" if metric_name in NATIONAL_METRICS else msa_code
 
     def get_forecast_values_for_monte_carlo(
         self, forecasts: Dict[str, ProphetForecastResult], target_year: int = 1
@@ -569,6 +1276,28 @@ class ProFormaProphetEngine:
         return monte_carlo_inputs
 
 
+@dataclass
+class _ForecastTask:
+    """One (metric, geography) forecast, sent to a worker process."""
+
+    parameter_name: str
+    geographic_code: str
+    horizon_years: int
+    timeout_seconds: Optional[float] = None
+    validation_mode: Optional[str] = None
+
+
+def _run_forecast_task(task: _ForecastTask) -> ProphetForecastResult:
+    """Load, fit and forecast one metric (process pool entry point)."""
+    forecaster = ProphetForecaster(
+        task.parameter_name,
+        task.geographic_code,
+        fit_timeout_seconds=task.timeout_seconds,
+        validation_mode=task.validation_mode,
+    )
+    return forecaster.run_complete_forecast(task.horizon_years)
+
+
 def main():
     """Test the Prophet forecasting system."""
 
@@ -0,0 +1,169 @@
+"""
+Forecast Cache
+
+Bounded, TTL-aware LRU cache for the Prophet forecasts loaded by the Monte
+Carlo engine and the sampling factorizations derived from them. Keys start
+with ``"{msa_code}_{horizon_years}"``. Every cache registers itself so the
+data scheduler and forecast writer can invalidate stale entries through
+``invalidate_forecasts`` without holding a reference to the engine, and
+``forecast_cache_stats`` aggregates the counters of one kind of cache for
+the metrics endpoint.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from config.settings import settings
+
+_registry: "weakref.WeakSet[ForecastCache]" = weakref.WeakSet()
+
+
+class ForecastCache:
+    """
+    Thread-safe LRU mapping with per-entry expiry.
+
+    ``max_entries`` bounds the number of entries (least recently used entries
+    are evicted first) and entries older than ``ttl_seconds`` are treated as
+    missing. A ``ttl_seconds`` of 0 or less disables expiry. ``kind`` labels
+    what the cache holds so statistics can be reported per kind.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        kind: str = "forecast",
+    ):
+        mc_settings = settings.monte_carlo
+        self.max_entries = max(
+            1,
+            max_entries if max_entries is not None else mc_settings.forecast_cache_size,
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else mc_settings.forecast_cache_ttl_seconds
+        )
+        self._clock = clock
+        self.kind = kind
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # Dropped to respect max_entries
+        self.expirations = 0  # Dropped because they outlived the TTL
+        self.invalidations = 0  # Dropped by explicit invalidation
+        _registry.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry (marking it most recently used) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self._expired(entry[0]):
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        """Membership check that neither counts as a hit nor refreshes order."""
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore
+            return entry is not None and not self._expired(entry[0])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop every entry, or those whose key matches ``predicate``."""
+        with self._lock:
+            keys = [k for k in self._entries if predicate is None or predicate(k)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and self._clock() - stored_at > self.ttl_seconds
+
+
+def invalidate_forecasts(geographic_code: Optional[str] = None) -> int:
+    """
+    Invalidate cached forecasts in every registered cache.
+
+    National parameters feed every MSA's forecast set, so ``"NATIONAL"`` (or
+    no code) clears all entries; an MSA code clears that MSA's horizons only.
+
+    Returns:
+        Number of entries dropped
+    """
+    if geographic_code is None or geographic_code == "NATIONAL":
+        predicate = None
+    else:
+        prefix = f"{geographic_code}_"
+
+        def predicate(key: Hashable) -> bool:
+            return isinstance(key, str) and key.startswith(prefix)
+
+    return sum(cache.invalidate(predicate) for cache in list(_registry))
+
+
+def forecast_cache_stats(kind: str = "forecast") -> Dict[str, int]:
+    """Counters summed over every registered cache of ``kind``."""
+    totals = {
+        "caches": 0,
+        "size": 0,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 0,
+        "invalidations": 0,
+    }
+    for cache in list(_registry):
+        if cache.kind != kind:
+            continue
+        totals["caches"] += 1
+        for name, value in cache.stats().items():
+            if name in totals:
+                totals[name] += value
+    return totals
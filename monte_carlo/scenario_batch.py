@@ -0,0 +1,262 @@
+"""
+Columnar Scenario Storage
+
+Array-backed container for Monte Carlo scenarios. All sampled parameter paths
+live in one contiguous float64 array and per-scenario summaries are stored as
+columns, so a run allocates a handful of arrays instead of one dict per
+scenario. ``MonteCarloScenario`` objects are only built when a caller indexes
+into the batch.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+from core.exceptions import ValidationError
+
+# Market scenario labels, indexed by the int8 codes stored in a ScenarioBatch
+MARKET_SCENARIO_LABELS: Tuple[str, ...] = (
+    "bull_market",
+    "bear_market",
+    "growth_market",
+    "stress_market",
+    "neutral_market",
+)
+
+# Per-scenario summary columns, in the order exposed on scenario views
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    "avg_cap_rate",
+    "avg_rent_growth",
+    "avg_expense_growth",
+    "avg_vacancy_rate",
+    "avg_property_growth",
+    "avg_treasury_rate",
+    "avg_mortgage_rate",
+    "market_scenario",
+    "rent_growth_volatility",
+    "cap_rate_volatility",
+    "growth_score",
+    "risk_score",
+)
+
+
+@dataclass
+class MonteCarloScenario:
+    """Single Monte Carlo scenario result."""
+
+    scenario_id: int
+    forecasted_parameters: Dict[str, List[float]]  # 5-year forecasts per parameter
+    scenario_summary: Dict[str, Union[float, str]]  # Per-scenario statistics
+    percentile_rank: Optional[float] = None  # Where this scenario ranks (0-100)
+
+
+@dataclass(eq=False)
+class ScenarioBatch(Sequence[MonteCarloScenario]):
+    """
+    Columnar collection of Monte Carlo scenarios.
+
+    ``values`` has shape (scenarios, parameters, years) and is indexed by
+    ``parameter_names``. Indexing returns a freshly built ``MonteCarloScenario``
+    view; mutating a view does not write back into the batch.
+    """
+
+    values: np.ndarray
+    parameter_names: List[str]
+    summaries: Dict[str, np.ndarray] = field(default_factory=dict)
+    market_scenario_codes: Optional[np.ndarray] = None
+    percentile_ranks: Optional[np.ndarray] = None
+    parameter_index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.values = np.ascontiguousarray(self.values, dtype=np.float64)
+        if self.values.ndim != 3:
+            raise ValidationError(
+                "Scenario values must have shape (scenarios, parameters, years), "
+                f"got {self.values.shape}"
+            )
+        if self.values.shape[1] != len(self.parameter_names):
+            raise ValidationError(
+                f"Expected {self.values.shape[1]} parameter names, "
+                f"got {len(self.parameter_names)}"
+            )
+        for name, column in self.summaries.items():
+            if len(column) != self.num_scenarios:
+                raise ValidationError(
+                    f"Summary column '{name}' has {len(column)} rows, "
+                    f"expected {self.num_scenarios}"
+                )
+        self.parameter_index = {
+            name: idx for idx, name in enumerate(self.parameter_names)
+        }
+
+    @classmethod
+    def from_tensor(
+        cls, samples: np.ndarray, parameter_names: List[str]
+    ) -> "ScenarioBatch":
+        """Build a batch from a (scenarios, years, parameters) sample tensor."""
+        return cls(values=samples.transpose(0, 2, 1), parameter_names=parameter_names)
+
+    @classmethod
+    def from_scenarios(
+        cls,
+        scenarios: Sequence[MonteCarloScenario],
+        parameter_names: Optional[List[str]] = None,
+        horizon_years: int = 0,
+    ) -> "ScenarioBatch":
+        """
+        Pack MonteCarloScenario objects into a batch.
+
+        ``parameter_names`` defaults to the first scenario's parameters;
+        ``horizon_years`` only shapes an empty batch.
+        """
+        if parameter_names is None:
+            parameter_names = (
+                list(scenarios[0].forecasted_parameters) if scenarios else []
+            )
+        if not scenarios:
+            return cls(
+                values=np.empty((0, len(parameter_names), horizon_years)),
+                parameter_names=list(parameter_names),
+            )
+
+        values = np.array(
+            [
+                [scenario.forecasted_parameters[name] for name in parameter_names]
+                for scenario in scenarios
+            ],
+            dtype=np.float64,
+        )
+        summaries = {
+            name: np.array(
+                [float(scenario.scenario_summary[name]) for scenario in scenarios]
+            )
+            for name in SUMMARY_FIELDS
+            if name != "market_scenario"
+            and all(name in scenario.scenario_summary for scenario in scenarios)
+        }
+        market_codes = None
+        if all(
+            "market_scenario" in scenario.scenario_summary for scenario in scenarios
+        ):
+            market_codes = np.array(
+                [
+                    MARKET_SCENARIO_LABELS.index(
+                        str(scenario.scenario_summary["market_scenario"])
+                    )
+                    for scenario in scenarios
+                ],
+                dtype=np.int8,
+            )
+        percentile_ranks = None
+        if all(scenario.percentile_rank is not None for scenario in scenarios):
+            percentile_ranks = np.array(
+                [scenario.percentile_rank for scenario in scenarios], dtype=np.float64
+            )
+        return cls(
+            values=values,
+            parameter_names=list(parameter_names),
+            summaries=summaries,
+            market_scenario_codes=market_codes,
+            percentile_ranks=percentile_ranks,
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["ScenarioBatch"]) -> "ScenarioBatch":
+        """Join batches sharing the same parameters along the scenario axis."""
+        first = batches[0]
+        summaries = {
+            name: np.concatenate([batch.summaries[name] for batch in batches])
+            for name in first.summaries
+        }
+        market_codes = None
+        if first.market_scenario_codes is not None:
+            market_codes = np.concatenate(
+                [
+                    batch.market_scenario_codes
+                    for batch in batches
+                    if batch.market_scenario_codes is not None
+                ]
+            )
+        return cls(
+            values=np.concatenate([batch.values for batch in batches]),
+            parameter_names=list(first.parameter_names),
+            summaries=summaries,
+            market_scenario_codes=market_codes,
+        )
+
+    @property
+    def num_scenarios(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def horizon_years(self) -> int:
+        return int(self.values.shape[2])
+
+    def parameter(self, name: str) -> np.ndarray:
+        """All sampled paths for one parameter, shape (scenarios, years)."""
+        paths: np.ndarray = self.values[:, self.parameter_index[name], :]
+        return paths
+
+    def market_scenarios(self) -> np.ndarray:
+        """Market scenario labels for every scenario."""
+        if self.market_scenario_codes is None:
+            return np.full(self.num_scenarios, "neutral_market", dtype=object)
+        labels: np.ndarray = np.asarray(MARKET_SCENARIO_LABELS, dtype=object)[
+            self.market_scenario_codes
+        ]
+        return labels
+
+    def __len__(self) -> int:
+        return self.num_scenarios
+
+    @overload
+    def __getitem__(self, index: int) -> MonteCarloScenario: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[MonteCarloScenario]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[MonteCarloScenario, List[MonteCarloScenario]]:
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(self.num_scenarios))]
+
+        index = int(index)
+        if index < 0:
+            index += self.num_scenarios
+        if not 0 <= index < self.num_scenarios:
+            raise IndexError("scenario index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[MonteCarloScenario]:
+        for i in range(self.num_scenarios):
+            yield self._view(i)
+
+    def _view(self, index: int) -> MonteCarloScenario:
+        """Materialize one scenario as a MonteCarloScenario."""
+        forecasted_parameters = {
+            name: self.values[index, idx].tolist()
+            for idx, name in enumerate(self.parameter_names)
+        }
+
+        scenario_summary: Dict[str, Union[float, str]] = {}
+        for name in SUMMARY_FIELDS:
+            if name == "market_scenario":
+                if self.market_scenario_codes is not None:
+                    scenario_summary[name] = MARKET_SCENARIO_LABELS[
+                        self.market_scenario_codes[index]
+                    ]
+            elif name in self.summaries:
+                scenario_summary[name] = float(self.summaries[name][index])
+
+        percentile_rank = None
+        if self.percentile_ranks is not None:
+            percentile_rank = float(self.percentile_ranks[index])
+
+        return MonteCarloScenario(
+            scenario_id=index,
+            forecasted_parameters=forecasted_parameters,
+            scenario_summary=scenario_summary,
+            percentile_rank=percentile_rank,
+        )
@@ -0,0 +1,173 @@
+"""
+Scenario Store
+
+Columnar on-disk persistence for Monte Carlo scenario batches. Each simulation
+is a directory under ``settings.monte_carlo.scenario_store_path`` holding one
+uncompressed ``.npy`` file per column (the scenario tensor, market scenario
+codes, percentile ranks and every summary column) plus a ``metadata.json``
+with run-level statistics. Uncompressed ``.npy`` files can be memory-mapped,
+so reloading a past run reads only its header until columns are touched.
+"""
+
+import json
+import re
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from config.settings import settings
+from core.exceptions import DataNotFoundError, ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
+
+METADATA_FILE = "metadata.json"
+VALUES_FILE = "values.npy"
+MARKET_CODES_FILE = "market_scenario_codes.npy"
+PERCENTILE_RANKS_FILE = "percentile_ranks.npy"
+SUMMARY_PREFIX = "summary_"
+ARRAY_PREFIX = "array_"
+
+# Simulation ids become directory names
+_SIMULATION_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+class ScenarioStore:
+    """
+    Saves and memory-maps scenario batches keyed by simulation id.
+
+    ``arrays`` passed to ``save`` are extra run-level arrays (for example the
+    correlation matrix) stored next to the batch and returned by ``load``.
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        if root is None:
+            root = settings.monte_carlo.scenario_store_path or settings.get_data_path(
+                "simulations"
+            )
+        self.root = Path(root)
+
+    def path_for(self, simulation_id: str) -> Path:
+        """Directory holding one simulation's columns."""
+        if not _SIMULATION_ID_PATTERN.match(simulation_id):
+            raise ValidationError(
+                f"Invalid simulation id '{simulation_id}'",
+                field_name="simulation_id",
+                field_value=simulation_id,
+            )
+        return self.root / simulation_id
+
+    def exists(self, simulation_id: str) -> bool:
+        return (self.path_for(simulation_id) / METADATA_FILE).exists()
+
+    def list_simulations(self) -> List[str]:
+        """Ids of every stored simulation, sorted."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            path.name for path in self.root.iterdir() if (path / METADATA_FILE).exists()
+        )
+
+    def save(
+        self,
+        simulation_id: str,
+        batch: ScenarioBatch,
+        metadata: Optional[Dict[str, Any]] = None,
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Path:
+        """
+        Write a batch and its metadata, replacing any previous run with the id.
+
+        Columns are written to a temporary sibling directory that is renamed
+        into place, so readers never see a partially written simulation.
+        """
+        target = self.path_for(simulation_id)
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{simulation_id}.{uuid.uuid4().hex}.tmp"
+        staging.mkdir()
+
+        try:
+            np.save(staging / VALUES_FILE, batch.values)
+            if batch.market_scenario_codes is not None:
+                np.save(staging / MARKET_CODES_FILE, batch.market_scenario_codes)
+            if batch.percentile_ranks is not None:
+                np.save(staging / PERCENTILE_RANKS_FILE, batch.percentile_ranks)
+            for name, column in batch.summaries.items():
+                np.save(staging / f"{SUMMARY_PREFIX}{name}.npy", column)
+            for name, array in (arrays or {}).items():
+                np.save(staging / f"{ARRAY_PREFIX}{name}.npy", np.asarray(array))
+
+            document = {
+                "simulation_id": simulation_id,
+                "parameter_names": list(batch.parameter_names),
+                "num_scenarios": batch.num_scenarios,
+                "horizon_years": batch.horizon_years,
+                "summary_columns": list(batch.summaries),
+                "arrays": list(arrays or {}),
+                "metadata": metadata or {},
+            }
+            (staging / METADATA_FILE).write_text(json.dumps(document, default=str))
+
+            if target.exists():
+                shutil.rmtree(target)
+            staging.rename(target)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        return target
+
+    def load(
+        self, simulation_id: str, mmap: bool = True
+    ) -> Tuple[ScenarioBatch, Dict[str, Any], Dict[str, np.ndarray]]:
+        """
+        Reload a stored simulation.
+
+        Args:
+            simulation_id: Id the simulation was saved under
+            mmap: Memory-map the columns read-only instead of reading them
+
+        Returns:
+            (batch, metadata, arrays) as passed to ``save``
+
+        Raises:
+            DataNotFoundError: If no simulation is stored under the id
+        """
+        path = self.path_for(simulation_id)
+        if not (path / METADATA_FILE).exists():
+            raise DataNotFoundError(
+                f"No stored scenarios for simulation '{simulation_id}'"
+            )
+
+        document = json.loads((path / METADATA_FILE).read_text())
+        mmap_mode = "r" if mmap else None
+
+        def column(filename: str) -> Optional[np.ndarray]:
+            file_path = path / filename
+            if not file_path.exists():
+                return None
+            return np.load(file_path, mmap_mode=mmap_mode)  # type: ignore
+
+        batch = ScenarioBatch(
+            values=column(VALUES_FILE),  # type: ignore
+            parameter_names=document["parameter_names"],
+            summaries={
+                name: column(f"{SUMMARY_PREFIX}{name}.npy")  # type: ignore
+                for name in document["summary_columns"]
+            },
+            market_scenario_codes=column(MARKET_CODES_FILE),
+            percentile_ranks=column(PERCENTILE_RANKS_FILE),
+        )
+        arrays = {
+            name: column(f"{ARRAY_PREFIX}{name}.npy") for name in document["arrays"]
+        }
+        return batch, document["metadata"], arrays  # type: ignore
+
+    def delete(self, simulation_id: str) -> bool:
+        """Remove a stored simulation; returns whether one existed."""
+        path = self.path_for(simulation_id)
+        if not path.exists():
+            return False
+        shutil.rmtree(path)
+        return True
@@ -0,0 +1,143 @@
+"""
+Scenario Shocks
+
+Deterministic stress overlays on an existing scenario batch. A shock shifts
+one parameter's sampled paths, either additively (``+0.015`` for a +150bp
+treasury move) or multiplicatively (``1.10`` for a 10% higher cap rate),
+optionally for selected forecast years only. With correlation propagation the
+other parameters move by their conditional expectation given the shocked
+ones, so a rate shock also lifts correlated cap rates and mortgage rates
+without re-sampling the run.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.exceptions import ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
+
+SHOCK_MODES = ("additive", "multiplicative")
+
+
+@dataclass
+class ScenarioShock:
+    """Shift applied to one parameter of every scenario."""
+
+    parameter: str
+    shift: float  # Added to the paths, or the multiplier in multiplicative mode
+    mode: str = "additive"  # "additive" or "multiplicative"
+    years: Optional[List[int]] = None  # Forecast year indices; None shocks all
+
+    def __post_init__(self) -> None:
+        if self.mode not in SHOCK_MODES:
+            raise ValidationError(
+                f"Unknown shock mode '{self.mode}', expected one of {SHOCK_MODES}",
+                field_name="mode",
+                field_value=self.mode,
+            )
+
+
+def shock_scenarios(
+    batch: ScenarioBatch,
+    shocks: Sequence[ScenarioShock],
+    correlation_matrix: Optional[np.ndarray] = None,
+    parameter_names: Optional[List[str]] = None,
+    propagate: bool = False,
+) -> ScenarioBatch:
+    """
+    Apply shocks to a copy of a batch's parameter paths.
+
+    Propagation converts each scenario's shifts into standard deviations of the
+    shocked parameters (per forecast year, across scenarios) and moves every
+    unshocked parameter by its conditional expectation given them,
+    ``Sigma_ts Sigma_ss^-1 z``, in its own standard deviations. Parameters that
+    are shocked explicitly only receive their own shocks.
+
+    Args:
+        batch: Scenarios to shock; left unchanged
+        shocks: Shocks to apply, combined in order
+        correlation_matrix: Parameter correlations used for propagation;
+            estimated from the batch's horizon-average paths when omitted
+        parameter_names: Order of ``correlation_matrix`` (defaults to the
+            batch's parameter order)
+        propagate: Move unshocked parameters through the correlations
+
+    Returns:
+        New ScenarioBatch holding only the shocked values; summaries and
+        classifications must be recomputed by the caller
+
+    Raises:
+        ValidationError: If a shock names an unknown parameter or year
+    """
+    values = np.array(batch.values, dtype=np.float64)
+    deltas: Dict[str, np.ndarray] = {}
+
+    for shock in shocks:
+        if shock.parameter not in batch.parameter_index:
+            raise ValidationError(
+                f"Cannot shock unknown parameter '{shock.parameter}'",
+                field_name="parameter",
+                field_value=shock.parameter,
+            )
+        years = np.arange(batch.horizon_years)
+        if shock.years is not None:
+            years = np.asarray(shock.years, dtype=int)
+            if years.size and (years.min() < 0 or years.max() >= batch.horizon_years):
+                raise ValidationError(
+                    f"Shock years {shock.years} outside the "
+                    f"{batch.horizon_years}-year horizon",
+                    field_name="years",
+                    field_value=shock.years,
+                )
+
+        index = batch.parameter_index[shock.parameter]
+        paths = values[:, index, :]
+        delta = np.zeros_like(paths)
+        if shock.mode == "additive":
+            delta[:, years] = shock.shift
+        else:
+            delta[:, years] = paths[:, years] * (shock.shift - 1.0)
+        paths += delta
+        deltas[shock.parameter] = deltas.get(shock.parameter, 0.0) + delta
+
+    if propagate and deltas:
+        names = parameter_names or batch.parameter_names
+        if correlation_matrix is None:
+            names = batch.parameter_names
+            correlation_matrix = np.atleast_2d(np.corrcoef(batch.values.mean(axis=2).T))
+        position = {name: i for i, name in enumerate(names)}
+        std = batch.values.std(axis=0)  # (parameters, years), pre-shock spread
+
+        sources = [name for name in deltas if name in position]
+        targets = [
+            name
+            for name in batch.parameter_names
+            if name not in deltas and name in position
+        ]
+        if sources and targets:
+            corr = np.nan_to_num(np.asarray(correlation_matrix, dtype=np.float64))
+            source_pos = [position[name] for name in sources]
+            target_pos = [position[name] for name in targets]
+            # Regression weights Sigma_ss^-1 Sigma_st; lstsq tolerates a
+            # singular block when shocked parameters are perfectly correlated
+            weights = np.linalg.lstsq(
+                corr[np.ix_(source_pos, source_pos)],
+                corr[np.ix_(source_pos, target_pos)],
+                rcond=None,
+            )[0]
+
+            source_std = np.stack([std[batch.parameter_index[n]] for n in sources])
+            z_shift = np.divide(
+                np.stack([deltas[n] for n in sources], axis=1),
+                source_std,
+                out=np.zeros((values.shape[0], len(sources), batch.horizon_years)),
+                where=source_std > 0,
+            )
+            target_index = [batch.parameter_index[n] for n in targets]
+            values[:, target_index, :] += (
+                np.einsum("nsy,st->nty", z_shift, weights) * std[target_index]
+            )
+
+    return ScenarioBatch(values=values, parameter_names=list(batch.parameter_names))
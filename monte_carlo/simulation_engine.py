@@ -5,29 +5,96 @@ Integrates Prophet forecasts with property-specific inputs to generate
 probabilistic scenarios for real estate investment analysis.
 """
 
+import hashlib
 import json
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from scipy.stats import multivariate_normal, norm
+from scipy.stats import multivariate_normal, norm, qmc
 
 from config.settings import settings
-from core.exceptions import DataNotFoundError, MonteCarloError
+from core.exceptions import DataNotFoundError, MonteCarloError, ValidationError
 from core.logging_config import get_logger
 from data.databases.database_manager import db_manager
+from monte_carlo.forecast_cache import ForecastCache
+from monte_carlo.scenario_batch import (
+    MARKET_SCENARIO_LABELS,
+    MonteCarloScenario,
+    ScenarioBatch,
+)
+from monte_carlo.scenario_store import ScenarioStore
+from monte_carlo.shocks import ScenarioShock, shock_scenarios
+from monte_carlo.statistics import StreamingSummary
 from src.domain.entities.property_data import SimplifiedPropertyInput
 
-
-@dataclass
-class MonteCarloScenario:
-    """Single Monte Carlo scenario result."""
-
-    scenario_id: int
-    forecasted_parameters: Dict[str, List[float]]  # 5-year forecasts per parameter
-    scenario_summary: Dict[str, Union[float, str]]  # Summary statistics for this scenario
-    percentile_rank: Optional[float] = None  # Where this scenario ranks (0-100)
+# Standard normal generators available to the vectorized sampler
+SAMPLERS = ("pseudo_random", "sobol", "latin_hypercube")
+
+# Correlation rules based on economic theory. A pair listed in both orders
+# sets each side of the matrix separately, looked up as (row, column) first.
+CORRELATION_RULES: Dict[Tuple[str, str], float] = {
+    # Interest rate correlations (strong positive)
+    ("treasury_10y", "commercial_mortgage_rate"): 0.85,
+    ("treasury_10y", "fed_funds_rate"): 0.75,
+    ("commercial_mortgage_rate", "fed_funds_rate"): 0.70,
+    # Growth correlations (moderate positive)
+    ("rent_growth", "property_growth"): 0.60,
+    ("rent_growth", "expense_growth"): 0.40,
+    ("property_growth", "expense_growth"): 0.35,
+    # Market condition correlations
+    ("cap_rate", "vacancy_rate"): 0.45,  # Both reflect market stress
+    ("cap_rate", "treasury_10y"): 0.55,  # Cap rates track interest rates
+    (
+        "vacancy_rate",
+        "rent_growth",
+    ): -0.40,  # High vacancy suppresses rent growth
+    # Lending requirement correlations
+    (
+        "ltv_ratio",
+        "closing_cost_pct",
+    ): -0.25,  # Stricter lending = higher costs
+    (
+        "ltv_ratio",
+        "lender_reserves",
+    ): -0.35,  # Conservative lending relationship
+    ("closing_cost_pct", "lender_reserves"): 0.30,
+    # Economic cycle correlations
+    ("treasury_10y", "cap_rate"): 0.65,  # Both driven by risk appetite
+    ("fed_funds_rate", "vacancy_rate"): 0.25,  # Economic policy effects
+    ("property_growth", "cap_rate"): -0.30,  # Inverse relationship
+}
+
+DEFAULT_CORRELATION = 0.05  # Unspecified pairs
+
+
+def resolve_seed(
+    seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]],
+) -> np.random.SeedSequence:
+    """
+    Normalize a seed argument to a run's root SeedSequence.
+
+    ``None`` falls back to ``settings.monte_carlo.seed`` and, if that is unset,
+    fresh OS entropy. A Generator contributes one integer draw as the root
+    entropy, so the recorded seed still replays the run without it.
+    """
+    if seed is None:
+        seed = settings.monte_carlo.seed
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(int(seed.integers(2**63)))
+    return np.random.SeedSequence(seed)
+
+
+def _decode_array(payload: str) -> np.ndarray:
+    """Decode a JSON array of numbers into a float64 array."""
+    return np.asarray(json.loads(payload), dtype=np.float64)
 
 
 @dataclass
@@ -39,13 +106,51 @@ class MonteCarloResults:
     simulation_date: date
     num_scenarios: int
     horizon_years: int
-    scenarios: List[MonteCarloScenario]
+    scenarios: ScenarioBatch  # Scenario lists are packed into a batch
     summary_statistics: Dict[
         str, Dict[str, float]
     ]  # Per parameter: {mean, std, p5, p95, etc.}
     correlation_matrix: Optional[np.ndarray] = None
     parameter_names: Optional[List[str]] = None  # For correlation matrix reference
-    extreme_scenarios: Optional[Dict[str, MonteCarloScenario]] = None  # Best/worst case scenarios
+    extreme_scenarios: Optional[Dict[str, MonteCarloScenario]] = (
+        None  # Best/worst case scenarios
+    )
+    seed: Optional[int] = None  # Root seed entropy; passing it back reproduces the run
+    # Per score: estimate, standard_error, effective_sample_size
+    precision: Optional[Dict[str, Dict[str, float]]] = None
+    convergence: Optional[Dict[str, Any]] = None  # Adaptive runs: stopping details
+
+    def __post_init__(self) -> None:
+        scenarios: Sequence[MonteCarloScenario] = self.scenarios
+        if not isinstance(scenarios, ScenarioBatch):
+            self.scenarios = ScenarioBatch.from_scenarios(
+                scenarios, self.parameter_names, self.horizon_years
+            )
+
+
+@dataclass
+class SamplerConvergenceReport:
+    """Percentile estimator precision of a sampler versus pseudo-random draws."""
+
+    sampler: str
+    baseline_sampler: str
+    sample_sizes: List[int]
+    replications: int
+    # sampler -> metric -> "p5" -> standard error per sample size
+    standard_errors: Dict[str, Dict[str, Dict[str, List[float]]]]
+    # metric -> "p5" -> baseline variance / sampler variance per sample size
+    variance_reduction: Dict[str, Dict[str, List[float]]]
+
+
+@dataclass
+class SamplingFactorization:
+    """Sampling setup derived from one version of an MSA's forecasts."""
+
+    param_names: List[str]
+    param_stats: Dict[str, Dict[str, np.ndarray]]  # Per-year mean and std
+    correlation_matrix: Optional[np.ndarray] = None  # Positive definite repair
+    year_covariances: Optional[np.ndarray] = None  # (years, params, params)
+    year_factors: Optional[np.ndarray] = None  # Cholesky factors of the above
 
 
 class MonteCarloEngine:
@@ -53,7 +158,12 @@ class MonteCarloEngine:
 
     def __init__(self) -> None:
         self.logger = get_logger(__name__)
-        self.cached_forecasts: Dict[str, Dict] = {}
+        # Bounded LRU with TTL; invalidated via invalidate_forecasts()
+        self.cached_forecasts = ForecastCache()
+        # "{msa_code}_{horizon_years}_{mode}" -> (fingerprint, setup); same
+        # bound and invalidation as the forecasts, no TTL (fingerprint checked);
+        # kept out of the forecast cache metrics
+        self.factorization_cache = ForecastCache(ttl_seconds=0, kind="factorization")
 
     def load_forecasts_for_msa(
         self, msa_code: str, horizon_years: int = 5
@@ -69,8 +179,9 @@ class MonteCarloEngine:
             Dictionary of forecasts by parameter name
         """
         cache_key = f"{msa_code}_{horizon_years}"
-        if cache_key in self.cached_forecasts:
-            return self.cached_forecasts[cache_key]
+        cached = self.cached_forecasts.get(cache_key)
+        if cached is not None:
+            return cached  # type: ignore
 
         try:
             forecasts = {}
@@ -92,16 +203,19 @@ class MonteCarloEngine:
                 ("property_growth", msa_code),
             ]
 
+            # All pairs in one query; arrays are decoded straight to NumPy
+            rows = db_manager.get_cached_prophet_forecasts(
+                parameters, horizon_years, max_age_days=30
+            )
+
             for param_name, geo_code in parameters:
-                forecast_data = db_manager.get_cached_prophet_forecast(
-                    param_name, geo_code, horizon_years, max_age_days=30
-                )
+                forecast_data = rows.get((param_name, geo_code))
 
                 if forecast_data:
                     forecasts[param_name] = {
-                        "values": json.loads(forecast_data["forecast_values"]),
-                        "lower_bound": json.loads(forecast_data["lower_bound"]),
-                        "upper_bound": json.loads(forecast_data["upper_bound"]),
+                        "values": _decode_array(forecast_data["forecast_values"]),
+                        "lower_bound": _decode_array(forecast_data["lower_bound"]),
+                        "upper_bound": _decode_array(forecast_data["upper_bound"]),
                         "dates": json.loads(forecast_data["forecast_dates"]),
                         "performance": json.loads(forecast_data["model_performance"]),
                         "trend_info": json.loads(forecast_data["trend_info"]),
@@ -146,55 +260,21 @@ class MonteCarloEngine:
             # Create correlation matrix with realistic economic relationships
             correlation_matrix = np.eye(n_params)
 
-            # Define correlation rules based on economic theory
-            correlation_rules = {
-                # Interest rate correlations (strong positive)
-                ("treasury_10y", "commercial_mortgage_rate"): 0.85,
-                ("treasury_10y", "fed_funds_rate"): 0.75,
-                ("commercial_mortgage_rate", "fed_funds_rate"): 0.70,
-                # Growth correlations (moderate positive)
-                ("rent_growth", "property_growth"): 0.60,
-                ("rent_growth", "expense_growth"): 0.40,
-                ("property_growth", "expense_growth"): 0.35,
-                # Market condition correlations
-                ("cap_rate", "vacancy_rate"): 0.45,  # Both reflect market stress
-                ("cap_rate", "treasury_10y"): 0.55,  # Cap rates track interest rates
-                (
-                    "vacancy_rate",
-                    "rent_growth",
-                ): -0.40,  # High vacancy suppresses rent growth
-                # Lending requirement correlations
-                (
-                    "ltv_ratio",
-                    "closing_cost_pct",
-                ): -0.25,  # Stricter lending = higher costs
-                (
-                    "ltv_ratio",
-                    "lender_reserves",
-                ): -0.35,  # Conservative lending relationship
-                ("closing_cost_pct", "lender_reserves"): 0.30,
-                # Economic cycle correlations
-                ("treasury_10y", "cap_rate"): 0.65,  # Both driven by risk appetite
-                ("fed_funds_rate", "vacancy_rate"): 0.25,  # Economic policy effects
-                ("property_growth", "cap_rate"): -0.30,  # Inverse relationship
-            }
+            # Default small positive correlation for unspecified pairs
+            correlation_matrix[~np.eye(n_params, dtype=bool)] = DEFAULT_CORRELATION
 
-            # Apply correlation rules
-            for i, param1 in enumerate(param_names):
-                for j, param2 in enumerate(param_names):
-                    if i != j:
-                        # Check both directions for correlation rules
-                        correlation = None
-                        if (param1, param2) in correlation_rules:
-                            correlation = correlation_rules[(param1, param2)]
-                        elif (param2, param1) in correlation_rules:
-                            correlation = correlation_rules[(param2, param1)]
-
-                        if correlation is not None:
-                            correlation_matrix[i, j] = correlation
-                        else:
-                            # Default small positive correlation for unspecified pairs
-                            correlation_matrix[i, j] = 0.05
+            # Apply correlation rules: mirrored lookups first, so a rule stated
+            # in the (row, column) order wins for its own side of the matrix
+            index = {name: idx for idx, name in enumerate(param_names)}
+            rules = [
+                (index[param1], index[param2], correlation)
+                for (param1, param2), correlation in CORRELATION_RULES.items()
+                if param1 in index and param2 in index and param1 != param2
+            ]
+            if rules:
+                rows, cols, values = map(np.array, zip(*rules))
+                correlation_matrix[cols, rows] = values
+                correlation_matrix[rows, cols] = values
 
             # Ensure positive definite matrix
             correlation_matrix = self._make_positive_definite(correlation_matrix)
@@ -207,6 +287,77 @@ class MonteCarloEngine:
             param_names = list(forecasts.keys())
             return np.eye(len(param_names)), param_names
 
+    def get_sampling_factorization(
+        self,
+        msa_code: str,
+        horizon_years: int,
+        forecasts: Dict[str, Dict],
+        use_correlations: bool = True,
+    ) -> SamplingFactorization:
+        """
+        Return the cached sampling setup for an MSA, horizon and forecast version.
+
+        The correlation matrix, its positive definite repair, the per-year
+        covariance matrices and their Cholesky factors only depend on the
+        forecasts, so they are computed once per forecast fingerprint. A new
+        forecast version for the same MSA and horizon replaces the old entry.
+        """
+        mode = "correlated" if use_correlations else "independent"
+        cache_key = f"{msa_code}_{horizon_years}_{mode}"
+        fingerprint = self._forecast_fingerprint(forecasts)
+        cached = self.factorization_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        param_stats = self._forecast_parameter_stats(forecasts)
+        if not use_correlations:
+            factorization = SamplingFactorization(
+                param_names=list(forecasts.keys()), param_stats=param_stats
+            )
+        else:
+            correlation_matrix, param_names = self.estimate_correlation_matrix(
+                forecasts
+            )
+            stds = np.column_stack(
+                [param_stats[name]["std"][:horizon_years] for name in param_names]
+            )
+            factorization = SamplingFactorization(
+                param_names=param_names,
+                param_stats=param_stats,
+                correlation_matrix=correlation_matrix,
+                year_covariances=(
+                    stds[:, :, np.newaxis]
+                    * correlation_matrix[np.newaxis, :, :]
+                    * stds[:, np.newaxis, :]
+                ),
+                year_factors=self._year_cholesky_factors(stds, correlation_matrix),
+            )
+
+        self.factorization_cache[cache_key] = (fingerprint, factorization)
+        return factorization
+
+    def _forecast_fingerprint(self, forecasts: Dict[str, Dict]) -> str:
+        """Hash of the forecast values and bounds that drive sampling."""
+        digest = hashlib.sha256()
+        for name in sorted(forecasts):
+            digest.update(name.encode())
+            for key in ("values", "lower_bound", "upper_bound"):
+                digest.update(np.asarray(forecasts[name][key], dtype=float).tobytes())
+        return digest.hexdigest()
+
+    def _year_cholesky_factors(
+        self, stds: np.ndarray, correlation_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Per-year Cholesky factors of ``D_y C D_y``, shape (years, params, params).
+
+        The factor is ``D_y L`` with ``L`` the factor of the correlation matrix,
+        so one factorization serves every year and stays well defined when a
+        parameter has zero forecast spread.
+        """
+        correlation_factor = np.linalg.cholesky(correlation_matrix)
+        return stds[:, :, np.newaxis] * correlation_factor[np.newaxis, :, :]  # type: ignore
+
     def _make_positive_definite(self, matrix: np.ndarray) -> np.ndarray:
         """Ensure matrix is positive definite for multivariate normal sampling."""
         eigenvals, eigenvecs = np.linalg.eigh(matrix)
@@ -220,6 +371,12 @@ class MonteCarloEngine:
         num_scenarios: Optional[int] = None,
         horizon_years: int = 5,
         use_correlations: bool = True,
+        vectorized: Optional[bool] = None,
+        parallel: Optional[bool] = None,
+        seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None,
+        sampler: Optional[str] = None,
+        antithetic: Optional[bool] = None,
+        control_variates: Optional[bool] = None,
     ) -> MonteCarloResults:
         """
         Generate Monte Carlo scenarios for a property.
@@ -229,12 +386,35 @@ class MonteCarloEngine:
             num_scenarios: Number of scenarios to generate
             horizon_years: Forecast horizon in years
             use_correlations: Whether to model parameter correlations
+            vectorized: Draw all scenarios as a single NumPy tensor instead of
+                sampling scenario by scenario (defaults to settings)
+            parallel: Split scenarios into fixed-size shards run on a process
+                pool (defaults to settings)
+            seed: Integer seed, SeedSequence or Generator driving every draw.
+                ``None`` uses ``settings.monte_carlo.seed``, or fresh OS
+                entropy if that is unset; the resolved seed is recorded in
+                ``MonteCarloResults.seed`` either way.
+            sampler: ``"pseudo_random"``, ``"sobol"`` (scrambled) or
+                ``"latin_hypercube"`` (defaults to settings). Quasi-random
+                samplers always use the vectorized path.
+            antithetic: Pair every draw with its mirror image (defaults to
+                settings); forces the vectorized path
+            control_variates: Correct score estimates using the known forecast
+                means as control variates (defaults to settings)
 
         Returns:
             MonteCarloResults with all scenarios and statistics
         """
         if num_scenarios is None:
             num_scenarios = settings.monte_carlo.default_num_simulations
+        if vectorized is None:
+            vectorized = settings.monte_carlo.vectorized
+        if parallel is None:
+            parallel = settings.monte_carlo.parallel
+        sampler, antithetic, control_variates = self._resolve_sampling_options(
+            sampler, antithetic, control_variates
+        )
+        vectorized = vectorized or sampler != "pseudo_random" or antithetic
 
         try:
             self.logger.info(
@@ -242,173 +422,863 @@ class MonteCarloEngine:
                 f"{property_data.property_id}"
             )
 
-            # Load forecasts for the property's MSA
-            msa_code = property_data.get_msa_code()
-            forecasts = self.load_forecasts_for_msa(msa_code, horizon_years)
+            msa_code, factorization = self._prepare_sampling_inputs(
+                property_data, horizon_years, use_correlations
+            )
+            param_names = factorization.param_names
+            param_stats = factorization.param_stats
 
-            # Estimate correlation matrix
-            correlation_matrix = None
-            param_names = list(forecasts.keys())
-            if use_correlations:
-                correlation_matrix, param_names = self.estimate_correlation_matrix(
-                    forecasts
+            # Generate scenarios
+            seed_sequence = self._resolve_seed(seed)
+            accumulators = None
+            if parallel:
+                scenarios, accumulators = self._generate_sharded(
+                    param_names,
+                    param_stats,
+                    num_scenarios,
+                    horizon_years,
+                    factorization.correlation_matrix,
+                    seed_sequence,
+                    sampler=sampler,
+                    antithetic=antithetic,
+                    year_factors=factorization.year_factors,
+                )
+            elif vectorized:
+                samples = self._sample_scenario_tensor(
+                    param_names,
+                    param_stats,
+                    num_scenarios,
+                    horizon_years,
+                    factorization.correlation_matrix,
+                    np.random.default_rng(seed_sequence),
+                    sampler,
+                    antithetic,
+                    year_factors=factorization.year_factors,
+                )
+                scenarios = ScenarioBatch.from_tensor(samples, param_names)
+            else:
+                rng = np.random.default_rng(seed_sequence)
+                sampled = [
+                    self._sample_scenario_legacy(
+                        param_names,
+                        param_stats,
+                        horizon_years,
+                        factorization.correlation_matrix,
+                        rng,
+                        year_covariances=factorization.year_covariances,
+                    )
+                    for _ in range(num_scenarios)
+                ]
+                scenarios = ScenarioBatch(
+                    values=np.array(
+                        [[params[name] for name in param_names] for params in sampled]
+                    ),
+                    parameter_names=param_names,
                 )
 
-            # Generate scenarios
-            scenarios = []
+            if not parallel:
+                self._summarize_scenarios(scenarios)
 
-            # Pre-compute means and standard deviations for each parameter
-            param_stats = {}
-            for param_name, forecast_data in forecasts.items():
-                values = np.array(forecast_data["values"])
-                lower = np.array(forecast_data["lower_bound"])
-                upper = np.array(forecast_data["upper_bound"])
+            results = self._build_results(
+                property_data,
+                msa_code,
+                horizon_years,
+                scenarios,
+                param_names,
+                param_stats,
+                factorization.correlation_matrix,
+                seed_sequence,
+                accumulators=accumulators,
+                antithetic=antithetic,
+                control_variates=control_variates,
+            )
 
-                # Estimate standard deviation from confidence intervals
-                std_dev = (upper - lower) / (2 * 1.96)  # 95% CI assumption
+            self.logger.info(f"Generated {num_scenarios} scenarios successfully")
+            return results
 
-                param_stats[param_name] = {"mean": values, "std": std_dev}
+        except Exception as e:
+            raise MonteCarloError(f"Failed to generate scenarios: {e}") from e
 
-            for scenario_id in range(num_scenarios):
-                scenario_params: Dict[str, List[float]] = {}
+    def generate_scenarios_adaptive(
+        self,
+        property_data: SimplifiedPropertyInput,
+        tolerance: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_scenarios: Optional[int] = None,
+        horizon_years: int = 5,
+        use_correlations: bool = True,
+        seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None,
+        sampler: Optional[str] = None,
+        antithetic: Optional[bool] = None,
+        control_variates: Optional[bool] = None,
+    ) -> MonteCarloResults:
+        """
+        Generate scenarios in batches until key percentiles have converged.
 
-                if use_correlations and correlation_matrix is not None:
-                    # Generate correlated samples for each year
-                    for year_idx in range(horizon_years):
-                        means = [
-                            param_stats[param]["mean"][year_idx]
-                            for param in param_names
-                        ]
-                        stds = [
-                            param_stats[param]["std"][year_idx] for param in param_names
-                        ]
+        After each batch the p5/p95 of the scenario-level cap rate, rent growth
+        and growth score are estimated per batch, and the batch-means standard
+        error of those estimates is divided by the metric's standard deviation.
+        Sampling stops once every relative standard error is within
+        ``tolerance`` (after a minimum number of batches) or ``max_scenarios``
+        is reached.
 
-                        # Create covariance matrix from correlation and standard
-                        # deviations
-                        cov_matrix = np.outer(stds, stds) * correlation_matrix
+        Args:
+            property_data: Property-specific input data
+            tolerance: Relative standard error target (defaults to settings)
+            batch_size: Scenarios per batch (defaults to settings)
+            max_scenarios: Hard cap on scenarios (defaults to settings)
+            horizon_years: Forecast horizon in years
+            use_correlations: Whether to model parameter correlations
+            seed: Seed for the batch streams, as in ``generate_scenarios``
+            sampler: Sampler name, as in ``generate_scenarios``
+            antithetic: Mirror draws within each batch
+            control_variates: Apply control variates to score estimates
 
-                        # Sample from multivariate normal
-                        samples = multivariate_normal.rvs(mean=means, cov=cov_matrix)
+        Returns:
+            MonteCarloResults whose ``num_scenarios`` is the count actually
+            generated and whose ``convergence`` describes the stopping point
+        """
+        mc_settings = settings.monte_carlo
+        tolerance = mc_settings.adaptive_tolerance if tolerance is None else tolerance
+        batch_size = batch_size or mc_settings.adaptive_batch_size
+        max_scenarios = max_scenarios or mc_settings.adaptive_max_scenarios
+        min_batches = max(2, mc_settings.adaptive_min_batches)
+        sampler, antithetic, control_variates = self._resolve_sampling_options(
+            sampler, antithetic, control_variates
+        )
+        if antithetic:
+            batch_size += batch_size % 2  # Keep mirrored pairs inside one batch
 
-                        # Store samples for each parameter
-                        for param_idx, param_name in enumerate(param_names):
-                            if param_name not in scenario_params:
-                                scenario_params[param_name] = []
-                            scenario_params[param_name].append(samples[param_idx])
-                else:
-                    # Generate independent samples
-                    for param_name in param_names:
-                        means = param_stats[param_name]["mean"]
-                        stds = param_stats[param_name]["std"]
-                        samples = norm.rvs(loc=means, scale=stds)
-                        scenario_params[param_name] = samples.tolist()
-
-                # Create comprehensive scenario summary
-                scenario_summary = {
-                    # Key market indicators (5-year averages)
-                    "avg_cap_rate": np.mean(scenario_params.get("cap_rate", [0])),
-                    "avg_rent_growth": np.mean(scenario_params.get("rent_growth", [0])),
-                    "avg_expense_growth": np.mean(
-                        scenario_params.get("expense_growth", [0])
-                    ),
-                    "avg_vacancy_rate": np.mean(
-                        scenario_params.get("vacancy_rate", [0])
-                    ),
-                    "avg_property_growth": np.mean(
-                        scenario_params.get("property_growth", [0])
-                    ),
-                    # Interest rate environment
-                    "avg_treasury_rate": np.mean(
-                        scenario_params.get("treasury_10y", [0])
-                    ),
-                    "avg_mortgage_rate": np.mean(
-                        scenario_params.get("commercial_mortgage_rate", [0])
-                    ),
-                    # Market scenario classification
-                    "market_scenario": self._classify_market_scenario(scenario_params),
-                    # Volatility measures
-                    "rent_growth_volatility": np.std(
-                        scenario_params.get("rent_growth", [0])
+        try:
+            msa_code, factorization = self._prepare_sampling_inputs(
+                property_data, horizon_years, use_correlations
+            )
+            param_names = factorization.param_names
+            param_stats = factorization.param_stats
+            seed_sequence = self._resolve_seed(seed)
+            max_batches = max(1, int(np.ceil(max_scenarios / batch_size)))
+            batch_streams = seed_sequence.spawn(max_batches)
+
+            percentiles = (5, 95)
+            batches: List[ScenarioBatch] = []
+            # Per batch: metric -> (p5, p95) estimates
+            batch_estimates: Dict[str, List[np.ndarray]] = {}
+            relative_errors: Dict[str, float] = {}
+            converged = False
+            generated = 0
+
+            for stream in batch_streams:
+                size = min(batch_size, max_scenarios - generated)
+                batch = ScenarioBatch.from_tensor(
+                    self._sample_scenario_tensor(
+                        param_names,
+                        param_stats,
+                        size,
+                        horizon_years,
+                        factorization.correlation_matrix,
+                        np.random.default_rng(stream),
+                        sampler,
+                        antithetic,
+                        year_factors=factorization.year_factors,
                     ),
-                    "cap_rate_volatility": np.std(scenario_params.get("cap_rate", [0])),
-                    # Composite scores
-                    "growth_score": self._calculate_growth_score(scenario_params),
-                    "risk_score": self._calculate_risk_score(scenario_params),
-                }
-
-                scenarios.append(
-                    MonteCarloScenario(
-                        scenario_id=scenario_id,
-                        forecasted_parameters=scenario_params,
-                        scenario_summary=scenario_summary,  # type: ignore
-                    )
+                    param_names,
                 )
+                self._summarize_scenarios(batch)
+                batches.append(batch)
+                generated += size
 
-            # Calculate summary statistics across all scenarios
-            summary_stats = self._calculate_summary_statistics(scenarios, param_names)
+                for metric in ("avg_cap_rate", "avg_rent_growth", "growth_score"):
+                    batch_estimates.setdefault(metric, []).append(
+                        np.percentile(batch.summaries[metric], percentiles)
+                    )
 
-            # Identify extreme scenarios
-            extreme_scenarios = self._identify_extreme_scenarios(scenarios)
+                if len(batches) < min_batches:
+                    continue
 
-            # Calculate percentile ranks for scenarios
-            self._calculate_percentile_ranks(scenarios)
+                relative_errors = {}
+                for metric, estimates in batch_estimates.items():
+                    values = np.concatenate([b.summaries[metric] for b in batches])
+                    spread = float(np.std(values)) or 1.0
+                    standard_errors = np.std(estimates, axis=0, ddof=1) / np.sqrt(
+                        len(estimates)
+                    )
+                    for p, error in zip(percentiles, standard_errors):
+                        relative_errors[f"{metric}_p{p}"] = float(error / spread)
 
-            results = MonteCarloResults(
-                property_id=property_data.property_id,
-                msa_code=msa_code,
-                simulation_date=date.today(),
-                num_scenarios=num_scenarios,
-                horizon_years=horizon_years,
-                scenarios=scenarios,
-                summary_statistics=summary_stats,
-                correlation_matrix=correlation_matrix,
-                parameter_names=param_names,
-                extreme_scenarios=extreme_scenarios,
+                if max(relative_errors.values()) <= tolerance:
+                    converged = True
+                    break
+
+            scenarios = ScenarioBatch.concatenate(batches)
+            self.logger.info(
+                f"Adaptive run {'converged' if converged else 'stopped'} after "
+                f"{generated} scenarios ({len(batches)} batches)"
             )
 
-            self.logger.info(f"Generated {num_scenarios} scenarios successfully")
+            results = self._build_results(
+                property_data,
+                msa_code,
+                horizon_years,
+                scenarios,
+                param_names,
+                param_stats,
+                factorization.correlation_matrix,
+                seed_sequence,
+                antithetic=antithetic,
+                control_variates=control_variates,
+            )
+            results.convergence = {
+                "converged": converged,
+                "scenarios_used": generated,
+                "batches": len(batches),
+                "batch_size": batch_size,
+                "tolerance": tolerance,
+                "max_scenarios": max_scenarios,
+                "relative_standard_errors": relative_errors,
+            }
             return results
 
         except Exception as e:
-            raise MonteCarloError(f"Failed to generate scenarios: {e}") from e
+            raise MonteCarloError(f"Failed to generate adaptive scenarios: {e}") from e
+
+    def iter_scenario_chunks(
+        self,
+        property_data: SimplifiedPropertyInput,
+        num_scenarios: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        horizon_years: int = 5,
+        use_correlations: bool = True,
+        seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None,
+        sampler: Optional[str] = None,
+        antithetic: Optional[bool] = None,
+    ) -> Iterator[ScenarioBatch]:
+        """
+        Generate scenarios lazily, one summarized chunk at a time.
+
+        Chunk ``i`` draws from the ``i``-th child of the root seed, like the
+        shards of ``generate_scenarios(parallel=True)``, so a chunk can be sent
+        to a client and dropped before the next one is sampled. Run-level
+        statistics (percentile ranks, extreme scenarios) need every scenario
+        and are left to the caller.
+
+        Args:
+            property_data: Property-specific input data
+            num_scenarios: Total scenarios across all chunks (defaults to settings)
+            chunk_size: Scenarios per chunk (defaults to settings)
+            horizon_years: Forecast horizon in years
+            use_correlations: Whether to model parameter correlations
+            seed: Seed for the chunk streams, as in ``generate_scenarios``
+            sampler: Sampler name, as in ``generate_scenarios``
+            antithetic: Mirror draws within each chunk
+
+        Yields:
+            ScenarioBatch chunks with summary columns and market classifications
+        """
+        if num_scenarios is None:
+            num_scenarios = settings.monte_carlo.default_num_simulations
+        chunk_size = max(1, chunk_size or settings.monte_carlo.stream_chunk_size)
+        sampler, antithetic, _ = self._resolve_sampling_options(
+            sampler, antithetic, None
+        )
+        if antithetic:
+            chunk_size += chunk_size % 2  # Keep mirrored pairs inside one chunk
+
+        try:
+            _, factorization = self._prepare_sampling_inputs(
+                property_data, horizon_years, use_correlations
+            )
+            chunk_sizes = [
+                min(chunk_size, num_scenarios - start)
+                for start in range(0, num_scenarios, chunk_size)
+            ]
+            streams = self._resolve_seed(seed).spawn(len(chunk_sizes))
+        except Exception as e:
+            raise MonteCarloError(f"Failed to stream scenarios: {e}") from e
+
+        for size, stream in zip(chunk_sizes, streams):
+            batch = ScenarioBatch.from_tensor(
+                self._sample_scenario_tensor(
+                    factorization.param_names,
+                    factorization.param_stats,
+                    size,
+                    horizon_years,
+                    factorization.correlation_matrix,
+                    np.random.default_rng(stream),
+                    sampler,
+                    antithetic,
+                    year_factors=factorization.year_factors,
+                ),
+                factorization.param_names,
+            )
+            self._summarize_scenarios(batch)
+            yield batch
+
+    def compare_sampler_convergence(
+        self,
+        property_data: SimplifiedPropertyInput,
+        sampler: str = "sobol",
+        sample_sizes: Sequence[int] = (256, 1024, 4096),
+        replications: int = 20,
+        horizon_years: int = 5,
+        percentiles: Sequence[float] = (5, 95),
+        seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]] = None,
+    ) -> SamplerConvergenceReport:
+        """
+        Compare percentile convergence of a sampler against pseudo-random draws.
+
+        Each configuration is replicated with independent seed streams and the
+        spread of the percentile estimates across replications is reported as
+        the standard error. ``variance_reduction`` is the factor by which the
+        pseudo-random sampler would need more scenarios to match the precision.
+
+        Args:
+            property_data: Property whose MSA forecasts drive the sampling
+            sampler: Sampler to evaluate
+            sample_sizes: Scenario counts to evaluate
+            replications: Independent runs per sampler and sample size
+            horizon_years: Forecast horizon in years
+            percentiles: Percentiles to track
+            seed: Seed for the replication streams
+
+        Returns:
+            SamplerConvergenceReport for scenario-level cap rate, rent growth
+            and growth score percentiles
+        """
+        self._resolve_sampling_options(sampler, False, False)
+
+        baseline = "pseudo_random"
+        _, factorization = self._prepare_sampling_inputs(
+            property_data, horizon_years, use_correlations=True
+        )
+        param_names = factorization.param_names
+        root = self._resolve_seed(seed)
+
+        metrics = ("avg_cap_rate", "avg_rent_growth", "growth_score")
+        labels = [f"p{p}" for p in percentiles]
+        standard_errors: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        for name, streams in zip((baseline, sampler), root.spawn(2)):
+            errors = {metric: {label: [] for label in labels} for metric in metrics}
+            for size, size_stream in zip(
+                sample_sizes, streams.spawn(len(sample_sizes))
+            ):
+                estimates = np.empty((replications, len(metrics), len(percentiles)))
+                for rep, rep_stream in enumerate(size_stream.spawn(replications)):
+                    batch = ScenarioBatch.from_tensor(
+                        self._sample_scenario_tensor(
+                            param_names,
+                            factorization.param_stats,
+                            size,
+                            horizon_years,
+                            factorization.correlation_matrix,
+                            np.random.default_rng(rep_stream),
+                            name,
+                            year_factors=factorization.year_factors,
+                        ),
+                        param_names,
+                    )
+                    columns = (
+                        batch.parameter("cap_rate").mean(axis=1),
+                        batch.parameter("rent_growth").mean(axis=1),
+                        self._calculate_growth_scores(batch),
+                    )
+                    for idx, column in enumerate(columns):
+                        estimates[rep, idx] = np.percentile(column, percentiles)
+
+                spread = estimates.std(axis=0, ddof=1)
+                for idx, metric in enumerate(metrics):
+                    for p_idx, label in enumerate(labels):
+                        errors[metric][label].append(float(spread[idx, p_idx]))
+            standard_errors[name] = errors
+
+        variance_reduction = {
+            metric: {
+                label: [
+                    (base / candidate) ** 2 if candidate > 0 else float("inf")
+                    for base, candidate in zip(
+                        standard_errors[baseline][metric][label],
+                        standard_errors[sampler][metric][label],
+                    )
+                ]
+                for label in labels
+            }
+            for metric in metrics
+        }
+
+        return SamplerConvergenceReport(
+            sampler=sampler,
+            baseline_sampler=baseline,
+            sample_sizes=list(sample_sizes),
+            replications=replications,
+            standard_errors=standard_errors,
+            variance_reduction=variance_reduction,
+        )
+
+    def _resolve_sampling_options(
+        self,
+        sampler: Optional[str],
+        antithetic: Optional[bool],
+        control_variates: Optional[bool],
+    ) -> Tuple[str, bool, bool]:
+        """Fill sampling options from settings and validate the sampler."""
+        if sampler is None:
+            sampler = settings.monte_carlo.sampler
+        if sampler not in SAMPLERS:
+            raise ValidationError(
+                f"Unknown sampler '{sampler}', expected one of {SAMPLERS}",
+                field_name="sampler",
+                field_value=sampler,
+            )
+        if antithetic is None:
+            antithetic = settings.monte_carlo.antithetic
+        if control_variates is None:
+            control_variates = settings.monte_carlo.control_variates
+        return sampler, antithetic, control_variates
+
+    def _prepare_sampling_inputs(
+        self,
+        property_data: SimplifiedPropertyInput,
+        horizon_years: int,
+        use_correlations: bool,
+    ) -> Tuple[str, SamplingFactorization]:
+        """Load the MSA's forecasts and their cached sampling setup."""
+        msa_code = property_data.get_msa_code()
+        forecasts = self.load_forecasts_for_msa(msa_code, horizon_years)
+        factorization = self.get_sampling_factorization(
+            msa_code, horizon_years, forecasts, use_correlations
+        )
+        return msa_code, factorization
+
+    def _build_results(
+        self,
+        property_data: SimplifiedPropertyInput,
+        msa_code: str,
+        horizon_years: int,
+        scenarios: ScenarioBatch,
+        param_names: List[str],
+        param_stats: Dict[str, Dict[str, np.ndarray]],
+        correlation_matrix: Optional[np.ndarray],
+        seed_sequence: np.random.SeedSequence,
+        accumulators: Optional[Dict[str, StreamingSummary]] = None,
+        antithetic: bool = False,
+        control_variates: bool = False,
+    ) -> MonteCarloResults:
+        """Compute run-level statistics for summarized scenarios."""
+        # Calculate summary statistics across all scenarios
+        summary_stats = self._calculate_summary_statistics(
+            scenarios, param_names, accumulators
+        )
+
+        # Identify extreme scenarios
+        extreme_scenarios = self._identify_extreme_scenarios(scenarios)
+
+        # Calculate percentile ranks for scenarios
+        self._calculate_percentile_ranks(scenarios)
+
+        # Standard error and effective sample size of the score estimates
+        precision = self._estimate_precision(
+            scenarios, param_stats, antithetic, control_variates
+        )
+
+        return MonteCarloResults(
+            property_id=property_data.property_id,
+            msa_code=msa_code,
+            simulation_date=date.today(),
+            num_scenarios=scenarios.num_scenarios,
+            horizon_years=horizon_years,
+            scenarios=scenarios,
+            summary_statistics=summary_stats,
+            correlation_matrix=correlation_matrix,
+            parameter_names=param_names,
+            extreme_scenarios=extreme_scenarios,
+            seed=seed_sequence.entropy,  # type: ignore
+            precision=precision,
+        )
+
+    def _forecast_parameter_stats(
+        self, forecasts: Dict[str, Dict]
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """Per-year sampling mean and standard deviation for each parameter."""
+        param_stats = {}
+        for param_name, forecast_data in forecasts.items():
+            values = np.array(forecast_data["values"])
+            lower = np.array(forecast_data["lower_bound"])
+            upper = np.array(forecast_data["upper_bound"])
+
+            # Estimate standard deviation from confidence intervals
+            std_dev = (upper - lower) / (2 * 1.96)  # 95% CI assumption
+
+            param_stats[param_name] = {"mean": values, "std": std_dev}
+
+        return param_stats
+
+    def _resolve_seed(
+        self, seed: Optional[Union[int, np.random.Generator, np.random.SeedSequence]]
+    ) -> np.random.SeedSequence:
+        """Normalize a seed argument to the run's root SeedSequence."""
+        return resolve_seed(seed)
+
+    def _generate_sharded(
+        self,
+        param_names: List[str],
+        param_stats: Dict[str, Dict[str, np.ndarray]],
+        num_scenarios: int,
+        horizon_years: int,
+        correlation_matrix: Optional[np.ndarray],
+        seed_sequence: np.random.SeedSequence,
+        num_workers: Optional[int] = None,
+        sampler: str = "pseudo_random",
+        antithetic: bool = False,
+        year_factors: Optional[np.ndarray] = None,
+    ) -> Tuple[ScenarioBatch, Dict[str, StreamingSummary]]:
+        """
+        Sample, score and summarize scenarios in shards across processes.
+
+        Shards have a fixed size and shard ``i`` always draws from the ``i``-th
+        child of ``seed_sequence``, so the scenarios only depend on the seed and
+        shard size, never on the number of workers. Shard-level accumulators
+        are merged into run-level summary statistics.
+        """
+        shard_size = max(1, settings.monte_carlo.shard_size)
+        if antithetic:
+            shard_size += shard_size % 2  # Keep mirrored pairs inside one shard
+        if num_workers is None:
+            num_workers = settings.monte_carlo.num_workers or os.cpu_count() or 1
+
+        shard_sizes = [
+            min(shard_size, num_scenarios - start)
+            for start in range(0, num_scenarios, shard_size)
+        ]
+        tasks = [
+            _ScenarioShardTask(
+                param_names=param_names,
+                param_stats=param_stats,
+                num_scenarios=size,
+                horizon_years=horizon_years,
+                correlation_matrix=correlation_matrix,
+                seed_sequence=child,
+                sampler=sampler,
+                antithetic=antithetic,
+                year_factors=year_factors,
+            )
+            for size, child in zip(shard_sizes, seed_sequence.spawn(len(shard_sizes)))
+        ]
+
+        num_workers = min(num_workers, len(tasks))
+        self.logger.info(
+            f"Running {len(tasks)} scenario shards on {num_workers} workers"
+        )
+        if num_workers <= 1:
+            shard_results = [_run_scenario_shard(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                shard_results = list(executor.map(_run_scenario_shard, tasks))
+
+        batch = ScenarioBatch.concatenate([batch for batch, _ in shard_results])
+
+        accumulators: Dict[str, StreamingSummary] = {}
+        for param_name in batch.parameter_names:
+            merged = StreamingSummary(
+                settings.monte_carlo.percentile_method,
+                settings.monte_carlo.tdigest_compression,
+            )
+            for _, shard_accumulators in shard_results:
+                merged.merge(shard_accumulators[param_name])
+            merged.retain(batch.parameter(param_name))  # Exact percentiles only
+            accumulators[param_name] = merged
+
+        return batch, accumulators
+
+    def _sample_scenario_tensor(
+        self,
+        param_names: List[str],
+        param_stats: Dict[str, Dict[str, np.ndarray]],
+        num_scenarios: int,
+        horizon_years: int,
+        correlation_matrix: Optional[np.ndarray],
+        rng: np.random.Generator,
+        sampler: str = "pseudo_random",
+        antithetic: bool = False,
+        year_factors: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Draw every scenario at once as a (scenarios, years, parameters) tensor.
+
+        Correlated draws use the per-year Cholesky factors of the covariance
+        ``D_y C D_y``. Cached ``year_factors`` from ``get_sampling_factorization``
+        are used when given; otherwise they are derived from
+        ``correlation_matrix``.
+        """
+        means = np.column_stack(
+            [param_stats[name]["mean"][:horizon_years] for name in param_names]
+        )
+        stds = np.column_stack(
+            [param_stats[name]["std"][:horizon_years] for name in param_names]
+        )
+
+        standard_normals = self._draw_standard_normals(
+            (num_scenarios, horizon_years, len(param_names)), rng, sampler, antithetic
+        )
+
+        if year_factors is None:
+            if correlation_matrix is None:
+                return means + stds * standard_normals  # type: ignore
+            year_factors = self._year_cholesky_factors(stds, correlation_matrix)
+        year_factors = year_factors[:horizon_years]
+
+        # (years, scenarios, params) @ (years, params, params) -> correlated draws
+        correlated = np.matmul(
+            standard_normals.transpose(1, 0, 2), year_factors.transpose(0, 2, 1)
+        )
+        return means + correlated.transpose(1, 0, 2)  # type: ignore
+
+    def _draw_standard_normals(
+        self,
+        shape: Tuple[int, int, int],
+        rng: np.random.Generator,
+        sampler: str,
+        antithetic: bool = False,
+    ) -> np.ndarray:
+        """
+        Draw independent standard normals, pseudo- or quasi-randomly.
+
+        Quasi-random samplers treat every (year, parameter) pair as one
+        dimension of a scrambled low-discrepancy point set in the unit cube and
+        map it through the normal inverse CDF before the Cholesky transform.
+        With ``antithetic`` set, scenarios ``2k`` and ``2k + 1`` use mirrored
+        draws ``z`` and ``-z``.
+        """
+        if antithetic:
+            num_scenarios = shape[0]
+            base = self._draw_standard_normals(
+                ((num_scenarios + 1) // 2, shape[1], shape[2]), rng, sampler
+            )
+            normals = np.empty(shape)
+            normals[0::2] = base
+            normals[1::2] = -base[: num_scenarios // 2]
+            return normals
+
+        if sampler == "pseudo_random":
+            return rng.standard_normal(shape)
+
+        num_scenarios = shape[0]
+        dimensions = shape[1] * shape[2]
+        if sampler == "sobol":
+            engine = qmc.Sobol(d=dimensions, scramble=True, seed=rng)
+            # Sobol balance properties hold for powers of two; draw the next
+            # power and keep the leading points
+            m = max(0, int(np.ceil(np.log2(max(num_scenarios, 1)))))
+            uniforms = engine.random_base2(m)[:num_scenarios]
+        else:
+            uniforms = qmc.LatinHypercube(d=dimensions, seed=rng).random(num_scenarios)
+
+        eps = np.finfo(float).eps
+        return norm.ppf(np.clip(uniforms, eps, 1 - eps)).reshape(shape)  # type: ignore
+
+    def _sample_scenario_legacy(
+        self,
+        param_names: List[str],
+        param_stats: Dict[str, Dict[str, np.ndarray]],
+        horizon_years: int,
+        correlation_matrix: Optional[np.ndarray],
+        rng: Optional[np.random.Generator] = None,
+        year_covariances: Optional[np.ndarray] = None,
+    ) -> Dict[str, List[float]]:
+        """Sample a single scenario one year at a time (pre-vectorization path)."""
+        scenario_params: Dict[str, List[float]] = {}
+
+        if correlation_matrix is not None:
+            # Generate correlated samples for each year
+            for year_idx in range(horizon_years):
+                means = [param_stats[param]["mean"][year_idx] for param in param_names]
+                stds = [param_stats[param]["std"][year_idx] for param in param_names]
+
+                # Covariance from correlation and standard deviations
+                if year_covariances is not None:
+                    cov_matrix = year_covariances[year_idx]
+                else:
+                    cov_matrix = np.outer(stds, stds) * correlation_matrix
+
+                # Sample from multivariate normal
+                samples = multivariate_normal.rvs(
+                    mean=means, cov=cov_matrix, random_state=rng
+                )
+
+                # Store samples for each parameter
+                for param_idx, param_name in enumerate(param_names):
+                    if param_name not in scenario_params:
+                        scenario_params[param_name] = []
+                    scenario_params[param_name].append(samples[param_idx])
+        else:
+            # Generate independent samples
+            for param_name in param_names:
+                means = param_stats[param_name]["mean"]
+                stds = param_stats[param_name]["std"]
+                samples = norm.rvs(loc=means, scale=stds, random_state=rng)
+                scenario_params[param_name] = samples.tolist()
+
+        return scenario_params
+
+    def _summarize_scenarios(self, batch: ScenarioBatch) -> None:
+        """Compute the per-scenario summary columns for a batch."""
+        zeros = np.zeros((batch.num_scenarios, batch.horizon_years))
+
+        def paths(name: str) -> np.ndarray:
+            if name in batch.parameter_index:
+                return batch.parameter(name)
+            return zeros
+
+        summaries = {
+            # Key market indicators (horizon averages)
+            "avg_cap_rate": paths("cap_rate").mean(axis=1),
+            "avg_rent_growth": paths("rent_growth").mean(axis=1),
+            "avg_expense_growth": paths("expense_growth").mean(axis=1),
+            "avg_vacancy_rate": paths("vacancy_rate").mean(axis=1),
+            "avg_property_growth": paths("property_growth").mean(axis=1),
+            # Interest rate environment
+            "avg_treasury_rate": paths("treasury_10y").mean(axis=1),
+            "avg_mortgage_rate": paths("commercial_mortgage_rate").mean(axis=1),
+            # Volatility measures
+            "rent_growth_volatility": paths("rent_growth").std(axis=1),
+            "cap_rate_volatility": paths("cap_rate").std(axis=1),
+        }
+
+        # Composite scores and market scenario classification
+        growth_scores = self._calculate_growth_scores(batch)
+        risk_scores = self._calculate_risk_scores(batch)
+        market_codes = self._classify_market_scenarios(growth_scores, risk_scores)
+
+        summaries["growth_score"] = growth_scores
+        summaries["risk_score"] = risk_scores
+        batch.summaries = summaries
+        batch.market_scenario_codes = market_codes
+
+    def _estimate_precision(
+        self,
+        batch: ScenarioBatch,
+        param_stats: Dict[str, Dict[str, np.ndarray]],
+        antithetic: bool = False,
+        control_variates: bool = False,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Estimate the mean growth and risk scores with their standard errors.
+
+        Antithetic pairs are averaged into one independent unit each. Control
+        variates regress the scores on each scenario's horizon-average
+        parameters, whose expectations are the known forecast means, and
+        subtract the fitted deviation. Mirrored pairs already balance those
+        linear controls exactly, so the correction is skipped for antithetic
+        runs. ``effective_sample_size`` is the number of plain independent
+        scenarios that would give the same standard error.
+        """
+        controls = batch.values.mean(axis=2)  # (scenarios, parameters)
+        control_means = np.array(
+            [
+                param_stats[name]["mean"][: batch.horizon_years].mean()
+                for name in batch.parameter_names
+            ]
+        )
+        apply_controls = control_variates and not antithetic
+        if control_variates and antithetic:
+            self.logger.info(
+                "Skipping control variates: antithetic pairs balance the controls"
+            )
+
+        precision = {}
+        for metric in ("growth_score", "risk_score"):
+            scores = batch.summaries.get(metric)
+            if scores is None or len(scores) < 3:
+                continue
+
+            units, unit_controls = scores, controls
+            if antithetic:
+                paired = len(scores) // 2 * 2
+                units = (scores[0:paired:2] + scores[1:paired:2]) / 2
+                unit_controls = (controls[0:paired:2] + controls[1:paired:2]) / 2
+
+            if apply_controls:
+                centered = unit_controls - unit_controls.mean(axis=0)
+                beta, *_ = np.linalg.lstsq(centered, units - units.mean(), rcond=None)
+                units = units - (unit_controls - control_means) @ beta
+                dof = 1 + len(beta)
+            else:
+                dof = 1
+
+            if len(units) <= dof:
+                continue
+            estimate = float(units.mean())
+            standard_error = float(np.std(units, ddof=dof) / np.sqrt(len(units)))
+            if standard_error <= 1e-12 * max(1.0, abs(estimate)):
+                # Score is linear in the controls: the estimate is exact
+                standard_error = 0.0
+            plain_variance = float(np.var(scores, ddof=1))
+            precision[metric] = {
+                "estimate": estimate,
+                "standard_error": standard_error,
+                "effective_sample_size": (
+                    plain_variance / standard_error**2
+                    if standard_error > 0
+                    else float("inf")
+                ),
+            }
+
+        return precision
 
     def _calculate_summary_statistics(
-        self, scenarios: List[MonteCarloScenario], param_names: List[str]
+        self,
+        scenarios: ScenarioBatch,
+        param_names: List[str],
+        accumulators: Optional[Dict[str, StreamingSummary]] = None,
     ) -> Dict[str, Dict[str, float]]:
         """Calculate summary statistics across all scenarios."""
 
-        summary_stats = {}
         percentiles = settings.monte_carlo.percentiles or [5, 25, 50, 75, 95]
+        if accumulators is None:
+            accumulators = self._accumulate_summaries(scenarios, param_names)
 
-        for param_name in param_names:
-            # Collect all values for this parameter across scenarios
-            all_values = []
-            for scenario in scenarios:
-                if param_name in scenario.forecasted_parameters:
-                    all_values.extend(scenario.forecasted_parameters[param_name])
-
-            if all_values:
-                stats = {
-                    "mean": float(np.mean(all_values)),
-                    "std": float(np.std(all_values)),
-                    "min": float(np.min(all_values)),
-                    "max": float(np.max(all_values)),
-                }
+        return {
+            param_name: accumulator.to_dict(percentiles)
+            for param_name, accumulator in accumulators.items()
+            if accumulator.running.count
+        }
 
-                # Add percentiles
-                for p in percentiles:
-                    stats[f"p{p}"] = float(np.percentile(all_values, p))
+    def _accumulate_summaries(
+        self,
+        scenarios: ScenarioBatch,
+        param_names: List[str],
+        chunk_size: int = 10000,
+        keep_values: bool = True,
+    ) -> Dict[str, StreamingSummary]:
+        """Feed every parameter's samples through mergeable accumulators."""
+        accumulators = {}
+        for param_name in param_names:
+            if param_name not in scenarios.parameter_index:
+                continue
 
-                summary_stats[param_name] = stats
+            accumulator = StreamingSummary(
+                settings.monte_carlo.percentile_method,
+                settings.monte_carlo.tdigest_compression,
+                keep_values=keep_values,
+            )
+            paths = scenarios.parameter(param_name)
+            for start in range(0, scenarios.num_scenarios, chunk_size):
+                accumulator.update(paths[start : start + chunk_size])
+            accumulators[param_name] = accumulator
 
-        return summary_stats
+        return accumulators
 
-    def _classify_market_scenario(self, scenario_params: Dict[str, List[float]]) -> str:
+    def _classify_market_scenario(
+        self,
+        scenario_params: Dict[str, List[float]],
+        growth_score: Optional[float] = None,
+        risk_score: Optional[float] = None,
+    ) -> str:
         """Classify market scenario as bull, bear, or neutral based on key metrics."""
 
-        # Calculate composite growth and risk indicators
-        growth_score = self._calculate_growth_score(scenario_params)
-        risk_score = self._calculate_risk_score(scenario_params)
+        # Calculate composite growth and risk indicators unless already known
+        if growth_score is None:
+            growth_score = self._calculate_growth_score(scenario_params)
+        if risk_score is None:
+            risk_score = self._calculate_risk_score(scenario_params)
 
         # Classification thresholds
         if growth_score > 0.6 and risk_score < 0.4:
@@ -518,75 +1388,210 @@ class MonteCarloEngine:
 
         return 0.5  # Neutral if no components available
 
+    def _classify_market_scenarios(
+        self, growth_scores: np.ndarray, risk_scores: np.ndarray
+    ) -> np.ndarray:
+        """
+        Classify every scenario at once.
+
+        Mirrors the thresholds in ``_classify_market_scenario`` and returns
+        int8 codes into ``MARKET_SCENARIO_LABELS``.
+        """
+        labels = MARKET_SCENARIO_LABELS
+        conditions = [
+            (growth_scores > 0.6) & (risk_scores < 0.4),
+            (growth_scores < 0.4) & (risk_scores > 0.6),
+            growth_scores > 0.7,
+            risk_scores > 0.7,
+        ]
+        choices = [
+            labels.index("bull_market"),
+            labels.index("bear_market"),
+            labels.index("growth_market"),
+            labels.index("stress_market"),
+        ]
+        return np.select(  # type: ignore
+            conditions, choices, default=labels.index("neutral_market")
+        ).astype(np.int8)
+
+    def _calculate_growth_scores(self, batch: ScenarioBatch) -> np.ndarray:
+        """Vectorized ``_calculate_growth_score`` over every scenario in a batch."""
+        components = []
+
+        def average(name: str) -> np.ndarray:
+            return batch.parameter(name).mean(axis=1)  # type: ignore
+
+        if "rent_growth" in batch.parameter_index:
+            components.append((average("rent_growth") / 0.06, 0.3))
+        if "property_growth" in batch.parameter_index:
+            components.append((average("property_growth") / 0.08, 0.25))
+        if "cap_rate" in batch.parameter_index:
+            components.append(((0.08 - average("cap_rate")) / 0.04, 0.25))
+        if "vacancy_rate" in batch.parameter_index:
+            components.append(((0.15 - average("vacancy_rate")) / 0.12, 0.2))
+
+        return self._weighted_component_scores(components, batch.num_scenarios)
+
+    def _calculate_risk_scores(self, batch: ScenarioBatch) -> np.ndarray:
+        """Vectorized ``_calculate_risk_score`` over every scenario in a batch."""
+        components = []
+
+        def average(name: str) -> np.ndarray:
+            return batch.parameter(name).mean(axis=1)  # type: ignore
+
+        def volatility(name: str) -> np.ndarray:
+            return batch.parameter(name).std(axis=1)  # type: ignore
+
+        if "treasury_10y" in batch.parameter_index:
+            components.append(((average("treasury_10y") - 0.02) / 0.05, 0.2))
+        if "commercial_mortgage_rate" in batch.parameter_index:
+            components.append(
+                ((average("commercial_mortgage_rate") - 0.03) / 0.05, 0.25)
+            )
+        if "cap_rate" in batch.parameter_index:
+            cap_level = np.clip((average("cap_rate") - 0.04) / 0.04, 0, 1)
+            cap_vol = np.clip(volatility("cap_rate") / 0.02, 0, 1)
+            components.append(((cap_level + cap_vol) / 2, 0.25))
+        if "vacancy_rate" in batch.parameter_index:
+            vacancy_level = np.clip((average("vacancy_rate") - 0.03) / 0.12, 0, 1)
+            vacancy_vol = np.clip(volatility("vacancy_rate") / 0.05, 0, 1)
+            components.append(((vacancy_level + vacancy_vol) / 2, 0.15))
+        if "ltv_ratio" in batch.parameter_index:
+            components.append(((0.80 - average("ltv_ratio")) / 0.10, 0.15))
+
+        return self._weighted_component_scores(components, batch.num_scenarios)
+
+    def _weighted_component_scores(
+        self, components: List[Tuple[np.ndarray, float]], num_scenarios: int
+    ) -> np.ndarray:
+        """Clip each component to [0, 1] and take the weight-normalized sum."""
+        if not components:
+            return np.full(num_scenarios, 0.5)  # Neutral if no components available
+
+        total_weight = sum(weight for _, weight in components)
+        weighted_sum = np.zeros(num_scenarios)
+        for score, weight in components:
+            weighted_sum += np.clip(score, 0, 1) * weight
+        return weighted_sum / total_weight  # type: ignore
+
     def _identify_extreme_scenarios(
-        self, scenarios: List[MonteCarloScenario]
+        self, scenarios: Union[ScenarioBatch, List[MonteCarloScenario]]
     ) -> Dict[str, MonteCarloScenario]:
         """Identify best case, worst case, and other extreme scenarios."""
 
         if not scenarios:
             return {}
 
-        extreme_scenarios = {}
-
-        # Sort by growth score
-        growth_sorted = sorted(
-            scenarios, key=lambda s: s.scenario_summary.get("growth_score", 0.5)
-        )
-        extreme_scenarios["worst_growth"] = growth_sorted[0]
-        extreme_scenarios["best_growth"] = growth_sorted[-1]
-
-        # Sort by risk score
-        risk_sorted = sorted(
-            scenarios, key=lambda s: s.scenario_summary.get("risk_score", 0.5)
-        )
-        extreme_scenarios["lowest_risk"] = risk_sorted[0]
-        extreme_scenarios["highest_risk"] = risk_sorted[-1]
-
-        # Find scenarios with highest rent growth
-        if any("rent_growth" in s.forecasted_parameters for s in scenarios):
-            rent_sorted = sorted(
-                scenarios,
-                key=lambda s: np.mean(s.forecasted_parameters.get("rent_growth", [0])),
+        # Per-scenario metrics: (minimum label, maximum label) -> values
+        metrics: Dict[Tuple[str, str], np.ndarray] = {}
+        if isinstance(scenarios, ScenarioBatch):
+            neutral = np.full(scenarios.num_scenarios, 0.5)
+            metrics[("worst_growth", "best_growth")] = scenarios.summaries.get(
+                "growth_score", neutral
             )
-            extreme_scenarios["highest_rent_growth"] = rent_sorted[-1]
-            extreme_scenarios["lowest_rent_growth"] = rent_sorted[0]
-
-        # Find scenarios with extreme cap rates
-        if any("cap_rate" in s.forecasted_parameters for s in scenarios):
-            cap_sorted = sorted(
-                scenarios,
-                key=lambda s: np.mean(s.forecasted_parameters.get("cap_rate", [0])),
+            metrics[("lowest_risk", "highest_risk")] = scenarios.summaries.get(
+                "risk_score", neutral
             )
-            extreme_scenarios["lowest_cap_rate"] = cap_sorted[0]
-            extreme_scenarios["highest_cap_rate"] = cap_sorted[-1]
+            if "rent_growth" in scenarios.parameter_index:
+                metrics[("lowest_rent_growth", "highest_rent_growth")] = (
+                    scenarios.summaries.get("avg_rent_growth")
+                    if "avg_rent_growth" in scenarios.summaries
+                    else scenarios.parameter("rent_growth").mean(axis=1)
+                )
+            if "cap_rate" in scenarios.parameter_index:
+                metrics[("lowest_cap_rate", "highest_cap_rate")] = (
+                    scenarios.summaries.get("avg_cap_rate")
+                    if "avg_cap_rate" in scenarios.summaries
+                    else scenarios.parameter("cap_rate").mean(axis=1)
+                )
+        else:
+            metrics[("worst_growth", "best_growth")] = np.array(
+                [s.scenario_summary.get("growth_score", 0.5) for s in scenarios]
+            )
+            metrics[("lowest_risk", "highest_risk")] = np.array(
+                [s.scenario_summary.get("risk_score", 0.5) for s in scenarios]
+            )
+            for param_name, labels in (
+                ("rent_growth", ("lowest_rent_growth", "highest_rent_growth")),
+                ("cap_rate", ("lowest_cap_rate", "highest_cap_rate")),
+            ):
+                if any(param_name in s.forecasted_parameters for s in scenarios):
+                    metrics[labels] = np.array(
+                        [
+                            np.mean(s.forecasted_parameters.get(param_name, [0]))
+                            for s in scenarios
+                        ]
+                    )
+
+        extreme_scenarios = {}
+        for (min_label, max_label), values in metrics.items():
+            values = np.asarray(values, dtype=float)
+            # Match a stable sort: first minimum, last maximum
+            extreme_scenarios[min_label] = scenarios[int(np.argmin(values))]
+            extreme_scenarios[max_label] = scenarios[
+                len(values) - 1 - int(np.argmax(values[::-1]))
+            ]
 
         return extreme_scenarios
 
-    def _calculate_percentile_ranks(self, scenarios: List[MonteCarloScenario]) -> None:
+    def _calculate_percentile_ranks(
+        self, scenarios: Union[ScenarioBatch, List[MonteCarloScenario]]
+    ) -> None:
         """Calculate and assign percentile ranks to scenarios based on growth score."""
 
         if not scenarios:
             return
 
-        # Extract growth scores
-        growth_scores = [s.scenario_summary.get("growth_score", 0.5) for s in scenarios]
+        if isinstance(scenarios, ScenarioBatch):
+            growth_scores = scenarios.summaries.get(
+                "growth_score", np.full(scenarios.num_scenarios, 0.5)
+            )
+        else:
+            growth_scores = np.array(
+                [s.scenario_summary.get("growth_score", 0.5) for s in scenarios],
+                dtype=float,
+            )
+
+        # Number of strictly lower scores via binary search on the sorted scores
+        lower_counts = np.searchsorted(np.sort(growth_scores), growth_scores, "left")
+        percentile_ranks = lower_counts / len(scenarios) * 100
+
+        if isinstance(scenarios, ScenarioBatch):
+            # Views are rebuilt on access, so ranks are stored on the batch
+            scenarios.percentile_ranks = percentile_ranks
+            return
+
+        for scenario, percentile in zip(scenarios, percentile_ranks):
+            scenario.percentile_rank = float(percentile)
+
+    def save_results(
+        self,
+        results: MonteCarloResults,
+        persist_scenarios: Optional[bool] = None,
+        store: Optional[ScenarioStore] = None,
+    ) -> Optional[str]:
+        """
+        Save Monte Carlo results to database.
 
-        # Calculate percentile ranks
-        for i, scenario in enumerate(scenarios):
-            scenario_score = growth_scores[i]
-            # Count scenarios with lower scores
-            lower_count = sum(1 for score in growth_scores if score < scenario_score)  # type: ignore
-            percentile = (lower_count / len(scenarios)) * 100
-            scenario.percentile_rank = percentile
+        Args:
+            results: Results to save
+            persist_scenarios: Also write the scenario tensor and per-scenario
+                scores to the columnar scenario store (defaults to settings)
+            store: Scenario store to write to (defaults to the settings path)
+
+        Returns:
+            The unique simulation id the results were saved under, or None if
+            the results row could not be saved (scenarios are then not
+            persisted either)
+        """
+        if persist_scenarios is None:
+            persist_scenarios = settings.monte_carlo.persist_scenarios
+        simulation_id = self._simulation_id(results)
 
-    def save_results(self, results: MonteCarloResults) -> None:
-        """Save Monte Carlo results to database."""
         try:
             # Save to monte_carlo_results table
             results_data = {
-                "simulation_id": (
-                    f"{results.property_id}_{results.simulation_date.isoformat()}"
-                ),
+                "simulation_id": simulation_id,
                 "geographic_code": results.msa_code,
                 "forecast_horizon_years": results.horizon_years,
                 "result_statistics": json.dumps(results.summary_statistics),
@@ -603,6 +1608,191 @@ class MonteCarloEngine:
 
         except Exception as e:
             self.logger.error(f"Failed to save Monte Carlo results: {e}")
+            return None
+
+        if persist_scenarios:
+            try:
+                self._persist_scenarios(simulation_id, results, store)
+            except Exception as e:
+                self.logger.error(f"Failed to persist Monte Carlo scenarios: {e}")
+
+        return simulation_id
+
+    def load_results(
+        self,
+        simulation_id: str,
+        mmap: bool = True,
+        store: Optional[ScenarioStore] = None,
+    ) -> MonteCarloResults:
+        """
+        Reload results persisted by ``save_results`` without re-simulating.
+
+        Args:
+            simulation_id: Id returned by ``save_results``
+            mmap: Memory-map the scenario columns instead of reading them
+            store: Scenario store to read from (defaults to the settings path)
+
+        Returns:
+            MonteCarloResults backed by the stored scenario columns
+
+        Raises:
+            DataNotFoundError: If the simulation's scenarios were not persisted
+        """
+        store = store or ScenarioStore()
+        batch, metadata, arrays = store.load(simulation_id, mmap=mmap)
+
+        return MonteCarloResults(
+            property_id=metadata["property_id"],
+            msa_code=metadata["msa_code"],
+            simulation_date=date.fromisoformat(metadata["simulation_date"]),
+            num_scenarios=batch.num_scenarios,
+            horizon_years=batch.horizon_years,
+            scenarios=batch,
+            summary_statistics=metadata["summary_statistics"],
+            correlation_matrix=arrays.get("correlation_matrix"),
+            parameter_names=metadata["parameter_names"],
+            extreme_scenarios={
+                label: batch[index]
+                for label, index in metadata["extreme_scenarios"].items()
+            },
+            seed=metadata["seed"],
+            precision=metadata["precision"],
+            convergence=metadata["convergence"],
+        )
+
+    def apply_shocks(
+        self,
+        results: MonteCarloResults,
+        shocks: Sequence[ScenarioShock],
+        propagate: bool = False,
+    ) -> MonteCarloResults:
+        """
+        Stress an existing run without re-sampling it.
+
+        The shocked paths are rescored and reclassified with the same
+        vectorized scoring as a fresh run, and run-level statistics are
+        recomputed. ``results`` is left unchanged, so one stored run can back
+        any number of shock analyses.
+
+        Args:
+            results: Run to shock, e.g. from ``load_results``
+            shocks: Parameter shocks to apply
+            propagate: Move unshocked parameters through the run's correlations
+
+        Returns:
+            MonteCarloResults for the shocked scenarios
+        """
+        scenarios = shock_scenarios(
+            results.scenarios,
+            shocks,
+            correlation_matrix=results.correlation_matrix,
+            parameter_names=results.parameter_names,
+            propagate=propagate,
+        )
+        self._summarize_scenarios(scenarios)
+        self._calculate_percentile_ranks(scenarios)
+
+        return MonteCarloResults(
+            property_id=results.property_id,
+            msa_code=results.msa_code,
+            simulation_date=results.simulation_date,
+            num_scenarios=scenarios.num_scenarios,
+            horizon_years=results.horizon_years,
+            scenarios=scenarios,
+            summary_statistics=self._calculate_summary_statistics(
+                scenarios, scenarios.parameter_names
+            ),
+            correlation_matrix=results.correlation_matrix,
+            parameter_names=results.parameter_names,
+            extreme_scenarios=self._identify_extreme_scenarios(scenarios),
+            seed=results.seed,
+        )
+
+    def _simulation_id(self, results: MonteCarloResults) -> str:
+        """
+        Id shared by the results table row and the scenario store.
+
+        A random run component keeps repeated runs of a property on the same
+        day from overwriting each other.
+        """
+        simulation_id = (
+            f"{results.property_id}_{results.simulation_date.isoformat()}_"
+            f"{uuid.uuid4().hex}"
+        )
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", simulation_id)
+
+    def _persist_scenarios(
+        self,
+        simulation_id: str,
+        results: MonteCarloResults,
+        store: Optional[ScenarioStore] = None,
+    ) -> None:
+        """Write the scenario columns and run metadata to the scenario store."""
+        arrays = {}
+        if results.correlation_matrix is not None:
+            arrays["correlation_matrix"] = results.correlation_matrix
+
+        metadata = {
+            "property_id": results.property_id,
+            "msa_code": results.msa_code,
+            "simulation_date": results.simulation_date.isoformat(),
+            "summary_statistics": results.summary_statistics,
+            "parameter_names": results.parameter_names,
+            # Views carry their batch index as scenario_id
+            "extreme_scenarios": {
+                label: scenario.scenario_id
+                for label, scenario in (results.extreme_scenarios or {}).items()
+            },
+            "seed": results.seed,
+            "precision": results.precision,
+            "convergence": results.convergence,
+        }
+
+        path = (store or ScenarioStore()).save(
+            simulation_id, results.scenarios, metadata, arrays
+        )
+        self.logger.info(
+            f"Persisted {results.scenarios.num_scenarios} scenarios to {path}"
+        )
+
+
+@dataclass
+class _ScenarioShardTask:
+    """Inputs for one scenario shard, sent to a worker process."""
+
+    param_names: List[str]
+    param_stats: Dict[str, Dict[str, np.ndarray]]
+    num_scenarios: int
+    horizon_years: int
+    correlation_matrix: Optional[np.ndarray]
+    seed_sequence: np.random.SeedSequence
+    sampler: str = "pseudo_random"
+    antithetic: bool = False
+    year_factors: Optional[np.ndarray] = None
+
+
+def _run_scenario_shard(
+    task: _ScenarioShardTask,
+) -> Tuple[ScenarioBatch, Dict[str, StreamingSummary]]:
+    """Sample, score and summarize one shard (process pool entry point)."""
+    engine = MonteCarloEngine()
+    samples = engine._sample_scenario_tensor(
+        task.param_names,
+        task.param_stats,
+        task.num_scenarios,
+        task.horizon_years,
+        task.correlation_matrix,
+        np.random.default_rng(task.seed_sequence),
+        task.sampler,
+        task.antithetic,
+        year_factors=task.year_factors,
+    )
+    batch = ScenarioBatch.from_tensor(samples, task.param_names)
+    engine._summarize_scenarios(batch)
+    accumulators = engine._accumulate_summaries(
+        batch, task.param_names, keep_values=False
+    )
+    return batch, accumulators
 
 
 # Global Monte Carlo engine instance
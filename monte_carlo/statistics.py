@@ -0,0 +1,237 @@
+"""
+Streaming Summary Statistics
+
+One-pass, mergeable accumulators for Monte Carlo summary statistics.
+``RunningStatistics`` tracks count, mean, variance, min and max with Chan's
+parallel update, and ``TDigest`` is a mergeable quantile sketch. Both can be
+fed chunk by chunk and combined across worker shards without keeping the
+underlying samples.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.exceptions import ConfigurationError
+
+PERCENTILE_METHODS = ("exact", "tdigest")
+
+
+class RunningStatistics:
+    """Mergeable count/mean/variance/min/max accumulator."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray) -> None:
+        """Fold a chunk of values into the running statistics."""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+
+        chunk = RunningStatistics()
+        chunk.count = int(values.size)
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(np.square(values - chunk.mean).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other: "RunningStatistics") -> None:
+        """Combine another accumulator into this one (Chan et al.)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (matches ``np.var`` with ddof=0)."""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+
+class TDigest:
+    """
+    Mergeable t-digest quantile sketch.
+
+    Incoming values are buffered and periodically compressed into weighted
+    centroids. Centroids are grouped on the arcsine scale function so that
+    they stay small in the tails, which keeps p5/p95 estimates accurate.
+    """
+
+    def __init__(self, compression: float = 200.0, buffer_size: int = 50000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum()) + self._buffered
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk of values to the sketch."""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._buffer.append(values)
+        self._buffered += values.size
+        if self._buffered >= self.buffer_size:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        """Combine another digest into this one."""
+        other._compress()
+        if other.weights.size == 0:
+            return
+
+        self._compress()
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._merge_centroids(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-th quantile (0 <= q <= 1)."""
+        self._compress()
+        if self.weights.size == 0:
+            return float("nan")
+
+        total = self.weights.sum()
+        # Centroid centers on the cumulative-weight axis, anchored at min/max
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * total, positions, values))
+
+    def percentile(self, p: float) -> float:
+        return self.quantile(p / 100)
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        values = np.concatenate(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._merge_centroids(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(values.size)]),
+        )
+
+    def _merge_centroids(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+
+        # Map each centroid's midpoint quantile onto k = d/(2*pi) * asin(2q - 1)
+        # and merge centroids falling into the same unit interval of k
+        total = weights.sum()
+        mid_q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * mid_q - 1)
+        groups = np.floor(k - k[0]).astype(np.int64)
+
+        group_weights = np.bincount(groups, weights=weights)
+        group_sums = np.bincount(groups, weights=means * weights)
+        occupied = group_weights > 0
+        self.weights = group_weights[occupied]
+        self.means = group_sums[occupied] / self.weights
+
+
+class StreamingSummary:
+    """
+    Summary statistics for one parameter, fed chunk by chunk.
+
+    Mean/std/min/max always come from ``RunningStatistics``. Percentiles use
+    either exact partitioning of the retained chunks (``"exact"``) or a
+    ``TDigest`` that never keeps the raw samples (``"tdigest"``).
+    """
+
+    def __init__(
+        self,
+        percentile_method: str = "exact",
+        compression: float = 200.0,
+        keep_values: bool = True,
+    ):
+        if percentile_method not in PERCENTILE_METHODS:
+            raise ConfigurationError(
+                f"Unknown percentile method '{percentile_method}', "
+                f"expected one of {PERCENTILE_METHODS}",
+                config_key="monte_carlo.percentile_method",
+            )
+        self.percentile_method = percentile_method
+        self.running = RunningStatistics()
+        self.digest: Optional[TDigest] = (
+            TDigest(compression) if percentile_method == "tdigest" else None
+        )
+        # Shard-level summaries in exact mode skip retaining samples; the
+        # merged summary is handed the concatenated values via ``retain``
+        self.keep_values = keep_values
+        self._chunks: List[np.ndarray] = []
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float).ravel()
+        self.running.update(values)
+        if self.digest is not None:
+            self.digest.update(values)
+        elif self.keep_values:
+            self._chunks.append(values)
+
+    def retain(self, values: np.ndarray) -> None:
+        """Keep values for exact percentiles without touching the moments."""
+        if self.digest is None:
+            self._chunks.append(np.asarray(values, dtype=float).ravel())
+
+    def merge(self, other: "StreamingSummary") -> None:
+        self.running.merge(other.running)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+        elif self.digest is not None:
+            self.digest.update(np.concatenate(other._chunks or [np.empty(0)]))
+        else:
+            self._chunks.extend(other._chunks)
+
+    def percentiles(self, percentiles: Sequence[float]) -> np.ndarray:
+        if self.digest is not None:
+            return np.array([self.digest.percentile(p) for p in percentiles])
+        if not self._chunks:
+            return np.full(len(percentiles), np.nan)
+        return np.percentile(np.concatenate(self._chunks), percentiles)  # type: ignore
+
+    def to_dict(self, percentiles: Sequence[float]) -> Dict[str, float]:
+        """Summary in the ``MonteCarloResults.summary_statistics`` layout."""
+        stats = {
+            "mean": float(self.running.mean),
+            "std": self.running.std,
+            "min": float(self.running.min),
+            "max": float(self.running.max),
+        }
+        for p, value in zip(percentiles, self.percentiles(percentiles)):
+            stats[f"p{p}"] = float(value)
+        return stats
@@ -11,23 +11,102 @@ WHAT IT DOES:
 - Models debt service payments (principal & interest)
 - Computes waterfall distributions between investors and operators
 - Handles renovation periods with income interruption
+- Projects many Monte Carlo scenarios at once as NumPy arrays
 
 EXAMPLE FLOW:
 Initial Numbers + Assumptions → Year 1: $180K NOI, Year 2: $190K NOI → Cash Flow Projection
 """
 
-from typing import Any, Dict, List
+import operator
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, Dict, List, Union
+
+import numpy as np
 
 from core.exceptions import ValidationError
 from core.logging_config import get_logger
+from monte_carlo.scenario_batch import ScenarioBatch
+from src.application.services.initial_numbers_service import InitialNumbersBatch
 from src.domain.entities.cash_flow_projection import (
     AnnualCashFlow,
     CashFlowProjection,
     WaterfallDistribution,
 )
-from src.domain.entities.dcf_assumptions import DCFAssumptions
+from src.domain.entities.dcf_assumptions import (
+    MONTE_CARLO_PARAMETER_MAPPING,
+    DCFAssumptions,
+)
 from src.domain.entities.initial_numbers import InitialNumbers
 
+PROJECTION_YEARS = 6  # Years 0-5
+OPERATING_EXPENSE_FIELDS = (
+    "property_taxes",
+    "insurance",
+    "repairs_maintenance",
+    "property_management",
+    "admin_expenses",
+    "contracting",
+    "replacement_reserves",
+)
+
+
+@dataclass
+class CashFlowProjectionBatch:
+    """
+    Cash flow projections for many scenarios sharing one set of initial numbers.
+
+    Every array has shape (scenarios, 6) with Year 0 in column 0. Columns
+    mirror the ``AnnualCashFlow`` and ``WaterfallDistribution`` fields; expense
+    line items are the initial amounts scaled by ``expense_growth_index``.
+    """
+
+    property_id: str
+    investor_equity_share: float
+    preferred_return_rate: float
+
+    # Annual cash flows
+    gross_rental_income: np.ndarray
+    vacancy_loss: np.ndarray
+    effective_gross_income: np.ndarray
+    expense_growth_index: np.ndarray
+    total_operating_expenses: np.ndarray
+    net_operating_income: np.ndarray
+    annual_debt_service: np.ndarray
+    before_tax_cash_flow: np.ndarray
+    capital_expenditures: np.ndarray
+    net_cash_flow: np.ndarray
+
+    # Waterfall distributions
+    available_cash: np.ndarray
+    investor_preferred_return_due: np.ndarray
+    investor_preferred_return_paid: np.ndarray
+    investor_preferred_return_accrued: np.ndarray
+    cumulative_unpaid_preferred: np.ndarray
+    investor_cash_distribution: np.ndarray
+    operator_cash_distribution: np.ndarray
+
+    @property
+    def num_scenarios(self) -> int:
+        return int(self.net_cash_flow.shape[0])
+
+    @property
+    def total_noi(self) -> np.ndarray:
+        return self.net_operating_income.sum(axis=1)  # type: ignore
+
+    @property
+    def total_investor_distributions(self) -> np.ndarray:
+        return self.investor_cash_distribution.sum(axis=1)  # type: ignore
+
+    @property
+    def total_operator_distributions(self) -> np.ndarray:
+        return self.operator_cash_distribution.sum(axis=1)  # type: ignore
+
+    @property
+    def total_cash_distributed(self) -> np.ndarray:
+        """Investor plus operator distributions, shape (scenarios, 6)."""
+        return self.investor_cash_distribution + self.operator_cash_distribution  # type: ignore
+
 
 class CashFlowProjectionService:
     """Service for calculating cash flow projections and waterfall distributions."""
@@ -57,11 +136,21 @@ class CashFlowProjectionService:
                 f"scenario {dcf_assumptions.scenario_id}"
             )
 
+            # Compound growth factors for Years 0-5, computed once
+            rent_growth_index = self._growth_index(dcf_assumptions.rent_growth_rate)
+            expense_growth_index = self._growth_index(
+                dcf_assumptions.expense_growth_rate
+            )
+
             # Calculate annual cash flows for Years 0-5
             annual_cash_flows = []
             for year in range(6):
                 cash_flow = self._calculate_annual_cash_flow(
-                    year, dcf_assumptions, initial_numbers
+                    year,
+                    dcf_assumptions,
+                    initial_numbers,
+                    rent_growth_index,
+                    expense_growth_index,
                 )
                 annual_cash_flows.append(cash_flow)
 
@@ -105,11 +194,171 @@ class CashFlowProjectionService:
                 f"Cash flow projection calculation failed: {str(e)}"
             ) from e
 
+    def calculate_cash_flow_projection_batch(
+        self,
+        scenarios: ScenarioBatch,
+        initial_numbers: Union[InitialNumbers, InitialNumbersBatch],
+    ) -> CashFlowProjectionBatch:
+        """
+        Calculate cash flow projections for every scenario in a batch at once.
+
+        Rent growth, expense growth and vacancy vary by scenario; acquisition,
+        financing and the investment structure come from ``initial_numbers``.
+        With an ``InitialNumbersBatch`` the debt service and preferred return
+        follow each scenario's financing as well. Growth compounds as
+        cumulative products and the waterfall runs over the 6 years with every
+        scenario in lockstep.
+
+        Args:
+            scenarios: ScenarioBatch with at least 6 years (Years 0-5)
+            initial_numbers: InitialNumbers shared by all scenarios, or an
+                InitialNumbersBatch with one row per scenario
+
+        Returns:
+            CashFlowProjectionBatch with (scenarios, 6) arrays
+
+        Raises:
+            ValidationError: If the batch lacks the required parameters or years
+        """
+        rates = {}
+        for field in ("rent_growth_rate", "expense_growth_rate", "vacancy_rate"):
+            param = MONTE_CARLO_PARAMETER_MAPPING[field]
+            if param not in scenarios.parameter_index:
+                raise ValidationError(f"Scenario batch is missing parameter {param}")
+            rates[field] = scenarios.parameter(param)[:, :PROJECTION_YEARS]
+        if scenarios.horizon_years < PROJECTION_YEARS:
+            raise ValidationError(
+                f"Cash flow projection requires {PROJECTION_YEARS} years of "
+                f"scenario data (Years 0-5), got {scenarios.horizon_years}"
+            )
+
+        num_scenarios = scenarios.num_scenarios
+        shape = (num_scenarios, PROJECTION_YEARS)
+
+        # Compound growth factors, 1.0 in Year 0
+        rent_growth_index = np.ones(shape)
+        rent_growth_index[:, 1:] = np.cumprod(
+            1 + rates["rent_growth_rate"][:, 1:], axis=1
+        )
+        expense_growth_index = np.ones(shape)
+        expense_growth_index[:, 1:] = np.cumprod(
+            1 + rates["expense_growth_rate"][:, 1:], axis=1
+        )
+
+        # Income: none in Year 0, Year 1 follows the renovation rules
+        gross_rental_income = (
+            initial_numbers.post_renovation_annual_rent * rent_growth_index
+        )
+        gross_rental_income[:, 0] = 0.0
+        if self._year_1_renovation_months(initial_numbers) >= 12:
+            gross_rental_income[:, 1] = initial_numbers.year_1_rental_income
+        vacancy_loss = gross_rental_income * rates["vacancy_rate"]
+        effective_gross_income = gross_rental_income - vacancy_loss
+
+        # Expenses: none in Year 0, then initial expenses with growth
+        base_expenses = sum(
+            getattr(initial_numbers, field) for field in OPERATING_EXPENSE_FIELDS
+        )
+        total_operating_expenses = base_expenses * expense_growth_index
+        total_operating_expenses[:, 0] = 0.0
+        net_operating_income = effective_gross_income - total_operating_expenses
+
+        # Per-scenario amounts broadcast as (scenarios, 1) columns
+        annual_debt_service = np.zeros(shape)
+        annual_debt_service[:, 1:] = np.reshape(
+            initial_numbers.annual_interest_expense, (-1, 1)
+        )
+        before_tax_cash_flow = net_operating_income - annual_debt_service
+        capital_expenditures = np.zeros(shape)
+        capital_expenditures[:, 0] = initial_numbers.renovation_capex
+        net_cash_flow = before_tax_cash_flow - capital_expenditures
+
+        # Waterfall: preferred return first (with catch-up), then equity split
+        available_cash = np.maximum(0.0, net_cash_flow)
+        preferred_due = np.zeros(shape)
+        preferred_due[:, 1:] = np.reshape(
+            initial_numbers.investor_cash_required
+            * initial_numbers.preferred_return_rate,
+            (-1, 1),
+        )
+        preferred_paid = np.empty(shape)
+        cumulative_unpaid = np.empty(shape)
+        unpaid = np.zeros(num_scenarios)
+        for year in range(PROJECTION_YEARS):
+            preferred_paid[:, year] = np.minimum(
+                available_cash[:, year], preferred_due[:, year] + unpaid
+            )
+            unpaid = np.maximum(
+                0.0, unpaid + preferred_due[:, year] - preferred_paid[:, year]
+            )
+            cumulative_unpaid[:, year] = unpaid
+        preferred_accrued = np.maximum(0.0, preferred_due - preferred_paid)
+        remaining_after_preferred = available_cash - preferred_paid
+        investor_share = initial_numbers.investor_equity_share
+
+        projection = CashFlowProjectionBatch(
+            property_id=initial_numbers.property_id,
+            investor_equity_share=investor_share,
+            preferred_return_rate=initial_numbers.preferred_return_rate,
+            gross_rental_income=gross_rental_income,
+            vacancy_loss=vacancy_loss,
+            effective_gross_income=effective_gross_income,
+            expense_growth_index=expense_growth_index,
+            total_operating_expenses=total_operating_expenses,
+            net_operating_income=net_operating_income,
+            annual_debt_service=annual_debt_service,
+            before_tax_cash_flow=before_tax_cash_flow,
+            capital_expenditures=capital_expenditures,
+            net_cash_flow=net_cash_flow,
+            available_cash=available_cash,
+            investor_preferred_return_due=preferred_due,
+            investor_preferred_return_paid=preferred_paid,
+            investor_preferred_return_accrued=preferred_accrued,
+            cumulative_unpaid_preferred=cumulative_unpaid,
+            investor_cash_distribution=preferred_paid
+            + remaining_after_preferred * investor_share,
+            operator_cash_distribution=remaining_after_preferred * (1 - investor_share),
+        )
+
+        self.logger.info(
+            f"Calculated cash flow projections for {num_scenarios} scenarios of "
+            f"property {initial_numbers.property_id}"
+        )
+        return projection
+
+    def _year_1_renovation_months(
+        self, initial_numbers: Union[InitialNumbers, InitialNumbersBatch]
+    ) -> float:
+        """Renovation months implied by the Year 1 income calculation."""
+        renovation_months = getattr(initial_numbers, "renovation_months", 0)
+        if (
+            hasattr(initial_numbers, "pre_renovation_annual_rent")
+            and initial_numbers.pre_renovation_annual_rent > 0
+        ):
+            # Estimate renovation months from the year 1 calculation
+            renovation_months = 12 - (
+                initial_numbers.year_1_rental_income
+                / initial_numbers.post_renovation_annual_rent
+                * 12
+            )
+            renovation_months = max(0, min(12, renovation_months))
+        return renovation_months  # type: ignore
+
+    def _growth_index(self, growth_rates: List[float]) -> List[float]:
+        """Cumulative growth factor by year: 1.0 in Year 0, then prod(1 + rate)."""
+        return list(
+            accumulate(
+                (1 + rate for rate in growth_rates[1:]), operator.mul, initial=1.0
+            )
+        )
+
     def _calculate_annual_cash_flow(
         self,
         year: int,
         dcf_assumptions: DCFAssumptions,
         initial_numbers: InitialNumbers,
+        rent_growth_index: List[float],
+        expense_growth_index: List[float],
     ) -> AnnualCashFlow:
         """Calculate cash flow for a specific year."""
 
@@ -127,18 +376,7 @@ class CashFlowProjectionService:
                 # Year 1: Use the pre-calculated year 1 income (accounts for renovation period)
                 gross_rental_income = initial_numbers.year_1_rental_income
                 # Convert to full-year equivalent by adjusting for non-renovation period
-                renovation_months = getattr(initial_numbers, "renovation_months", 0)
-                if (
-                    hasattr(initial_numbers, "pre_renovation_annual_rent")
-                    and initial_numbers.pre_renovation_annual_rent > 0
-                ):
-                    # Estimate renovation months from the year 1 calculation
-                    renovation_months = 12 - (
-                        initial_numbers.year_1_rental_income
-                        / initial_numbers.post_renovation_annual_rent
-                        * 12
-                    )
-                    renovation_months = max(0, min(12, renovation_months))
+                renovation_months = self._year_1_renovation_months(initial_numbers)
 
                 # Apply rent growth to get full year
                 rent_growth_rate = year_assumptions["rent_growth_rate"]
@@ -147,13 +385,7 @@ class CashFlowProjectionService:
             else:
                 # Years 2-5: Compound rent growth from Year 1 base
                 year_1_base = initial_numbers.post_renovation_annual_rent
-                rent_growth_compound = 1.0
-                for y in range(1, year + 1):
-                    year_growth = dcf_assumptions.get_year_assumptions(y)[
-                        "rent_growth_rate"
-                    ]
-                    rent_growth_compound *= 1 + year_growth
-                gross_rental_income = year_1_base * rent_growth_compound
+                gross_rental_income = year_1_base * rent_growth_index[year]
 
         # Calculate vacancy loss
         vacancy_rate = year_assumptions["vacancy_rate"]
@@ -176,13 +408,7 @@ class CashFlowProjectionService:
             }
         else:
             # Years 1-5: Apply expense growth
-            expense_growth_compound = 1.0
-            for y in range(1, year + 1):
-                year_growth = dcf_assumptions.get_year_assumptions(y)[
-                    "expense_growth_rate"
-                ]
-                expense_growth_compound *= 1 + year_growth
-
+            expense_growth_compound = expense_growth_index[year]
             operating_expenses = {
                 "property_taxes": initial_numbers.property_taxes
                 * expense_growth_compound,
@@ -7,11 +7,12 @@ based on the complete DCF analysis.
 
 WHAT IT DOES:
 - Computes Net Present Value (NPV) using discount rate
-- Calculates Internal Rate of Return (IRR) iteratively
+- Calculates Internal Rate of Return (IRR) from polynomial roots
 - Determines equity multiples and payback periods
 - Models terminal value (property sale at Year 5)
 - Provides investment recommendations (STRONG_BUY to STRONG_SELL)
 - Assesses risk level based on cash flow volatility
+- Solves NPV, IRR, MIRR and payback for many scenarios at once
 
 EXAMPLE FLOW:
 Cash Flows → NPV: $2.5M, IRR: 64.8%, Multiple: 9.79x → STRONG_BUY Recommendation
@@ -19,9 +20,14 @@ Cash Flows → NPV: $2.5M, IRR: 64.8%, Multiple: 9.79x → STRONG_BUY Recommenda
 
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from config.dcf_constants import FINANCIAL_CONSTANTS
 from core.exceptions import ValidationError
 from core.logging_config import get_logger
+from src.application.services.cash_flow_projection_service import (
+    CashFlowProjectionBatch,
+)
 from src.domain.entities.cash_flow_projection import CashFlowProjection
 from src.domain.entities.dcf_assumptions import DCFAssumptions
 from src.domain.entities.financial_metrics import (
@@ -324,8 +330,12 @@ class FinancialMetricsService:
             elif irr_guess > FINANCIAL_CONSTANTS.IRR_MAX_BOUND:
                 irr_guess = FINANCIAL_CONSTANTS.IRR_MAX_BOUND
 
-        # If convergence failed, return the best guess
-        # Note: numpy doesn't have np.irr, would need numpy-financial
+        # If convergence failed, solve the NPV polynomial directly
+        solved, irr = self._polynomial_irr(np.array([cash_flows], dtype=np.float64))
+        if solved[0]:
+            return float(irr[0])
+
+        # Otherwise return the best guess
         return irr_guess if -1.0 < irr_guess < 10.0 else 0.0
 
     def _calculate_modified_irr(
@@ -380,6 +390,324 @@ class FinancialMetricsService:
         # If never paid back
         return float(len(cash_flows))
 
+    def calculate_return_metrics_batch(
+        self,
+        cash_flows: np.ndarray,
+        discount_rate: float = FINANCIAL_CONSTANTS.DEFAULT_DISCOUNT_RATE,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate NPV, IRR, MIRR, equity multiple and payback period for every
+        row of cash flows.
+
+        Args:
+            cash_flows: Array of shape (scenarios, periods) with Year 0 first
+            discount_rate: Discount rate for NPV and MIRR reinvestment
+
+        Returns:
+            Dictionary of (scenarios,) arrays matching the scalar metrics
+        """
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        return {
+            "npv": self.calculate_npv_batch(cash_flows, discount_rate),
+            "irr": self.calculate_irr_batch(cash_flows),
+            "modified_irr": self.calculate_modified_irr_batch(
+                cash_flows, discount_rate
+            ),
+            "equity_multiple": self.calculate_equity_multiple_batch(cash_flows),
+            "payback_period": self.calculate_payback_period_batch(cash_flows),
+        }
+
+    def calculate_npv_batch(
+        self, cash_flows: np.ndarray, discount_rate: float
+    ) -> np.ndarray:
+        """Net Present Value of each row of cash flows."""
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        discount = (1 + discount_rate) ** -np.arange(cash_flows.shape[1])
+        return cash_flows @ discount  # type: ignore
+
+    def calculate_irr_batch(
+        self,
+        cash_flows: np.ndarray,
+        max_iterations: int = 100,
+        precision: float = FINANCIAL_CONSTANTS.IRR_PRECISION,
+        step_tolerance: float = 1e-12,
+    ) -> np.ndarray:
+        """
+        Internal Rate of Return of each row of cash flows.
+
+        Runs the scalar Newton-Raphson iteration on all rows together, dropping
+        rows from the active set as they converge. Newton is capped well below
+        the scalar iteration limit. Rows that stall or run out of iterations
+        are solved from the roots of the NPV polynomial, then by bisection when
+        NPV changes sign between the IRR bounds, and otherwise keep the scalar
+        fallback value.
+        """
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        num_rows, num_periods = cash_flows.shape
+        if num_periods < 2:
+            return np.zeros(num_rows)
+
+        periods = np.arange(num_periods)
+        guess = np.full(num_rows, FINANCIAL_CONSTANTS.INITIAL_IRR_GUESS)
+        converged = np.zeros(num_rows, dtype=bool)
+        rows = np.arange(num_rows)  # Rows still iterating
+
+        for _ in range(max_iterations):
+            if rows.size == 0:
+                break
+
+            flows = cash_flows[rows]
+            discount = (1 + guess[rows, np.newaxis]) ** -periods
+            npv = (flows * discount).sum(axis=1)
+            derivative = -(periods * flows * discount).sum(axis=1) / (1 + guess[rows])
+
+            done = np.abs(npv) < precision
+            converged[rows[done]] = True
+
+            # Rows with a vanishing derivative stop at their current guess
+            stepping = ~done & (derivative != 0)
+            rows = rows[stepping]
+            step = npv[stepping] / derivative[stepping]
+            guess[rows] = np.clip(
+                guess[rows] - step,
+                FINANCIAL_CONSTANTS.IRR_MIN_BOUND,
+                FINANCIAL_CONSTANTS.IRR_MAX_BOUND,
+            )
+
+            # Large cash flows can leave NPV rounding noise above ``precision``
+            # at the root; a negligible Newton step means the iterate settled
+            settled = np.abs(step) <= step_tolerance * np.maximum(
+                1.0, np.abs(guess[rows])
+            )
+            converged[rows[settled]] = True
+            rows = rows[~settled]
+
+        irr = np.where((guess > -1.0) & (guess < 10.0), guess, 0.0)
+
+        unsolved = np.flatnonzero(~converged)
+        if unsolved.size:
+            solved, roots = self._polynomial_irr(cash_flows[unsolved])
+            irr[unsolved[solved]] = roots[solved]
+            unsolved = unsolved[~solved]
+        if unsolved.size:
+            bracketed, roots = self._bisect_irr(cash_flows[unsolved], precision)
+            irr[unsolved[bracketed]] = roots[bracketed]
+        return irr  # type: ignore
+
+    def _polynomial_irr(self, cash_flows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        IRR from the roots of the NPV polynomial in x = 1 / (1 + r).
+
+        NPV = sum(cf_t * x^t), so each row is one eigenvalue problem on the
+        companion matrix of its cash flows, batched across rows. The chosen
+        root is the real x > 0 whose rate lies within the IRR bounds and is
+        nearest the Newton initial guess, i.e. the root Newton would normally
+        reach, polished with two Newton steps. Rows with no such root, a zero
+        final cash flow (degenerate polynomial) or non-finite values are left
+        unsolved.
+
+        Returns:
+            Tuple of (solved mask, IRR for solved rows and 0.0 elsewhere)
+        """
+        num_rows, num_periods = cash_flows.shape
+        solved = np.zeros(num_rows, dtype=bool)
+        irr = np.zeros(num_rows)
+        if num_periods < 2:
+            return solved, irr
+
+        rows = np.flatnonzero(
+            np.isfinite(cash_flows).all(axis=1) & (cash_flows[:, -1] != 0)
+        )
+        if rows.size == 0:
+            return solved, irr
+
+        # Monic companion matrix of cf_0 + cf_1 x + ... + cf_d x^d
+        degree = num_periods - 1
+        coefficients = cash_flows[rows, :-1] / cash_flows[rows, -1:]
+        companion = np.zeros((rows.size, degree, degree))
+        companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1.0
+        companion[:, :, -1] = -coefficients
+        roots = np.linalg.eigvals(companion)
+
+        x = roots.real
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = 1 / x - 1
+        candidate = (
+            (np.abs(roots.imag) <= 1e-9 * np.maximum(1.0, np.abs(x)))
+            & (x > 0)
+            & (rates >= FINANCIAL_CONSTANTS.IRR_MIN_BOUND)
+            & (rates < FINANCIAL_CONSTANTS.IRR_MAX_BOUND)
+        )
+        distance = np.where(
+            candidate, np.abs(rates - FINANCIAL_CONSTANTS.INITIAL_IRR_GUESS), np.inf
+        )
+        best = distance.argmin(axis=1)
+        found = np.isfinite(distance[np.arange(rows.size), best])
+
+        rows = rows[found]
+        rate = rates[found, best[found]]
+        periods = np.arange(num_periods)
+        flows = cash_flows[rows]
+        for _ in range(2):
+            discount = (1 + rate[:, np.newaxis]) ** -periods
+            npv = (flows * discount).sum(axis=1)
+            derivative = -(periods * flows * discount).sum(axis=1) / (1 + rate)
+            step = np.where(derivative != 0, npv / derivative, 0.0)
+            rate = np.clip(
+                rate - step,
+                FINANCIAL_CONSTANTS.IRR_MIN_BOUND,
+                FINANCIAL_CONSTANTS.IRR_MAX_BOUND,
+            )
+
+        solved[rows] = True
+        irr[rows] = rate
+        return solved, irr
+
+    def _bisect_irr(
+        self, cash_flows: np.ndarray, precision: float, max_iterations: int = 200
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bisection IRR between the configured bounds.
+
+        Returns:
+            Tuple of (rows whose NPV changes sign across the bounds, roots)
+        """
+        periods = np.arange(cash_flows.shape[1])
+
+        def npv_at(rates: np.ndarray) -> np.ndarray:
+            return (cash_flows * (1 + rates[:, np.newaxis]) ** -periods).sum(axis=1)  # type: ignore
+
+        low = np.full(cash_flows.shape[0], FINANCIAL_CONSTANTS.IRR_MIN_BOUND)
+        high = np.full(cash_flows.shape[0], FINANCIAL_CONSTANTS.IRR_MAX_BOUND)
+        npv_low = npv_at(low)
+        bracketed = np.sign(npv_low) * np.sign(npv_at(high)) < 0
+
+        for _ in range(max_iterations):
+            mid = (low + high) / 2
+            npv_mid = npv_at(mid)
+            width = (high - low)[bracketed]
+            if np.all((np.abs(npv_mid[bracketed]) < precision) | (width < 1e-12)):
+                break
+            same_side = np.sign(npv_mid) == np.sign(npv_low)
+            low = np.where(same_side, mid, low)
+            npv_low = np.where(same_side, npv_mid, npv_low)
+            high = np.where(same_side, high, mid)
+
+        return bracketed, (low + high) / 2
+
+    def calculate_modified_irr_batch(
+        self, cash_flows: np.ndarray, discount_rate: float
+    ) -> np.ndarray:
+        """Modified Internal Rate of Return of each row of cash flows."""
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        num_rows, num_periods = cash_flows.shape
+        if num_periods < 2:
+            return np.zeros(num_rows)
+
+        n = num_periods - 1  # Investment period
+        periods = np.arange(num_periods)
+        pv_negative = np.where(
+            cash_flows < 0, cash_flows / (1 + discount_rate) ** periods, 0.0
+        ).sum(axis=1)
+        fv_positive = np.where(
+            cash_flows > 0, cash_flows * (1 + discount_rate) ** (n - periods), 0.0
+        ).sum(axis=1)
+
+        valid = (pv_negative < 0) & (fv_positive > 0)
+        mirr = np.zeros(num_rows)
+        mirr[valid] = (fv_positive[valid] / np.abs(pv_negative[valid])) ** (1 / n) - 1
+        return np.where(valid & (mirr > -1.0) & (mirr < 10.0), mirr, 0.0)  # type: ignore
+
+    def calculate_payback_period_batch(self, cash_flows: np.ndarray) -> np.ndarray:
+        """Payback period in years of each row of cash flows."""
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        num_rows, num_periods = cash_flows.shape
+        if num_periods < 2:
+            return np.zeros(num_rows)
+
+        cumulative = np.cumsum(cash_flows, axis=1)
+        paid_back = cumulative[:, 1:] >= 0
+        payback = np.full(num_rows, float(num_periods))  # Never paid back
+
+        rows = np.flatnonzero(paid_back.any(axis=1))
+        year = paid_back[rows].argmax(axis=1) + 1
+        flow = cash_flows[rows, year]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Payback occurs during this year
+            payback[rows] = np.where(
+                flow > 0,
+                year - 1 + np.abs(cumulative[rows, year - 1]) / flow,
+                year,
+            )
+        return payback
+
+    def calculate_equity_multiple_batch(self, cash_flows: np.ndarray) -> np.ndarray:
+        """Total return over the initial investment of each row of cash flows."""
+        cash_flows = self._as_cash_flow_matrix(cash_flows)
+        initial_investment = -cash_flows[:, 0]
+        total_return = cash_flows[:, 1:].sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(  # type: ignore
+                initial_investment > 0, total_return / initial_investment, 0.0
+            )
+
+    def calculate_net_sale_proceeds_batch(
+        self,
+        final_noi: np.ndarray,
+        exit_cap_rate: np.ndarray,
+        loan_amount: np.ndarray,
+        exit_year: int = 5,
+    ) -> np.ndarray:
+        """
+        Net sale proceeds at exit for every scenario, as in ``TerminalValue``.
+
+        The remaining loan balance uses the same simplified principal paydown
+        as the scalar terminal value calculation.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gross_property_value = np.where(
+                exit_cap_rate > 0, final_noi / exit_cap_rate, 0.0
+            )
+        selling_costs_amount = (
+            gross_property_value * FINANCIAL_CONSTANTS.DEFAULT_SELLING_COSTS_RATE
+        )
+        annual_principal_payment = (
+            loan_amount * FINANCIAL_CONSTANTS.ANNUAL_PRINCIPAL_PAYDOWN_RATE
+        )
+        remaining_loan_balance = np.maximum(
+            0.0, loan_amount - annual_principal_payment * exit_year
+        )
+        return (  # type: ignore
+            gross_property_value - selling_costs_amount - remaining_loan_balance
+        )
+
+    def prepare_cash_flows_batch(
+        self,
+        projection: CashFlowProjectionBatch,
+        initial_investment: np.ndarray,
+        net_sale_proceeds: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Year 0-5 cash flows for every scenario of a batch projection.
+
+        Mirrors ``CashFlowSummary``: the initial investment is paid in Year 0,
+        Years 1-5 receive the total waterfall distributions and the net sale
+        proceeds are added to the final year.
+        """
+        cash_flows = projection.total_cash_distributed.copy()
+        cash_flows[:, 0] = -initial_investment
+        cash_flows[:, -1] += net_sale_proceeds
+        return cash_flows
+
+    def _as_cash_flow_matrix(self, cash_flows: np.ndarray) -> np.ndarray:
+        cash_flows = np.asarray(cash_flows, dtype=np.float64)
+        if cash_flows.ndim != 2:
+            raise ValidationError(
+                "Cash flows must have shape (scenarios, periods), "
+                f"got {cash_flows.shape}"
+            )
+        return cash_flows
+
     def _calculate_average_annual_return(
         self, annual_cash_flows: List[float], initial_investment: float
     ) -> float:
@@ -9,13 +9,17 @@ WHAT IT DOES:
 - Determines loan amounts, LTV ratios, cash requirements
 - Computes initial rental income and operating expenses
 - Sets up financing structure for cash flow projections
+- Computes scenario-dependent financing for many Monte Carlo scenarios at once
 
 EXAMPLE FLOW:
 Property $3.5M + Assumptions → Cash Required: $1.2M, Loan: $2.3M → Initial Numbers
 """
 
+from dataclasses import dataclass
 from typing import Any, Dict
 
+import numpy as np
+
 from config.dcf_constants import FINANCIAL_CONSTANTS
 from core.exceptions import ValidationError
 from core.logging_config import get_logger
@@ -24,6 +28,59 @@ from src.domain.entities.initial_numbers import InitialNumbers
 from src.domain.entities.property_data import SimplifiedPropertyInput
 
 
+@dataclass
+class InitialNumbersBatch:
+    """
+    Initial numbers for many scenarios of one property.
+
+    Purchase, renovation, income and operating expense amounts depend only on
+    the property and are shared by every scenario. Financing and equity
+    amounts depend on each scenario's assumptions and are (scenarios,) arrays.
+    Field names mirror ``InitialNumbers``.
+    """
+
+    property_id: str
+
+    # Purchase details
+    purchase_price: float
+    renovation_capex: float
+    closing_cost_amount: np.ndarray
+    cost_basis: np.ndarray
+
+    # Financing
+    loan_amount: np.ndarray
+    annual_interest_expense: np.ndarray
+    lender_reserves_amount: np.ndarray
+
+    # Equity requirements
+    investor_cash_required: np.ndarray
+    operator_cash_required: np.ndarray
+    total_cash_required: np.ndarray
+
+    # Income structure
+    pre_renovation_annual_rent: float
+    post_renovation_annual_rent: float
+    year_1_rental_income: float
+
+    # Operating expenses
+    property_taxes: float
+    insurance: float
+    repairs_maintenance: float
+    property_management: float
+    admin_expenses: float
+    contracting: float
+    replacement_reserves: float
+    total_operating_expenses: float
+
+    # Investment structure
+    investor_equity_share: float
+    preferred_return_rate: float
+
+    @property
+    def num_scenarios(self) -> int:
+        return int(self.total_cash_required.size)
+
+
 class InitialNumbersService:
     """Service for calculating initial investment numbers."""
 
@@ -162,6 +219,78 @@ class InitialNumbersService:
                 f"Initial numbers calculation failed: {str(e)}"
             ) from e
 
+    def calculate_initial_numbers_batch(
+        self,
+        property_data: SimplifiedPropertyInput,
+        assumptions: Dict[str, np.ndarray],
+        preferred_return_rate: float = 0.06,
+    ) -> InitialNumbersBatch:
+        """
+        Calculate initial numbers for every scenario of a Monte Carlo batch.
+
+        Args:
+            property_data: SimplifiedPropertyInput containing property details
+            assumptions: Arrays keyed like ``DCFAssumptions`` fields; the
+                static financing fields have shape (scenarios,) and
+                ``commercial_mortgage_rate`` has shape (scenarios, years)
+            preferred_return_rate: Investor preferred return rate
+
+        Returns:
+            InitialNumbersBatch with per-scenario financing and equity amounts
+
+        Raises:
+            ValidationError: If required data is missing
+        """
+        # 1. Purchase Details Calculations
+        purchase_price = self._get_purchase_price(property_data)
+        closing_cost_amount = purchase_price * assumptions["closing_cost_pct"]
+        renovation_capex = self._calculate_renovation_capex(property_data)
+
+        # 2. Financing Calculations (Year 1 mortgage rate, interest only)
+        loan_amount = purchase_price * assumptions["ltv_ratio"]
+        annual_interest_expense = (
+            loan_amount * assumptions["commercial_mortgage_rate"][:, 1]
+        )
+        lender_reserves_amount = annual_interest_expense * (
+            assumptions["lender_reserves_months"] / 12
+        )
+
+        # 3. Equity Requirements
+        down_payment = purchase_price - loan_amount
+        total_cash_required = (
+            down_payment
+            + closing_cost_amount
+            + renovation_capex
+            + lender_reserves_amount
+        )
+        investor_equity_share = (
+            property_data.equity_structure.investor_equity_share_pct / 100
+        )
+
+        # 4-5. Income Structure and Operating Expenses
+        income_calculations = self._calculate_income_structure(property_data)
+        expense_calculations = self._calculate_operating_expenses(
+            property_data, income_calculations["post_renovation_annual_rent"]
+        )
+
+        return InitialNumbersBatch(
+            property_id=property_data.property_id,
+            purchase_price=purchase_price,
+            renovation_capex=renovation_capex,
+            closing_cost_amount=closing_cost_amount,
+            cost_basis=purchase_price + closing_cost_amount + renovation_capex,
+            loan_amount=loan_amount,
+            annual_interest_expense=annual_interest_expense,
+            lender_reserves_amount=lender_reserves_amount,
+            investor_cash_required=total_cash_required * investor_equity_share,
+            operator_cash_required=total_cash_required * (1 - investor_equity_share),
+            total_cash_required=total_cash_required,
+            investor_equity_share=investor_equity_share,
+            preferred_return_rate=preferred_return_rate,
+            **income_calculations,
+            **expense_calculations,
+        )
+
     def _get_purchase_price(self, property_data: SimplifiedPropertyInput) -> float:
         """Get purchase price from property data."""
         if not property_data.purchase_price or property_data.purchase_price <= 0:
@@ -0,0 +1,352 @@
+"""
+Monte Carlo DCF Service - PHASES 1-4 in batch
+
+BUSINESS PROCESS:
+Runs every Monte Carlo scenario through the full DCF workflow at once, turning
+a simulation into distributions of investment outcomes.
+
+WHAT IT DOES:
+- Maps the scenario tensor to DCF assumption arrays (Phase 1)
+- Computes scenario-dependent financing and cash requirements (Phase 2)
+- Projects Year 0-5 cash flows with cumulative growth products (Phase 3)
+- Calculates NPV, IRR and equity multiple for every scenario (Phase 4)
+- Summarizes outcome distributions, value at risk and expected shortfall
+
+Scenarios whose assumptions fail the ``DCFAssumptions`` validation rules are
+flagged invalid and excluded from the distributions, matching the scalar batch
+workflow that skips them.
+
+EXAMPLE FLOW:
+10,000 Scenarios → NPV/IRR/Multiple arrays → IRR p5: 4.1%, ES(5%): 1.8%
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.dcf_constants import FINANCIAL_CONSTANTS
+from core.exceptions import ValidationError
+from core.logging_config import get_logger
+from monte_carlo.scenario_batch import ScenarioBatch
+from src.application.services.cash_flow_projection_service import (
+    CashFlowProjectionService,
+)
+from src.application.services.financial_metrics_service import FinancialMetricsService
+from src.application.services.initial_numbers_service import InitialNumbersService
+from src.domain.entities.dcf_assumptions import (
+    FORECAST_PARAMETER_RANGES,
+    MONTE_CARLO_PARAMETER_MAPPING,
+    STATIC_PARAMETER_RANGES,
+)
+from src.domain.entities.property_data import SimplifiedPropertyInput
+
+DCF_YEARS = 6  # Years 0-5
+OUTCOME_METRICS = ("npv", "irr", "equity_multiple")
+
+
+@dataclass
+class ScenarioDCFResults:
+    """DCF outcomes for every scenario of a Monte Carlo run."""
+
+    property_id: str
+    discount_rate: float
+    valid: np.ndarray  # (scenarios,) passed DCF assumption validation
+    cash_flows: np.ndarray  # (scenarios, 6) Year 0-5, terminal value in Year 5
+    initial_investment: np.ndarray  # (scenarios,) total cash required
+    npv: np.ndarray
+    irr: np.ndarray
+    equity_multiple: np.ndarray
+    market_scenario_codes: Optional[np.ndarray] = None
+
+    @classmethod
+    def concatenate(
+        cls, results: Sequence["ScenarioDCFResults"]
+    ) -> "ScenarioDCFResults":
+        """Join results for consecutive scenario chunks of one run."""
+        first = results[0]
+        market_codes = None
+        if first.market_scenario_codes is not None:
+            market_codes = np.concatenate(
+                [result.market_scenario_codes for result in results]  # type: ignore
+            )
+        return cls(
+            property_id=first.property_id,
+            discount_rate=first.discount_rate,
+            market_scenario_codes=market_codes,
+            **{
+                name: np.concatenate([getattr(result, name) for result in results])
+                for name in (
+                    "valid",
+                    "cash_flows",
+                    "initial_investment",
+                    *OUTCOME_METRICS,
+                )
+            },
+        )
+
+    @property
+    def num_scenarios(self) -> int:
+        return int(self.valid.size)
+
+    @property
+    def num_valid(self) -> int:
+        return int(self.valid.sum())
+
+    def metric(self, name: str) -> np.ndarray:
+        """Values of an outcome metric over the valid scenarios."""
+        if name not in OUTCOME_METRICS:
+            raise ValidationError(
+                f"Unknown DCF metric '{name}', expected one of {OUTCOME_METRICS}",
+                field_name="metric",
+                field_value=name,
+            )
+        return getattr(self, name)[self.valid]  # type: ignore
+
+    def distribution(
+        self, name: str, percentiles: Sequence[float] = (5, 25, 50, 75, 95)
+    ) -> Dict[str, float]:
+        """Mean, std, min, max and percentiles of an outcome metric."""
+        values = self.metric(name)
+        if values.size == 0:
+            return {}
+
+        stats = {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+        }
+        for p, value in zip(percentiles, np.percentile(values, percentiles)):
+            stats[f"p{p:g}"] = float(value)
+        return stats
+
+    def value_at_risk(self, name: str = "irr", confidence: float = 0.95) -> float:
+        """Lower-tail quantile of a metric at ``1 - confidence``."""
+        values = self.metric(name)
+        if values.size == 0:
+            return float("nan")
+        return float(np.percentile(values, (1 - confidence) * 100))
+
+    def expected_shortfall(self, name: str = "irr", confidence: float = 0.95) -> float:
+        """Mean of a metric over the scenarios at or below its value at risk."""
+        values = self.metric(name)
+        if values.size == 0:
+            return float("nan")
+        return float(values[values <= self.value_at_risk(name, confidence)].mean())
+
+    def risk_metrics(self, confidence: float = 0.95) -> Dict[str, float]:
+        """
+        Risk summary in the Monte Carlo API layout.
+
+        VaR, expected shortfall and volatility are measured on IRR. Maximum
+        drawdown is the worst total return on invested equity (equity multiple
+        minus one) across scenarios.
+        """
+        if self.num_valid == 0:
+            return {}
+
+        tail = int(round((1 - confidence) * 100))
+        npv = self.metric("npv")
+        return {
+            f"value_at_risk_{tail}": self.value_at_risk("irr", confidence),
+            f"expected_shortfall_{tail}": self.expected_shortfall("irr", confidence),
+            "maximum_drawdown": float(self.metric("equity_multiple").min() - 1),
+            "volatility": float(self.metric("irr").std()),
+            "probability_of_loss": float((npv < 0).mean()),
+        }
+
+
+class MonteCarloDCFService:
+    """Service for evaluating Monte Carlo scenarios through the DCF workflow."""
+
+    def __init__(
+        self,
+        initial_numbers_service: Optional[InitialNumbersService] = None,
+        financial_metrics_service: Optional[FinancialMetricsService] = None,
+        cash_flow_projection_service: Optional[CashFlowProjectionService] = None,
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.initial_numbers_service = (
+            initial_numbers_service or InitialNumbersService()
+        )
+        self.cash_flow_projection_service = (
+            cash_flow_projection_service or CashFlowProjectionService()
+        )
+        self.financial_metrics_service = (
+            financial_metrics_service or FinancialMetricsService()
+        )
+
+    def evaluate_scenarios(
+        self,
+        scenarios: ScenarioBatch,
+        property_data: SimplifiedPropertyInput,
+        discount_rate: float = FINANCIAL_CONSTANTS.DEFAULT_DISCOUNT_RATE,
+        preferred_return_rate: float = FINANCIAL_CONSTANTS.DEFAULT_PREFERRED_RETURN_RATE,
+    ) -> ScenarioDCFResults:
+        """
+        Run every scenario through DCF assumptions, initial numbers, cash flow
+        projection and financial metrics using array math.
+
+        Args:
+            scenarios: ScenarioBatch with at least 6 years (Years 0-5)
+            property_data: SimplifiedPropertyInput for the simulated property
+            discount_rate: Discount rate for NPV
+            preferred_return_rate: Investor preferred return rate
+
+        Returns:
+            ScenarioDCFResults with per-scenario cash flows and metrics
+
+        Raises:
+            ValidationError: If the batch or property data cannot support a DCF
+        """
+        assumptions = self._build_assumption_arrays(scenarios)
+        self._validate_investment_structure(property_data, preferred_return_rate)
+        valid = self._valid_scenarios(assumptions)
+
+        cash_flows, initial_investment, final_noi = self._project_cash_flows(
+            scenarios, assumptions, property_data, preferred_return_rate
+        )
+        # Scalar workflow rejects these in TerminalValue and CashFlowSummary
+        valid &= (final_noi >= 0) & (initial_investment > 0)
+
+        npv = self.financial_metrics_service.calculate_npv_batch(
+            cash_flows, discount_rate
+        )
+        irr = self.financial_metrics_service.calculate_irr_batch(cash_flows)
+        equity_multiple = (
+            self.financial_metrics_service.calculate_equity_multiple_batch(cash_flows)
+        )
+
+        results = ScenarioDCFResults(
+            property_id=property_data.property_id,
+            discount_rate=discount_rate,
+            valid=valid,
+            cash_flows=cash_flows,
+            initial_investment=initial_investment,
+            npv=npv,
+            irr=irr,
+            equity_multiple=equity_multiple,
+            market_scenario_codes=scenarios.market_scenario_codes,
+        )
+
+        self.logger.info(
+            f"Evaluated DCF for {results.num_valid}/{results.num_scenarios} "
+            f"scenarios of property {property_data.property_id}"
+        )
+        return results
+
+    def _build_assumption_arrays(
+        self, scenarios: ScenarioBatch
+    ) -> Dict[str, np.ndarray]:
+        """Phase 1: DCF assumption arrays keyed like ``DCFAssumptions`` fields."""
+        missing = [
+            name
+            for name in MONTE_CARLO_PARAMETER_MAPPING.values()
+            if name not in scenarios.parameter_index
+        ]
+        if missing:
+            raise ValidationError(
+                f"Monte Carlo validation failed: missing parameters {missing}"
+            )
+        if scenarios.horizon_years < DCF_YEARS:
+            raise ValidationError(
+                f"DCF requires {DCF_YEARS} years of scenario data (Years 0-5), "
+                f"got {scenarios.horizon_years}"
+            )
+
+        assumptions = {
+            field: scenarios.parameter(param)[:, :DCF_YEARS]
+            for field, param in MONTE_CARLO_PARAMETER_MAPPING.items()
+        }
+        # Static parameters use the first forecast year
+        assumptions["lender_reserves_months"] = assumptions.pop("lender_reserves")
+        for field in STATIC_PARAMETER_RANGES:
+            assumptions[field] = assumptions[field][:, 0]
+        return assumptions
+
+    def _validate_investment_structure(
+        self, property_data: SimplifiedPropertyInput, preferred_return_rate: float
+    ) -> None:
+        if not property_data.purchase_price or property_data.purchase_price <= 0:
+            raise ValidationError(
+                "Property purchase price is required and must be positive"
+            )
+        if not (0.0 <= preferred_return_rate <= 0.20):
+            raise ValidationError("Preferred return rate must be between 0% and 20%")
+
+    def _valid_scenarios(self, assumptions: Dict[str, np.ndarray]) -> np.ndarray:
+        """Scenarios whose assumptions pass the ``DCFAssumptions`` range rules."""
+        num_scenarios = assumptions["cap_rate"].shape[0]
+        valid = np.ones(num_scenarios, dtype=bool)
+        for field, (low, high) in FORECAST_PARAMETER_RANGES.items():
+            values = assumptions[field]
+            valid &= ((values >= low) & (values <= high)).all(axis=1)
+        for field, (low, high) in STATIC_PARAMETER_RANGES.items():
+            values = assumptions[field]
+            valid &= (values >= low) & (values <= high)
+        return valid
+
+    def _project_cash_flows(
+        self,
+        scenarios: ScenarioBatch,
+        assumptions: Dict[str, np.ndarray],
+        property_data: SimplifiedPropertyInput,
+        preferred_return_rate: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Phases 2-3: financing, cash requirements and Year 0-5 cash flows.
+
+        Returns:
+            Tuple of (cash flows (scenarios, 6), initial investment, Year 5 NOI)
+        """
+        initial_numbers = self.initial_numbers_service.calculate_initial_numbers_batch(
+            property_data, assumptions, preferred_return_rate
+        )
+        projection = (
+            self.cash_flow_projection_service.calculate_cash_flow_projection_batch(
+                scenarios, initial_numbers
+            )
+        )
+
+        # Phase 4 terminal value: Year 5 NOI at the Year 5 cap rate
+        final_noi = projection.net_operating_income[:, 5]
+        net_sale_proceeds = (
+            self.financial_metrics_service.calculate_net_sale_proceeds_batch(
+                final_noi, assumptions["cap_rate"][:, 5], initial_numbers.loan_amount
+            )
+        )
+        cash_flows = self.financial_metrics_service.prepare_cash_flows_batch(
+            projection, initial_numbers.total_cash_required, net_sale_proceeds
+        )
+        return cash_flows, initial_numbers.total_cash_required, final_noi
+
+    def summarize(
+        self,
+        results: ScenarioDCFResults,
+        percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+        confidence: float = 0.95,
+    ) -> Dict[str, Dict[str, float]]:
+        """Distributions of every outcome metric plus the risk metrics."""
+        summary: Dict[str, Dict[str, float]] = {
+            name: results.distribution(name, percentiles) for name in OUTCOME_METRICS
+        }
+        summary["risk_metrics"] = results.risk_metrics(confidence)
+        return summary
+
+
+def evaluate_monte_carlo_scenarios(
+    scenarios: ScenarioBatch,
+    property_data: SimplifiedPropertyInput,
+    discount_rate: float = FINANCIAL_CONSTANTS.DEFAULT_DISCOUNT_RATE,
+) -> ScenarioDCFResults:
+    """Convenience function to evaluate a scenario batch through the DCF."""
+    service = MonteCarloDCFService()
+    return service.evaluate_scenarios(scenarios, property_data, discount_rate)
+
+
+__all__: List[str] = [
+    "MonteCarloDCFService",
+    "ScenarioDCFResults",
+    "evaluate_monte_carlo_scenarios",
+]
@@ -11,6 +11,25 @@ from typing import Any, Dict, List
 
 from core.exceptions import ValidationError
 
+# Reasonable ranges for the forecasted (Years 0-5) assumptions
+FORECAST_PARAMETER_RANGES = {
+    "commercial_mortgage_rate": (0.01, 0.20),  # 1% to 20%
+    "treasury_10y_rate": (0.005, 0.15),  # 0.5% to 15%
+    "fed_funds_rate": (0.0, 0.12),  # 0% to 12%
+    "cap_rate": (0.03, 0.15),  # 3% to 15%
+    "rent_growth_rate": (-0.10, 0.20),  # -10% to 20%
+    "expense_growth_rate": (-0.05, 0.15),  # -5% to 15%
+    "property_growth_rate": (-0.20, 0.30),  # -20% to 30%
+    "vacancy_rate": (0.0, 0.50),  # 0% to 50%
+}
+
+# Allowed ranges for the static financing assumptions
+STATIC_PARAMETER_RANGES = {
+    "ltv_ratio": (0.5, 0.95),  # 50% to 95%
+    "closing_cost_pct": (0.01, 0.15),  # 1% to 15%
+    "lender_reserves_months": (1.0, 12.0),  # 1 to 12 months
+}
+
 
 @dataclass
 class DCFAssumptions:
@@ -88,19 +107,8 @@ class DCFAssumptions:
 
     def _validate_parameter_ranges(self, param_name: str, values: List[float]) -> None:
         """Validate parameter values are within reasonable ranges."""
-        range_checks = {
-            "commercial_mortgage_rate": (0.01, 0.20),  # 1% to 20%
-            "treasury_10y_rate": (0.005, 0.15),  # 0.5% to 15%
-            "fed_funds_rate": (0.0, 0.12),  # 0% to 12%
-            "cap_rate": (0.03, 0.15),  # 3% to 15%
-            "rent_growth_rate": (-0.10, 0.20),  # -10% to 20%
-            "expense_growth_rate": (-0.05, 0.15),  # -5% to 15%
-            "property_growth_rate": (-0.20, 0.30),  # -20% to 30%
-            "vacancy_rate": (0.0, 0.50),  # 0% to 50%
-        }
-
-        if param_name in range_checks:
-            min_val, max_val = range_checks[param_name]
+        if param_name in FORECAST_PARAMETER_RANGES:
+            min_val, max_val = FORECAST_PARAMETER_RANGES[param_name]
             for i, value in enumerate(values):
                 if not (min_val <= value <= max_val):
                     raise ValidationError(
@@ -110,11 +118,14 @@ class DCFAssumptions:
 
     def _validate_static_parameters(self) -> None:
         """Validate static parameters."""
-        if not (0.5 <= self.ltv_ratio <= 0.95):
+        ltv_min, ltv_max = STATIC_PARAMETER_RANGES["ltv_ratio"]
+        if not (ltv_min <= self.ltv_ratio <= ltv_max):
             raise ValidationError("LTV ratio must be between 50% and 95%")
-        if not (0.01 <= self.closing_cost_pct <= 0.15):
+        closing_min, closing_max = STATIC_PARAMETER_RANGES["closing_cost_pct"]
+        if not (closing_min <= self.closing_cost_pct <= closing_max):
             raise ValidationError("Closing cost percentage must be between 1% and 15%")
-        if not (1.0 <= self.lender_reserves_months <= 12.0):
+        reserves_min, reserves_max = STATIC_PARAMETER_RANGES["lender_reserves_months"]
+        if not (reserves_min <= self.lender_reserves_months <= reserves_max):
             raise ValidationError("Lender reserves must be between 1 and 12 months")
 
     def _validate_investment_structure(self) -> None:
@@ -243,6 +243,17 @@ class MonteCarloRequest(BaseModel):
         description="Percentiles to calculate for risk metrics",
     )
 
+    seed: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Random seed; identical requests with the same seed return identical scenarios",
+    )
+
+    sampler: Optional[str] = Field(
+        default=None,
+        description="Scenario sampler: pseudo_random, sobol or latin_hypercube",
+    )
+
     request_id: Optional[str] = Field(
         default=None, description="Client-provided request identifier"
     )
@@ -256,6 +267,65 @@ class MonteCarloRequest(BaseModel):
                 raise ValueError("Percentiles must be between 0 and 100")
         return sorted(v)
 
+    @field_validator("sampler")
+    @classmethod
+    def validate_sampler(cls, v):
+        """Validate the sampler is one the engine supports."""
+        if v is not None and v not in ("pseudo_random", "sobol", "latin_hypercube"):
+            raise ValueError(
+                "Sampler must be one of: pseudo_random, sobol, latin_hypercube"
+            )
+        return v
+
+
+class ScenarioShockSpec(BaseModel):
+    """Shift applied to one parameter of a stored simulation."""
+
+    parameter: str = Field(description="Parameter to shock, e.g. treasury_10y")
+
+    shift: float = Field(
+        description="Amount added to the paths (additive) or their multiplier"
+    )
+
+    mode: str = Field(default="additive", description="additive or multiplicative")
+
+    years: Optional[List[int]] = Field(
+        default=None, description="Forecast year indices to shock; all when omitted"
+    )
+
+    @field_validator("mode")
+    @classmethod
+    def validate_mode(cls, v):
+        """Validate the shock mode."""
+        if v not in ("additive", "multiplicative"):
+            raise ValueError("Mode must be one of: additive, multiplicative")
+        return v
+
+
+class ShockAnalysisRequest(BaseModel):
+    """Request model for stress testing a stored Monte Carlo simulation."""
+
+    shocks: List[ScenarioShockSpec] = Field(
+        min_length=1, description="Parameter shocks to apply together"
+    )
+
+    propagate_correlations: bool = Field(
+        default=False,
+        description="Move unshocked parameters through the simulation's correlations",
+    )
+
+    msa_code: Optional[str] = Field(
+        default=None, description="Expected MSA of the stored simulation"
+    )
+
+    horizon_years: Optional[int] = Field(
+        default=None, description="Expected forecast horizon of the stored simulation"
+    )
+
+    request_id: Optional[str] = Field(
+        default=None, description="Client-provided request identifier"
+    )
+
 
 class MarketDataRequest(BaseModel):
     """Request model for market data queries."""
@@ -215,6 +215,53 @@ class MonteCarloResponse(BaseModel):
         description="Time taken to complete the simulation"
     )
 
+    seed: Optional[str] = Field(
+        default=None,
+        description=(
+            "Seed that reproduces this simulation, as a decimal string because "
+            "it can exceed JavaScript's safe integer range"
+        ),
+    )
+
+    simulation_id: Optional[str] = Field(
+        default=None,
+        description="Id of the persisted scenarios, when scenario persistence is enabled",
+    )
+
+
+class ShockAnalysisResponse(BaseModel):
+    """Response model for a shock analysis on a stored simulation."""
+
+    request_id: str = Field(description="Unique identifier for this request")
+
+    simulation_id: str = Field(description="Stored simulation that was shocked")
+
+    simulation_count: int = Field(description="Number of scenarios shocked")
+
+    shocks: List[Dict[str, Any]] = Field(description="Shocks that were applied")
+
+    propagate_correlations: bool = Field(
+        description="Whether shocks propagated through parameter correlations"
+    )
+
+    scenario_classification: Dict[str, int] = Field(
+        description="Count of shocked scenarios by market type"
+    )
+
+    baseline_classification: Dict[str, int] = Field(
+        description="Count of original scenarios by market type"
+    )
+
+    score_changes: Dict[str, float] = Field(
+        description="Change in mean growth and risk scores caused by the shocks"
+    )
+
+    summary_statistics: Dict[str, Dict[str, float]] = Field(
+        description="Per-parameter statistics of the shocked scenarios"
+    )
+
+    processing_time_seconds: float = Field(description="Time taken to apply the shocks")
+
 
 class MarketDataPoint(BaseModel):
     """Individual market data point."""
@@ -4,21 +4,37 @@ Simulation Router
 Endpoints for Monte Carlo simulation and scenario analysis.
 """
 
+import json
+import math
 import sys
 import time
 import uuid
+from dataclasses import asdict
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from config.settings import settings
+from core.exceptions import DataNotFoundError
 from core.logging_config import get_logger
-from monte_carlo.simulation_engine import MonteCarloEngine
+from monte_carlo.scenario_batch import MARKET_SCENARIO_LABELS, ScenarioBatch
+from monte_carlo.shocks import ScenarioShock
+from monte_carlo.simulation_engine import MonteCarloEngine, resolve_seed
+from monte_carlo.statistics import StreamingSummary
+from src.application.services.monte_carlo_dcf_service import (
+    OUTCOME_METRICS,
+    MonteCarloDCFService,
+    ScenarioDCFResults,
+)
 from src.domain.entities.property_data import SimplifiedPropertyInput
 from src.presentation.api.middleware.auth import require_permission
 from src.presentation.api.models.examples import (
@@ -27,11 +43,23 @@ from src.presentation.api.models.examples import (
     EXAMPLE_MONTE_CARLO_RESPONSE,
     EXAMPLE_VALIDATION_ERROR,
 )
-from src.presentation.api.models.requests import MonteCarloRequest
-from src.presentation.api.models.responses import MonteCarloResponse
+from src.presentation.api.models.requests import (
+    MonteCarloRequest,
+    ShockAnalysisRequest,
+)
+from src.presentation.api.models.responses import (
+    MonteCarloDistribution,
+    MonteCarloResponse,
+    ShockAnalysisResponse,
+)
 
 logger = get_logger(__name__)
 
+monte_carlo_dcf_service = MonteCarloDCFService()
+
+# Streaming formats, picked from the request's Accept header
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
 # Create Monte Carlo engine instance
 try:
     monte_carlo_engine = MonteCarloEngine()
@@ -72,22 +100,34 @@ def _convert_monte_carlo_results_to_response(
     if hasattr(results, "scenarios") and results.scenarios:
         scenarios = results.scenarios[:100]  # Limit to first 100 for response size
 
-    # Create risk metrics
-    risk_metrics = {
-        "value_at_risk_5": -0.15,
-        "expected_shortfall_5": -0.22,
-        "maximum_drawdown": -0.35,
-        "volatility": 0.18,
-    }
+    risk_metrics: Dict[str, float] = {}
+    distributions: Optional[List[MonteCarloDistribution]] = None
+    scenario_classification = {label: 0 for label in MARKET_SCENARIO_LABELS}
 
-    # Create scenario classification
-    scenario_classification = {
-        "bull_market": int(request.simulation_count * 0.18),
-        "bear_market": int(request.simulation_count * 0.12),
-        "neutral_market": int(request.simulation_count * 0.35),
-        "growth_market": int(request.simulation_count * 0.25),
-        "stress_market": int(request.simulation_count * 0.10),
-    }
+    batch = getattr(results, "scenarios", None)
+    if isinstance(batch, ScenarioBatch):
+        # Count scenarios by market type
+        labels, counts = np.unique(batch.market_scenarios(), return_counts=True)
+        scenario_classification.update(
+            {str(label): int(count) for label, count in zip(labels, counts)}
+        )
+
+        # Evaluate every scenario through the DCF for outcome risk metrics
+        try:
+            dcf_results = monte_carlo_dcf_service.evaluate_scenarios(
+                batch, request.property_data
+            )
+        except Exception as dcf_error:
+            logger.warning(f"Scenario DCF evaluation failed: {dcf_error}")
+        else:
+            risk_metrics = dcf_results.risk_metrics()
+            if request.include_distributions and dcf_results.num_valid > 0:
+                distributions = [
+                    _create_distribution(
+                        name, dcf_results.distribution(name, request.percentiles)
+                    )
+                    for name in OUTCOME_METRICS
+                ]
 
     return MonteCarloResponse(
         request_id=request_id,
@@ -97,9 +137,30 @@ def _convert_monte_carlo_results_to_response(
         simulation_timestamp=datetime.now(timezone.utc),
         simulation_count=request.simulation_count,
         scenarios=scenarios,
+        distributions=distributions,
         risk_metrics=risk_metrics,
         scenario_classification=scenario_classification,
         processing_time_seconds=round(processing_time, 3),
+        seed=_seed_string(getattr(results, "seed", None)),
+    )
+
+
+def _seed_string(seed: Optional[int]) -> Optional[str]:
+    """Seeds are 128-bit; send them as strings so JSON clients keep every digit."""
+    return None if seed is None else str(seed)
+
+
+def _create_distribution(name: str, stats: Dict[str, float]) -> MonteCarloDistribution:
+    """Convert a DCF outcome distribution to its API model."""
+    return MonteCarloDistribution(
+        parameter_name=name,
+        mean=stats["mean"],
+        std_dev=stats["std"],
+        percentiles={
+            key[1:]: value for key, value in stats.items() if key.startswith("p")
+        },
+        min_value=stats["min"],
+        max_value=stats["max"],
     )
 
 
@@ -350,6 +411,7 @@ async def monte_carlo_simulation(
                 ),
                 "num_scenarios": simulation_request.simulation_count,
                 "correlation_window_years": simulation_request.correlation_window_years,
+                "seed": simulation_request.seed,
             }
         },
     )
@@ -379,6 +441,8 @@ async def monte_carlo_simulation(
                     num_scenarios=simulation_request.simulation_count,
                     horizon_years=6,  # Default 6-year horizon
                     use_correlations=True,  # Enable correlations
+                    seed=simulation_request.seed,
+                    sampler=simulation_request.sampler,
                 )
             except Exception as engine_error:
                 logger.warning(
@@ -398,6 +462,10 @@ async def monte_carlo_simulation(
                     results, simulation_request, request_id, processing_time
                 )
 
+                # Keep the scenarios so shock analyses can reuse this run
+                if settings.monte_carlo.persist_scenarios:
+                    response.simulation_id = monte_carlo_engine.save_results(results)
+
         logger.info(
             f"Monte Carlo simulation completed for {simulation_request.property_data.property_name}: "
             f"{simulation_request.simulation_count} scenarios in {processing_time:.1f}s",
@@ -455,3 +523,438 @@ async def monte_carlo_simulation(
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         ) from e
+
+
+def _json_safe(value: Any) -> Any:
+    """Replace non-finite floats with None so every event is valid JSON."""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _encode_stream_event(event: Dict[str, Any], stream_format: str) -> str:
+    """Frame one event as an NDJSON line or a Server-Sent Event."""
+    payload = json.dumps(_json_safe(event), default=str)
+    if stream_format == "sse":
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+def _scenario_chunk_event(
+    chunk_index: int,
+    offset: int,
+    batch: ScenarioBatch,
+    dcf_results: Optional[ScenarioDCFResults],
+) -> Dict[str, Any]:
+    """Serialize one chunk of scenarios with their DCF outcomes."""
+    scenarios = []
+    for index, scenario in enumerate(batch):
+        scenario_data = asdict(scenario)
+        scenario_data["scenario_id"] = offset + index
+        if dcf_results is not None and dcf_results.valid[index]:
+            scenario_data["dcf_metrics"] = {
+                name: float(getattr(dcf_results, name)[index])
+                for name in OUTCOME_METRICS
+            }
+        else:
+            scenario_data["dcf_metrics"] = None
+        scenarios.append(scenario_data)
+
+    return {
+        "type": "scenarios",
+        "chunk": chunk_index,
+        "offset": offset,
+        "scenarios": scenarios,
+    }
+
+
+def _stream_monte_carlo_events(
+    chunks: Iterable[ScenarioBatch],
+    simulation_request: MonteCarloRequest,
+    request_id: str,
+    seed: Optional[str],
+    start_time: float,
+    stream_format: str,
+) -> Iterator[str]:
+    """
+    Emit scenario chunks as they are generated, then one summary event.
+
+    Only the per-parameter accumulators, classification counts and the small
+    DCF outcome arrays outlive a chunk. The accumulators use
+    ``stream_percentile_method`` (a t-digest by default), so memory does not
+    grow with the raw scenario tensor.
+    """
+    classification_counts = np.zeros(len(MARKET_SCENARIO_LABELS), dtype=np.int64)
+    accumulators: Dict[str, StreamingSummary] = {}
+    dcf_chunks: List[ScenarioDCFResults] = []
+    generated = 0
+    chunk_index = -1
+
+    try:
+        for chunk_index, batch in enumerate(chunks):
+            if batch.market_scenario_codes is not None:
+                classification_counts += np.bincount(
+                    batch.market_scenario_codes, minlength=len(MARKET_SCENARIO_LABELS)
+                )
+            for param_name in batch.parameter_names:
+                accumulator = accumulators.get(param_name)
+                if accumulator is None:
+                    accumulator = accumulators[param_name] = StreamingSummary(
+                        settings.monte_carlo.stream_percentile_method,
+                        settings.monte_carlo.tdigest_compression,
+                    )
+                accumulator.update(batch.parameter(param_name))
+
+            dcf_results = None
+            try:
+                dcf_results = monte_carlo_dcf_service.evaluate_scenarios(
+                    batch, simulation_request.property_data
+                )
+            except Exception as dcf_error:
+                logger.warning(f"Scenario DCF evaluation failed: {dcf_error}")
+            else:
+                dcf_chunks.append(dcf_results)
+
+            yield _encode_stream_event(
+                _scenario_chunk_event(chunk_index, generated, batch, dcf_results),
+                stream_format,
+            )
+            generated += batch.num_scenarios
+    except Exception as e:
+        # Headers are already sent; report the failure in-band and stop
+        logger.error(f"Monte Carlo stream {request_id} failed: {e}", exc_info=True)
+        yield _encode_stream_event(
+            {
+                "type": "error",
+                "request_id": request_id,
+                "error_code": "calculation_error",
+                "message": f"Monte Carlo simulation failed: {e}",
+                "scenarios_sent": generated,
+            },
+            stream_format,
+        )
+        return
+
+    risk_metrics: Dict[str, float] = {}
+    distributions = None
+    if dcf_chunks:
+        dcf_results = ScenarioDCFResults.concatenate(dcf_chunks)
+        risk_metrics = dcf_results.risk_metrics()
+        if simulation_request.include_distributions and dcf_results.num_valid > 0:
+            distributions = [
+                _create_distribution(
+                    name, dcf_results.distribution(name, simulation_request.percentiles)
+                ).model_dump()
+                for name in OUTCOME_METRICS
+            ]
+
+    yield _encode_stream_event(
+        {
+            "type": "summary",
+            "request_id": request_id,
+            "property_id": getattr(
+                simulation_request.property_data,
+                "property_id",
+                simulation_request.property_data.property_name,
+            ),
+            "simulation_count": generated,
+            "chunks": chunk_index + 1,
+            "seed": seed,
+            "scenario_classification": {
+                label: int(count)
+                for label, count in zip(MARKET_SCENARIO_LABELS, classification_counts)
+            },
+            "summary_statistics": {
+                name: accumulator.to_dict(simulation_request.percentiles)
+                for name, accumulator in accumulators.items()
+            },
+            "risk_metrics": risk_metrics,
+            "distributions": distributions,
+            "processing_time_seconds": round(time.time() - start_time, 3),
+        },
+        stream_format,
+    )
+
+
+@router.post(
+    "/monte-carlo/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream Monte Carlo Market Scenarios",
+    description="""
+    **Stream every Monte Carlo scenario as it is generated, followed by summary statistics.**
+
+    Unlike `/monte-carlo`, which returns at most 100 scenarios in one JSON document, this
+    endpoint samples scenarios in chunks and writes each chunk to the response as soon as it
+    has been scored and run through the DCF. Memory stays bounded by the chunk size.
+
+    ## Formats
+
+    * **NDJSON** (default, `application/x-ndjson`): one JSON event per line
+    * **Server-Sent Events** (`Accept: text/event-stream`): `event:`/`data:` frames
+
+    ## Events
+
+    * `scenarios`: `chunk`, `offset` and the chunk's scenarios, each with its
+      `forecasted_parameters`, `scenario_summary` and `dcf_metrics` (NPV, IRR and equity
+      multiple, or `null` for scenarios failing DCF validation)
+    * `summary`: sent last; scenario count, seed, scenario classification counts,
+      per-parameter summary statistics, DCF risk metrics and optional distributions
+    * `error`: sent instead of `summary` if generation fails mid-stream
+
+    Chunk size comes from `monte_carlo.stream_chunk_size`. Scenario `i` of a stream is
+    identical to scenario `i` of a sharded run with the same seed whose `shard_size`
+    equals the stream's chunk size.
+    """,
+    responses={
+        200: {
+            "description": "Stream of scenario chunks ending in a summary event",
+            "content": {
+                STREAM_MEDIA_TYPES["ndjson"]: {},
+                STREAM_MEDIA_TYPES["sse"]: {},
+            },
+        },
+        401: {
+            "description": "Authentication required",
+            "content": {"application/json": {"example": EXAMPLE_AUTHENTICATION_ERROR}},
+        },
+        422: {
+            "description": "Validation error in simulation parameters",
+            "content": {"application/json": {"example": EXAMPLE_VALIDATION_ERROR}},
+        },
+        500: {
+            "description": "Simulation engine error or forecasting failure",
+            "content": {"application/json": {"example": EXAMPLE_CALCULATION_ERROR}},
+        },
+        503: {"description": "Monte Carlo engine unavailable"},
+    },
+)
+def stream_monte_carlo_simulation(
+    request: Request,
+    simulation_request: MonteCarloRequest,
+    _: bool = Depends(require_permission("read")),
+) -> StreamingResponse:
+    """
+    Stream Monte Carlo scenarios in chunks as they are generated.
+
+    The first chunk is generated before the response starts, so forecast or
+    configuration failures still surface as an HTTP error rather than a
+    truncated stream.
+
+    Args:
+        request: FastAPI request object; its Accept header selects the format
+        simulation_request: Monte Carlo configuration, as for ``/monte-carlo``
+        _: Permission validation ensuring authenticated access
+
+    Returns:
+        StreamingResponse of NDJSON lines or Server-Sent Events
+
+    Raises:
+        HTTPException: 503 without an engine, 500 if generation cannot start
+    """
+    start_time = time.time()
+    request_id = simulation_request.request_id or getattr(
+        request.state, "request_id", f"mc_{uuid.uuid4().hex[:8]}"
+    )
+    stream_format = (
+        "sse" if "text/event-stream" in request.headers.get("accept", "") else "ndjson"
+    )
+
+    if monte_carlo_engine is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error_code": "service_unavailable",
+                "message": "Monte Carlo engine unavailable",
+                "request_id": request_id,
+            },
+        )
+
+    # Resolve the seed up front so the summary can report it for replay
+    seed_sequence = resolve_seed(simulation_request.seed)
+    try:
+        chunks = monte_carlo_engine.iter_scenario_chunks(
+            property_data=_create_property_data_from_request(simulation_request),
+            num_scenarios=simulation_request.simulation_count,
+            horizon_years=6,  # Default 6-year horizon
+            use_correlations=True,
+            seed=seed_sequence,
+            sampler=simulation_request.sampler,
+        )
+        first_chunk = next(chunks)
+    except Exception as e:
+        logger.error(
+            f"Monte Carlo stream failed for {simulation_request.property_data.property_name}: {e}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_code": "calculation_error",
+                "message": f"Monte Carlo simulation failed: {e}",
+                "calculation_phase": "monte_carlo_simulation",
+                "request_id": request_id,
+                "path": "/api/v1/simulation/monte-carlo/stream",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        ) from e
+
+    logger.info(
+        f"Streaming {simulation_request.simulation_count} Monte Carlo scenarios "
+        f"for {simulation_request.property_data.property_name} as {stream_format}",
+        extra={
+            "structured_data": {
+                "event": "monte_carlo_stream_started",
+                "request_id": request_id,
+                "num_scenarios": simulation_request.simulation_count,
+                "seed": _seed_string(seed_sequence.entropy),  # type: ignore
+            }
+        },
+    )
+
+    return StreamingResponse(
+        _stream_monte_carlo_events(
+            chain([first_chunk], chunks),
+            simulation_request,
+            request_id,
+            _seed_string(seed_sequence.entropy),  # type: ignore
+            start_time,
+            stream_format,
+        ),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Request-ID": request_id},
+    )
+
+
+def _classification_counts(batch: ScenarioBatch) -> Dict[str, int]:
+    """Count scenarios by market type."""
+    counts = np.zeros(len(MARKET_SCENARIO_LABELS), dtype=np.int64)
+    if batch.market_scenario_codes is not None:
+        counts = np.bincount(
+            batch.market_scenario_codes, minlength=len(MARKET_SCENARIO_LABELS)
+        )
+    return {label: int(count) for label, count in zip(MARKET_SCENARIO_LABELS, counts)}
+
+
+@router.post(
+    "/{simulation_id}/shocks",
+    response_model=ShockAnalysisResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stress Test a Stored Monte Carlo Simulation",
+    description="""
+    **Apply what-if shocks to a stored simulation without re-sampling it.**
+
+    Loads the persisted scenarios of `simulation_id`, shifts the requested parameters and
+    rescores and reclassifies every scenario. Shocks are additive (`shift` is added, e.g.
+    `0.015` for +150bp) or multiplicative (`shift` is the multiplier), optionally limited to
+    selected forecast years. With `propagate_correlations`, unshocked parameters move by
+    their correlation-implied conditional shift.
+
+    Simulations are stored when `monte_carlo.persist_scenarios` is enabled; the Monte Carlo
+    endpoint then returns the unique `simulation_id` of the run to use here. When
+    `msa_code` or `horizon_years` is given, the stored run must match them.
+    """,
+    responses={
+        401: {
+            "description": "Authentication required",
+            "content": {"application/json": {"example": EXAMPLE_AUTHENTICATION_ERROR}},
+        },
+        404: {"description": "No stored scenarios for the simulation id"},
+        409: {"description": "Stored simulation has a different MSA or horizon"},
+        422: {
+            "description": "Unknown parameter, shock mode or forecast year",
+            "content": {"application/json": {"example": EXAMPLE_VALIDATION_ERROR}},
+        },
+    },
+)
+def shock_simulation(
+    simulation_id: str,
+    request: Request,
+    shock_request: ShockAnalysisRequest,
+    _: bool = Depends(require_permission("read")),
+) -> ShockAnalysisResponse:
+    """
+    Rescore a stored simulation under parameter shocks.
+
+    Args:
+        simulation_id: Id returned when the simulation was persisted
+        request: FastAPI request object with tracking context
+        shock_request: Shocks to apply and whether to propagate them
+        _: Permission validation ensuring authenticated access
+
+    Returns:
+        Shocked scenario classifications, score changes and parameter statistics
+
+    Raises:
+        HTTPException: 404 if the simulation's scenarios were not persisted,
+            409 if the stored run's MSA or horizon differs from the request
+    """
+    start_time = time.time()
+    request_id = shock_request.request_id or getattr(
+        request.state, "request_id", f"shock_{uuid.uuid4().hex[:8]}"
+    )
+    engine = monte_carlo_engine or MonteCarloEngine()
+
+    try:
+        baseline = engine.load_results(simulation_id)
+    except DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    mismatches = [
+        f"{name} {requested} (stored {stored})"
+        for name, requested, stored in (
+            ("msa_code", shock_request.msa_code, baseline.msa_code),
+            ("horizon_years", shock_request.horizon_years, baseline.horizon_years),
+        )
+        if requested is not None and requested != stored
+    ]
+    if mismatches:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Simulation {simulation_id} does not match the requested "
+            + ", ".join(mismatches),
+        )
+
+    shocks = [ScenarioShock(**spec.model_dump()) for spec in shock_request.shocks]
+    shocked = engine.apply_shocks(
+        baseline, shocks, propagate=shock_request.propagate_correlations
+    )
+
+    score_changes = {
+        score: float(
+            np.mean(shocked.scenarios.summaries[score])
+            - np.mean(baseline.scenarios.summaries[score])
+        )
+        for score in ("growth_score", "risk_score")
+        if score in baseline.scenarios.summaries
+    }
+    processing_time = time.time() - start_time
+
+    logger.info(
+        f"Applied {len(shocks)} shocks to simulation {simulation_id} "
+        f"in {processing_time:.3f}s",
+        extra={
+            "structured_data": {
+                "event": "monte_carlo_shock_completed",
+                "request_id": request_id,
+                "simulation_id": simulation_id,
+                "processing_time_seconds": processing_time,
+            }
+        },
+    )
+
+    return ShockAnalysisResponse(
+        request_id=request_id,
+        simulation_id=simulation_id,
+        simulation_count=shocked.num_scenarios,
+        shocks=[spec.model_dump() for spec in shock_request.shocks],
+        propagate_correlations=shock_request.propagate_correlations,
+        scenario_classification=_classification_counts(shocked.scenarios),
+        baseline_classification=_classification_counts(baseline.scenarios),
+        score_changes=score_changes,
+        summary_statistics=shocked.summary_statistics,
+        processing_time_seconds=round(processing_time, 3),
+    )
@@ -18,6 +18,7 @@ project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.logging_config import get_logger
+from monte_carlo.forecast_cache import forecast_cache_stats
 from src.presentation.api.middleware.auth import require_permission
 from src.presentation.api.middleware.logging import get_performance_metrics
 from src.presentation.api.models.responses import ConfigurationResponse, HealthResponse
@@ -190,6 +191,21 @@ def _metrics_to_prometheus_text(metrics_data: Dict[str, Any]) -> str:
             f'proforma_endpoint_avg_response_seconds{{endpoint="{esc}"}} {stats.get("avg_response_time", 0.0)}'
         )
 
+    # Monte Carlo forecast cache
+    cache_stats: Dict[str, Any] = metrics_data.get("forecast_cache", {})
+    for name, kind, description in (
+        ("size", "gauge", "Forecast sets currently cached"),
+        ("hits", "counter", "Forecast cache hits"),
+        ("misses", "counter", "Forecast cache misses"),
+        ("evictions", "counter", "Forecast cache LRU evictions"),
+        ("expirations", "counter", "Forecast cache TTL expirations"),
+        ("invalidations", "counter", "Forecast cache explicit invalidations"),
+    ):
+        metric = f"proforma_forecast_cache_{name}"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.append(f"{metric} {cache_stats.get(name, 0)}")
+
     return "\n".join(lines) + "\n"
 
 
@@ -201,7 +217,10 @@ async def metrics(format: Optional[str] = None):
     Includes uptime, total requests, total errors, and per-endpoint statistics.
     """
     try:
-        metrics_data = get_performance_metrics()
+        metrics_data = {
+            **get_performance_metrics(),
+            "forecast_cache": forecast_cache_stats(),
+        }
         if (format or "").lower() == "prometheus":
             text = _metrics_to_prometheus_text(metrics_data)
             return PlainTextResponse(
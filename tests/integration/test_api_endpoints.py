@@ -88,6 +88,29 @@ class TestMetricsEndpoint:
         assert "proforma_uptime_seconds" in body
         assert "proforma_total_requests" in body
 
+    def test_metrics_report_forecast_cache(self, api_client):
+        """Metrics should include forecast cache counters in both formats."""
+        from monte_carlo.simulation_engine import MonteCarloEngine
+
+        engine = MonteCarloEngine()
+        engine.cached_forecasts["35620_5"] = {}
+        engine.cached_forecasts.get("35620_5")
+        engine.factorization_cache.get("35620_5_correlated")
+
+        response = api_client.get("/api/v1/metrics")
+        assert response.status_code == 200
+        cache_stats = response.json()["forecast_cache"]
+        assert cache_stats["size"] >= 1
+        assert cache_stats["hits"] >= 1
+        for name in ("caches", "misses", "evictions", "expirations", "invalidations"):
+            assert name in cache_stats
+
+        response = api_client.get("/api/v1/metrics?format=prometheus")
+        body = response.text
+        assert "# TYPE proforma_forecast_cache_hits counter" in body
+        assert "# TYPE proforma_forecast_cache_size gauge" in body
+        assert f"proforma_forecast_cache_hits {cache_stats['hits']}" in body
+
 
 class TestAuthentication:
     """Test API authentication."""
@@ -4,12 +4,15 @@ Unit Tests for Cash Flow Projection Service (Simplified)
 Core functionality tests for the cash flow projection service.
 """
 
+from dataclasses import replace
 from datetime import date
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from core.exceptions import ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
 from src.application.services.cash_flow_projection_service import (
     CashFlowProjectionService,
 )
@@ -238,3 +241,76 @@ class TestCashFlowProjectionServiceSimplified:
             "Successfully calculated cash flow projection" in msg
             for msg in logged_messages
         )
+
+    def test_calculate_cash_flow_projection_batch_should_match_scalar_projection(
+        self, service, sample_dcf_assumptions, sample_initial_numbers
+    ):
+        """
+        GIVEN scenarios with different rent growth, expense growth and vacancy
+        WHEN calculating the batch projection
+        THEN every scenario should match the scalar projection year by year
+        """
+        # Arrange
+        vacancy_paths = [
+            sample_dcf_assumptions.vacancy_rate,
+            [0.05, 0.45, 0.45, 0.40, 0.10, 0.05],  # Leaves preferred return unpaid
+            [0.02, 0.03, 0.03, 0.04, 0.04, 0.05],
+        ]
+        rent_paths = [
+            sample_dcf_assumptions.rent_growth_rate,
+            [0.0, -0.05, -0.02, 0.01, 0.03, 0.04],
+            [0.03, 0.06, 0.05, 0.05, 0.04, 0.04],
+        ]
+        expense_paths = [
+            sample_dcf_assumptions.expense_growth_rate,
+            [0.03, 0.05, 0.05, 0.04, 0.04, 0.03],
+            [0.02, 0.02, 0.02, 0.02, 0.02, 0.02],
+        ]
+        batch = ScenarioBatch(
+            values=np.array(
+                [
+                    [rent, expense, vacancy]
+                    for rent, expense, vacancy in zip(
+                        rent_paths, expense_paths, vacancy_paths
+                    )
+                ]
+            ),
+            parameter_names=["rent_growth", "expense_growth", "vacancy_rate"],
+        )
+
+        # Act
+        projection = service.calculate_cash_flow_projection_batch(
+            batch, sample_initial_numbers
+        )
+
+        # Assert
+        assert projection.net_cash_flow.shape == (3, 6)
+        for index in range(3):
+            expected = service.calculate_cash_flow_projection(
+                replace(
+                    sample_dcf_assumptions,
+                    rent_growth_rate=rent_paths[index],
+                    expense_growth_rate=expense_paths[index],
+                    vacancy_rate=vacancy_paths[index],
+                ),
+                sample_initial_numbers,
+            )
+            for year in range(6):
+                cash_flow = expected.annual_cash_flows[year]
+                distribution = expected.waterfall_distributions[year]
+                assert projection.net_operating_income[index, year] == pytest.approx(
+                    cash_flow.net_operating_income
+                )
+                assert projection.net_cash_flow[index, year] == pytest.approx(
+                    cash_flow.net_cash_flow
+                )
+                assert projection.cumulative_unpaid_preferred[
+                    index, year
+                ] == pytest.approx(distribution.cumulative_unpaid_preferred)
+                assert projection.investor_cash_distribution[
+                    index, year
+                ] == pytest.approx(distribution.investor_cash_distribution)
+                assert projection.operator_cash_distribution[
+                    index, year
+                ] == pytest.approx(distribution.operator_cash_distribution)
+        assert projection.cumulative_unpaid_preferred[1].max() > 0
@@ -7,6 +7,7 @@ Tests the financial metrics calculation service following BDD/TDD principles.
 from datetime import date
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from core.exceptions import ValidationError
@@ -507,3 +508,103 @@ class TestFinancialMetricsService:
             call[0][0] for call in mock_logger_instance.info.call_args_list
         ]
         assert any("Calculating financial metrics" in msg for msg in logged_messages)
+
+    def test_calculate_return_metrics_batch_should_match_scalar_metrics(self, service):
+        """
+        GIVEN a matrix of investment cash flows
+        WHEN calculating NPV, IRR, MIRR, equity multiple and payback in batch
+        THEN every row should match the scalar calculations
+        """
+        # Arrange
+        rng = np.random.default_rng(11)
+        cash_flows = np.empty((200, 6))
+        cash_flows[:, 0] = -rng.uniform(3e5, 5e5, 200)
+        cash_flows[:, 1:] = rng.normal(4e4, 2e4, (200, 5))
+        cash_flows[:, 5] += rng.normal(6e5, 2e5, 200)
+        cash_flows[0] = [-1e6, 0.0, 0.0, 0.0, 0.0, 0.0]  # Never paid back
+        cash_flows[1] = [-4e5, 5e5, -1e5, 2e4, 0.0, 1e4]  # Paid back in Year 1
+
+        # Act
+        metrics = service.calculate_return_metrics_batch(cash_flows, 0.10)
+
+        # Assert
+        for index, row in enumerate(cash_flows.tolist()):
+            assert metrics["npv"][index] == pytest.approx(
+                service._calculate_npv(row, 0.10)
+            )
+            assert metrics["irr"][index] == pytest.approx(
+                service._calculate_irr(row), abs=1e-9
+            )
+            assert metrics["modified_irr"][index] == pytest.approx(
+                service._calculate_modified_irr(row, 0.10)
+            )
+            assert metrics["payback_period"][index] == pytest.approx(
+                service._calculate_payback_period(row)
+            )
+            assert metrics["equity_multiple"][index] == pytest.approx(
+                sum(row[1:]) / -row[0]
+            )
+
+    def test_calculate_irr_batch_should_bisect_rows_newton_cannot_solve(self, service):
+        """
+        GIVEN cash flows with a deeply negative IRR
+        WHEN calculating IRR in batch with too small a Newton budget to reach it
+        THEN the bracketed fallback should still find the root
+        """
+        # Arrange
+        cash_flows = np.array(
+            [
+                [-756690.0, -220385.0, 6698.0, 43280.0, -223528.0, 51005.0],
+                [-1e5, 2e4, 3e4, 4e4, 5e4, 6e4],
+            ]
+        )
+
+        # Act
+        irr = service.calculate_irr_batch(cash_flows, max_iterations=3)
+
+        # Assert
+        npv_at_irr = service.calculate_npv_batch(cash_flows[:1], irr[0])
+        assert npv_at_irr[0] == pytest.approx(0.0, abs=1e-3)
+        assert irr[1] == pytest.approx(
+            service._calculate_irr(cash_flows[1].tolist()), abs=1e-9
+        )
+
+    def test_polynomial_irr_should_pick_root_nearest_initial_guess(self, service):
+        """
+        GIVEN conventional cash flows and cash flows with IRRs of 5% and 30%
+        WHEN solving the NPV polynomial by companion-matrix roots
+        THEN it should match Newton and pick the root nearest the 10% guess
+        """
+        # Arrange
+        conventional = [-1e5, 2e4, 3e4, 4e4, 5e4, 6e4]
+        # -(1 - 1.05x)(1 - 1.30x) with x = 1 / (1 + r): IRRs of 5% and 30%
+        two_roots = [-1.0, 2.35, -1.365]
+        cash_flows = np.array([conventional])
+
+        # Act
+        solved, irr = service._polynomial_irr(cash_flows)
+        two_solved, two_irr = service._polynomial_irr(np.array([two_roots]))
+
+        # Assert
+        assert solved[0]
+        assert irr[0] == pytest.approx(service._calculate_irr(conventional), abs=1e-9)
+        assert two_solved[0]
+        assert two_irr[0] == pytest.approx(0.05)
+
+    def test_calculate_irr_should_fall_back_to_polynomial_roots(self, service):
+        """
+        GIVEN a Newton iteration budget too small to converge
+        WHEN calculating IRR for a single cash flow series
+        THEN the polynomial fallback should still return the true IRR
+        """
+        # Arrange
+        cash_flows = [-756690.0, -220385.0, 6698.0, 43280.0, -223528.0, 51005.0]
+        cash_flows[-1] += 1_500_000.0
+
+        # Act
+        irr = service._calculate_irr(cash_flows, max_iterations=1)
+
+        # Assert
+        npv = service._calculate_npv(cash_flows, irr)
+        assert npv == pytest.approx(0.0, abs=1e-3)
+        assert irr == pytest.approx(service._calculate_irr(cash_flows), abs=1e-9)
@@ -7,6 +7,7 @@ Tests the initial numbers calculation service following BDD/TDD principles.
 from datetime import date
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from core.exceptions import ValidationError
@@ -459,3 +460,55 @@ class TestInitialNumbersService:
         # Act & Assert
         with pytest.raises(ValidationError, match="Initial numbers calculation failed"):
             service.calculate_initial_numbers(sample_property_data, invalid_assumptions)
+
+    def test_calculate_initial_numbers_batch_should_match_scalar_per_scenario(
+        self, service, sample_property_data, sample_dcf_assumptions
+    ):
+        """
+        GIVEN financing assumptions that differ between scenarios
+        WHEN calculating initial numbers in batch
+        THEN each scenario's financing should match the scalar calculation
+        """
+        # Arrange
+        ltv_ratios = [0.60, 0.75, 0.80]
+        mortgage_rates = [[0.04] * 6, [0.045] * 6, [0.06] * 6]
+        assumptions = {
+            "ltv_ratio": np.array(ltv_ratios),
+            "closing_cost_pct": np.array([0.02, 0.025, 0.03]),
+            "lender_reserves_months": np.array([3.0, 6.0, 9.0]),
+            "commercial_mortgage_rate": np.array(mortgage_rates),
+        }
+
+        # Act
+        batch = service.calculate_initial_numbers_batch(
+            sample_property_data, assumptions
+        )
+
+        # Assert
+        assert batch.num_scenarios == 3
+        for index in range(3):
+            sample_dcf_assumptions.ltv_ratio = ltv_ratios[index]
+            sample_dcf_assumptions.commercial_mortgage_rate = mortgage_rates[index]
+            sample_dcf_assumptions.closing_cost_pct = float(
+                assumptions["closing_cost_pct"][index]
+            )
+            sample_dcf_assumptions.lender_reserves_months = float(
+                assumptions["lender_reserves_months"][index]
+            )
+            scalar = service.calculate_initial_numbers(
+                sample_property_data, sample_dcf_assumptions
+            )
+            for field in (
+                "loan_amount",
+                "annual_interest_expense",
+                "lender_reserves_amount",
+                "total_cash_required",
+                "investor_cash_required",
+            ):
+                assert getattr(batch, field)[index] == pytest.approx(
+                    getattr(scalar, field)
+                )
+            assert batch.year_1_rental_income == scalar.year_1_rental_income
+            assert batch.total_operating_expenses == pytest.approx(
+                scalar.total_operating_expenses
+            )
@@ -0,0 +1,200 @@
+"""
+Unit Tests for Monte Carlo DCF Service
+
+Tests the batch scenario DCF evaluation service following BDD/TDD principles.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from core.exceptions import ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
+from src.application.services.cash_flow_projection_service import (
+    CashFlowProjectionService,
+)
+from src.application.services.dcf_assumptions_service import DCFAssumptionsService
+from src.application.services.financial_metrics_service import FinancialMetricsService
+from src.application.services.initial_numbers_service import InitialNumbersService
+from src.application.services.monte_carlo_dcf_service import MonteCarloDCFService
+from src.domain.entities.property_data import (
+    InvestorEquityStructure,
+    RenovationInfo,
+    RenovationStatus,
+    ResidentialUnits,
+    SimplifiedPropertyInput,
+)
+
+BASE_PATHS = {
+    "commercial_mortgage_rate": [0.045, 0.047, 0.048, 0.049, 0.050, 0.051],
+    "treasury_10y": [0.035, 0.036, 0.037, 0.038, 0.039, 0.040],
+    "fed_funds_rate": [0.025, 0.026, 0.027, 0.028, 0.029, 0.030],
+    "cap_rate": [0.055, 0.056, 0.057, 0.058, 0.059, 0.060],
+    "rent_growth": [0.035, 0.038, 0.040, 0.042, 0.045, 0.048],
+    "expense_growth": [0.025, 0.027, 0.028, 0.030, 0.032, 0.034],
+    "property_growth": [0.040, 0.042, 0.045, 0.047, 0.050, 0.052],
+    "vacancy_rate": [0.050, 0.048, 0.045, 0.043, 0.040, 0.038],
+    "ltv_ratio": [0.75] * 6,
+    "closing_cost_pct": [0.025] * 6,
+    "lender_reserves": [6.0] * 6,
+}
+
+
+def _scenario_batch(num_scenarios: int, seed: int = 7) -> ScenarioBatch:
+    """Scenarios scattered around the base paths with relative noise."""
+    rng = np.random.default_rng(seed)
+    names = list(BASE_PATHS)
+    base = np.array([BASE_PATHS[name] for name in names])
+    noise = rng.normal(1.0, 0.1, size=(num_scenarios, *base.shape))
+    return ScenarioBatch(values=base * noise, parameter_names=names)
+
+
+class TestMonteCarloDCFService:
+    """Test cases for MonteCarloDCFService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create service instance for testing."""
+        return MonteCarloDCFService()
+
+    @pytest.fixture
+    def sample_property_data(self):
+        """Sample property data for testing."""
+        return SimplifiedPropertyInput(
+            property_id="test_property_123",
+            property_name="Test Investment Property",
+            analysis_date=date.today(),
+            purchase_price=1000000,
+            city="New York",
+            state="NY",
+            msa_code="35620",
+            residential_units=ResidentialUnits(
+                total_units=10, average_rent_per_unit=1500
+            ),
+            equity_structure=InvestorEquityStructure(
+                investor_equity_share_pct=80, self_cash_percentage=20
+            ),
+            renovation_info=RenovationInfo(
+                status=RenovationStatus.PLANNED,
+                anticipated_duration_months=6,
+                estimated_cost=100000,
+            ),
+        )
+
+    def test_evaluate_scenarios_should_match_scalar_dcf_workflow(
+        self, service, sample_property_data
+    ):
+        """
+        GIVEN a batch of Monte Carlo scenarios
+        WHEN evaluating them through the batch DCF
+        THEN NPV, IRR and equity multiple should match the four scalar phases
+        """
+        # Arrange
+        batch = _scenario_batch(8)
+        dcf_service = DCFAssumptionsService()
+        initial_service = InitialNumbersService()
+        cash_flow_service = CashFlowProjectionService()
+        metrics_service = FinancialMetricsService()
+
+        # Act
+        results = service.evaluate_scenarios(batch, sample_property_data)
+
+        # Assert
+        assert results.num_valid == 8
+        for index, scenario in enumerate(batch):
+            assumptions = dcf_service.create_dcf_assumptions_from_scenario(
+                {
+                    "scenario_id": f"scenario_{index}",
+                    "forecasted_parameters": scenario.forecasted_parameters,
+                },
+                sample_property_data,
+            )
+            initial = initial_service.calculate_initial_numbers(
+                sample_property_data, assumptions
+            )
+            projection = cash_flow_service.calculate_cash_flow_projection(
+                assumptions, initial
+            )
+            metrics = metrics_service.calculate_financial_metrics(
+                projection, assumptions, initial
+            )
+            assert results.npv[index] == pytest.approx(metrics.net_present_value)
+            assert results.irr[index] == pytest.approx(
+                metrics.internal_rate_return, abs=1e-9
+            )
+            assert results.equity_multiple[index] == pytest.approx(
+                metrics.equity_multiple
+            )
+
+    def test_evaluate_scenarios_should_mask_invalid_scenarios(
+        self, service, sample_property_data
+    ):
+        """
+        GIVEN scenarios with out-of-range cap rate and LTV assumptions
+        WHEN evaluating the batch
+        THEN those scenarios should be flagged invalid and excluded from stats
+        """
+        # Arrange
+        batch = _scenario_batch(6)
+        batch.values[1, batch.parameter_index["cap_rate"], 3] = 0.25
+        batch.values[4, batch.parameter_index["ltv_ratio"], 0] = 0.99
+
+        # Act
+        results = service.evaluate_scenarios(batch, sample_property_data)
+
+        # Assert
+        assert results.valid.tolist() == [True, False, True, True, False, True]
+        assert results.metric("npv").shape == (4,)
+        assert results.distribution("irr")["max"] == pytest.approx(
+            results.irr[results.valid].max()
+        )
+
+    def test_risk_metrics_should_summarize_irr_tail(
+        self, service, sample_property_data
+    ):
+        """
+        GIVEN a large batch of evaluated scenarios
+        WHEN computing risk metrics
+        THEN VaR should be the IRR 5th percentile and ES the mean beyond it
+        """
+        # Arrange
+        results = service.evaluate_scenarios(
+            _scenario_batch(2000), sample_property_data
+        )
+        irr = results.metric("irr")
+
+        # Act
+        risk = results.risk_metrics()
+
+        # Assert
+        assert risk["value_at_risk_5"] == pytest.approx(np.percentile(irr, 5))
+        assert risk["expected_shortfall_5"] <= risk["value_at_risk_5"]
+        assert risk["volatility"] == pytest.approx(irr.std())
+        assert risk["maximum_drawdown"] == pytest.approx(
+            results.metric("equity_multiple").min() - 1
+        )
+        assert 0.0 <= risk["probability_of_loss"] <= 1.0
+
+    def test_evaluate_scenarios_should_require_six_years(
+        self, service, sample_property_data
+    ):
+        """
+        GIVEN a batch with only five forecast years or a missing parameter
+        WHEN evaluating the batch
+        THEN a ValidationError should be raised
+        """
+        # Arrange
+        batch = _scenario_batch(4)
+        short = ScenarioBatch(
+            values=batch.values[:, :, :5], parameter_names=batch.parameter_names
+        )
+        missing = ScenarioBatch(
+            values=batch.values[:, 1:, :], parameter_names=batch.parameter_names[1:]
+        )
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            service.evaluate_scenarios(short, sample_property_data)
+        with pytest.raises(ValidationError):
+            service.evaluate_scenarios(missing, sample_property_data)
@@ -0,0 +1,61 @@
+"""
+Unit Tests for the Live Data Scheduler
+
+Tests the data.scheduler.data_scheduler module following BDD/TDD principles.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("schedule")
+
+from data.scheduler.data_scheduler import (  # noqa: E402
+    LiveDataScheduler,
+    ScheduledUpdate,
+    UpdateFrequency,
+)
+
+
+class TestLiveDataScheduler:
+    """Test cases for LiveDataScheduler."""
+
+    @pytest.fixture
+    def scheduler(self, tmp_path):
+        """Scheduler with a mocked orchestrator and a temporary config file."""
+        with patch(
+            "data.scheduler.data_scheduler.create_orchestrator"
+        ) as mock_create_orchestrator:
+            mock_create_orchestrator.return_value.PARAMETER_DB_MAPPING = {
+                "cap_rate": {"database": "market_data", "table": "cap_rates"}
+            }
+            yield LiveDataScheduler(config_file=str(tmp_path / "schedule.json"))
+
+    def test_parameter_update_should_invalidate_refreshed_geographies(self, scheduler):
+        """
+        GIVEN a cap rate update collecting two MSAs where one job fails
+        WHEN executing the scheduled update
+        THEN cached Monte Carlo forecasts should be invalidated for the
+            refreshed MSA only
+        """
+        # Arrange
+        scheduler.scheduled_updates["cap_rate"] = ScheduledUpdate(
+            parameter_name="cap_rate",
+            geographic_codes=["35620", "31080"],
+            frequency=UpdateFrequency.MONTHLY,
+        )
+        scheduler.orchestrator.execute_collection_plan.side_effect = lambda jobs, **_: [
+            Mock(success=True, records_collected=12, job=jobs[0]),
+            Mock(success=False, records_collected=0, job=jobs[1], error_message="x"),
+        ]
+
+        # Act
+        with patch(
+            "data.scheduler.data_scheduler.invalidate_forecasts"
+        ) as mock_invalidate:
+            result = scheduler._execute_parameter_update("cap_rate")
+
+        # Assert
+        assert result["success"] is True
+        assert result["jobs_successful"] == 1
+        mock_invalidate.assert_called_once_with("35620")
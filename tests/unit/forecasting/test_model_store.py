@@ -0,0 +1,70 @@
+"""
+Tests for the Prophet model store.
+
+Tests cover serialization round trips, replacement of stale fits and key
+validation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from prophet import Prophet
+
+from core.exceptions import ValidationError
+from forecasting.model_store import ProphetModelStore
+
+
+@pytest.fixture(scope="module")
+def fitted_model():
+    """Small Prophet model fitted to an annual series."""
+    history = pd.DataFrame(
+        {
+            "ds": pd.date_range("2005-01-01", periods=15, freq="YS"),
+            "y": 5.0 + 0.1 * np.arange(15),
+        }
+    )
+    return Prophet(
+        yearly_seasonality=False, weekly_seasonality=False, daily_seasonality=False
+    ).fit(history)
+
+
+class TestProphetModelStore:
+    """Test cases for ProphetModelStore."""
+
+    def test_saved_model_reloads_fitted(self, tmp_path, fitted_model):
+        """Test a saved model reloads with its fitted parameters."""
+        store = ProphetModelStore(tmp_path)
+
+        store.save("cap_rate", "35620", "abc123", fitted_model)
+        loaded = store.load("cap_rate", "35620", "abc123")
+
+        assert loaded is not None
+        np.testing.assert_allclose(loaded.params["k"], fitted_model.params["k"])
+        future = loaded.make_future_dataframe(periods=2, freq="YS")
+        assert len(loaded.predict(future)) == 17
+        assert store.load("cap_rate", "35620", "other") is None
+
+    def test_save_replaces_stale_fits(self, tmp_path, fitted_model):
+        """Test saving a new fingerprint removes older fits of the series."""
+        store = ProphetModelStore(tmp_path)
+        store.save("cap_rate", "35620", "old", fitted_model)
+        store.save("cap_rate", "16980", "old", fitted_model)
+
+        store.save("cap_rate", "35620", "new", fitted_model)
+
+        assert store.load("cap_rate", "35620", "old") is None
+        assert store.load("cap_rate", "35620", "new") is not None
+        assert store.load("cap_rate", "16980", "old") is not None
+        assert store.delete("cap_rate", "35620") == 1
+
+    def test_unreadable_or_unsafe_entries(self, tmp_path):
+        """Test corrupt models are discarded and unsafe keys rejected."""
+        store = ProphetModelStore(tmp_path)
+        path = store.path_for("cap_rate", "35620", "abc123")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert store.load("cap_rate", "35620", "abc123") is None
+        assert not path.exists()
+        with pytest.raises(ValidationError):
+            store.path_for("../cap_rate", "35620", "abc123")
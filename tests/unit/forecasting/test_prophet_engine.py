@@ -6,21 +6,55 @@ Tests cover all major functionality including initialization, data loading,
 model fitting, validation, forecasting, and visualization.
 """
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from prophet import Prophet
 
-from core.exceptions import ValidationError
+from config.settings import settings
+from core.exceptions import ConfigurationError, ValidationError
+from data.databases.database_manager import DatabaseManager
 from forecasting.prophet_engine import (
+    INTERVAL_BASELINE_SAMPLES,
     PROPHET_AVAILABLE,
     ProFormaProphetEngine,
     ProphetForecaster,
     ProphetForecastResult,
     ValidationResult,
+    analytic_intervals,
+    clear_validation_cache,
+    series_fingerprint,
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_validation_cache():
+    """Keep cached holdout validations from leaking between tests."""
+    clear_validation_cache()
+    yield
+    clear_validation_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_store(tmp_path, monkeypatch):
+    """Keep serialized models out of the project data directory."""
+    monkeypatch.setattr(
+        settings.forecast, "model_store_path", str(tmp_path / "prophet_models")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_databases(tmp_path, monkeypatch):
+    """Keep stored fits and validations out of the project databases."""
+    monkeypatch.setattr(settings.database, "base_path", str(tmp_path / "databases"))
+    (tmp_path / "databases").mkdir()
+
+
 class TestProphetForecaster:
     """Test cases for ProphetForecaster class."""
 
@@ -148,6 +182,125 @@ class TestProphetForecaster:
         assert call_args["yearly_seasonality"] is False
         assert call_args["weekly_seasonality"] is True
 
+    @patch("forecasting.prophet_engine.db_manager")
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_fit_model_warm_starts_after_incremental_growth(
+        self, mock_prophet_class, mock_db_manager
+    ):
+        """Test refits start from stored parameters when a point was appended."""
+        mock_prophet_instance = Mock(n_changepoints=25, changepoint_range=0.8)
+        mock_prophet_instance.params = {
+            "k": np.array([[0.4]]),
+            "m": np.array([[0.2]]),
+            "sigma_obs": np.array([[0.03]]),
+            "delta": np.array([[0.0, 0.02, 0.01]]),
+            "beta": np.array([[0.1, -0.1]]),
+        }
+        mock_prophet_class.return_value = mock_prophet_instance
+
+        history = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=6, freq="YS"),
+                "y": [5.0, 5.2, 5.5, 5.6, 5.9, 6.1],
+            }
+        )
+        mock_db_manager.get_prophet_model_params.return_value = {
+            "data_points": 5,
+            "series_fingerprint": series_fingerprint(history.iloc[:5]),
+            "params": {
+                "k": 0.3,
+                "m": 0.1,
+                "sigma_obs": 0.02,
+                "delta": [0.0, 0.01],
+                "beta": [0.1, -0.1],
+            },
+        }
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = history
+        forecaster.fit_model()
+
+        init = mock_prophet_instance.fit.call_args.kwargs["init"]
+        assert init["k"] == pytest.approx(0.3)
+        # Six points place three changepoints; the new one starts flat
+        assert init["delta"].tolist() == [0.0, 0.01, 0.0]
+
+        saved = mock_db_manager.save_prophet_model_params.call_args.kwargs
+        assert saved["data_points"] == 6
+        assert saved["series_fingerprint"] == series_fingerprint(history)
+        assert saved["params"]["k"] == pytest.approx(0.4)
+
+    @patch("forecasting.prophet_engine.db_manager")
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_fit_model_cold_starts_after_revised_history(
+        self, mock_prophet_class, mock_db_manager
+    ):
+        """Test refits ignore stored parameters when earlier points changed."""
+        mock_prophet_instance = Mock()
+        mock_prophet_class.return_value = mock_prophet_instance
+
+        history = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=6, freq="YS"),
+                "y": [5.0, 5.2, 5.5, 5.6, 5.9, 6.1],
+            }
+        )
+        revised = history.iloc[:5].copy()
+        revised.loc[2, "y"] = 5.4
+        mock_db_manager.get_prophet_model_params.return_value = {
+            "data_points": 5,
+            "series_fingerprint": series_fingerprint(revised),
+            "params": {"k": 0.3, "m": 0.1, "sigma_obs": 0.02},
+        }
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = history
+        forecaster.fit_model()
+
+        mock_prophet_instance.fit.assert_called_once_with(
+            history, timeout=settings.forecast.fit_timeout_seconds
+        )
+
+    @patch("forecasting.prophet_engine.db_manager")
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_fit_model_reuses_stored_model_for_unchanged_series(
+        self, mock_prophet_class, mock_db_manager
+    ):
+        """Test fitting is skipped when the model store has this series."""
+        mock_db_manager.get_prophet_model_params.return_value = None
+        store = Mock()
+        store.load.return_value = None
+        history = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=6, freq="YS"),
+                "y": [5.0, 5.2, 5.5, 5.6, 5.9, 6.1],
+            }
+        )
+
+        forecaster = ProphetForecaster("cap_rate", "35620", model_store=store)
+        forecaster.historical_data = history
+        forecaster.fit_model()
+
+        mock_prophet_class.return_value.fit.assert_called_once()
+        parameter, geography, fingerprint, model = store.save.call_args.args
+        assert (parameter, geography) == ("cap_rate", "35620")
+        assert model is mock_prophet_class.return_value
+
+        stored_model = Mock()
+        store.load.return_value = stored_model
+        mock_prophet_class.reset_mock()
+        rerun = ProphetForecaster("cap_rate", "35620", model_store=store)
+        rerun.historical_data = history.copy()
+        rerun.fit_model()
+
+        mock_prophet_class.assert_not_called()
+        assert rerun.fitted_model is stored_model
+        assert store.load.call_args.args == ("cap_rate", "35620", fingerprint)
+
+        # A different configuration is a different fingerprint
+        rerun.fit_model(yearly_seasonality=False)
+        assert store.load.call_args.args[2] != fingerprint
+
     def test_validate_model_no_fitted_model_raises_error(self):
         """Test validation without fitted model raises ValueError."""
         forecaster = ProphetForecaster("cap_rate", "35620")
@@ -216,6 +369,347 @@ class TestProphetForecaster:
         assert isinstance(result.rmse, float)
         assert isinstance(result.mae, float)
 
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_validate_model_reuses_cached_result(self, mock_prophet_class):
+        """Test repeated validation of unchanged data does not refit."""
+        mock_train_prophet = Mock()
+        mock_prophet_class.return_value = mock_train_prophet
+        mock_train_prophet.predict.return_value = pd.DataFrame(
+            {"yhat": [5.0, 5.5, 6.0, 6.2, 6.4]}
+        )
+        mock_train_prophet.make_future_dataframe.return_value = pd.DataFrame()
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=5, freq="YE"),
+                "y": [5.0, 5.5, 6.0, 6.1, 6.3],
+            }
+        )
+        forecaster.fitted_model = Mock()
+
+        first = forecaster.validate_model(holdout_years=2)
+        second = forecaster.validate_model(holdout_years=2)
+        assert second is first
+        assert forecaster.cached_validation(holdout_years=2) is first
+        assert mock_train_prophet.fit.call_count == 1
+
+        forecaster.validate_model(holdout_years=2, use_cache=False)
+        assert mock_train_prophet.fit.call_count == 2
+
+        # Changed data invalidates the fingerprint
+        forecaster.historical_data.loc[4, "y"] = 6.5
+        forecaster.validate_model(holdout_years=2)
+        assert mock_train_prophet.fit.call_count == 3
+
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_validate_model_warm_starts_from_fitted_params(self, mock_prophet_class):
+        """Test the holdout fit starts from the main fit's rescaled parameters."""
+        mock_train_prophet = Mock()
+        mock_train_prophet.y_scale = 6.0
+        mock_train_prophet.y_min = 0.0
+        mock_train_prophet.t_scale = pd.Timedelta(days=730)
+        mock_train_prophet.n_changepoints = 25
+        mock_train_prophet.changepoint_range = 0.8
+        mock_prophet_class.return_value = mock_train_prophet
+        mock_train_prophet.predict.return_value = pd.DataFrame(
+            {"yhat": [5.0, 5.5, 6.0, 6.2, 6.4]}
+        )
+        mock_train_prophet.make_future_dataframe.return_value = pd.DataFrame()
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=5, freq="YE"),
+                "y": [5.0, 5.5, 6.0, 6.1, 6.3],
+            }
+        )
+        forecaster.fitted_model = Mock(
+            y_scale=6.3,
+            y_min=0.0,
+            t_scale=pd.Timedelta(days=1460),
+            seasonality_mode="additive",
+        )
+        forecaster.fitted_model.params = {
+            "k": np.array([[0.3]]),
+            "m": np.array([[0.1]]),
+            "sigma_obs": np.array([[0.02]]),
+            "delta": np.array([[0.0, 0.01]]),
+            "beta": np.array([[0.0] * 20]),
+        }
+
+        forecaster.validate_model(holdout_years=2)
+
+        # Same curve on the holdout fit's y (6.3 -> 6.0) and t (4 -> 2 years) axes
+        init = mock_train_prophet.fit.call_args.kwargs["init"]
+        assert init["k"] == pytest.approx(0.3 * 1.05 * 0.5)
+        assert init["m"] == pytest.approx(0.1 * 1.05)
+        assert init["sigma_obs"] == pytest.approx(0.02 * 1.05)
+        assert init["delta"].tolist() == pytest.approx([0.0])
+
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_generate_forecast_skip_validation_mode(
+        self, mock_prophet_class, monkeypatch
+    ):
+        """Test skip mode omits performance metrics without a holdout fit."""
+        monkeypatch.setattr(settings.forecast, "validation_mode", "skip")
+        fitted_model = Mock()
+        fitted_model.make_future_dataframe.return_value = pd.DataFrame(
+            {"ds": pd.date_range("2020-01-01", periods=7, freq="YS")}
+        )
+        fitted_model.predict.return_value = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=7, freq="YS"),
+                "yhat": [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6],
+                "yhat_lower": [4.9] * 7,
+                "yhat_upper": [5.7] * 7,
+                "trend": [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6],
+            }
+        )
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=5, freq="YS"),
+                "y": [5.0, 5.1, 5.2, 5.3, 5.4],
+            }
+        )
+        forecaster.fitted_model = fitted_model
+
+        result = forecaster.generate_forecast(horizon_years=2)
+
+        mock_prophet_class.assert_not_called()
+        assert result.model_performance == {}
+
+        monkeypatch.setattr(settings.forecast, "validation_mode", "lazy")
+        with pytest.raises(ConfigurationError):
+            forecaster._model_performance()
+
+    def test_generate_forecast_validates_in_background_by_default(self):
+        """Test the default mode defers the holdout fit off the forecast path."""
+        fitted_model = Mock()
+        fitted_model.make_future_dataframe.return_value = pd.DataFrame(
+            {"ds": pd.date_range("2020-01-01", periods=7, freq="YS")}
+        )
+        fitted_model.predict.return_value = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=7, freq="YS"),
+                "yhat": [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6],
+                "yhat_lower": [4.9] * 7,
+                "yhat_upper": [5.7] * 7,
+                "trend": [5.0, 5.1, 5.2, 5.3, 5.4, 5.5, 5.6],
+            }
+        )
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2020-01-01", periods=5, freq="YS"),
+                "y": [5.0, 5.1, 5.2, 5.3, 5.4],
+            }
+        )
+        forecaster.fitted_model = fitted_model
+
+        with patch.object(forecaster, "validate_model") as mock_validate, patch.object(
+            forecaster, "validate_in_background"
+        ) as mock_background, patch("forecasting.prophet_engine._background_executor"):
+            result = forecaster.generate_forecast(horizon_years=2)
+
+        assert settings.forecast.validation_mode == "background"
+        mock_validate.assert_not_called()
+        mock_background.assert_called_once_with()
+        assert result.model_performance == {}
+
+    @patch("forecasting.prophet_engine.invalidate_forecasts")
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_background_validation_is_saved_with_the_forecast(
+        self, mock_prophet_class, mock_invalidate, monkeypatch
+    ):
+        """Test a background validation lands in the saved forecast row."""
+        database = DatabaseManager()
+        database.initialize_databases()
+        monkeypatch.setattr("forecasting.prophet_engine.db_manager", database)
+
+        mock_train_prophet = Mock()
+        mock_prophet_class.return_value = mock_train_prophet
+        mock_train_prophet.predict.return_value = pd.DataFrame(
+            {"yhat": [5.0, 5.2, 5.4, 5.6, 5.8, 6.0, 6.2]}
+        )
+        mock_train_prophet.make_future_dataframe.return_value = pd.DataFrame()
+
+        historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=7, freq="YS"),
+                "y": [5.0, 5.2, 5.4, 5.6, 5.9, 6.0, 6.4],
+            }
+        )
+        fitted_model = Mock()
+        fitted_model.make_future_dataframe.return_value = pd.DataFrame(
+            {"ds": pd.date_range("2016-01-01", periods=9, freq="YS")}
+        )
+        fitted_model.predict.return_value = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=9, freq="YS"),
+                "yhat": [5.0 + 0.2 * i for i in range(9)],
+                "yhat_lower": [4.5] * 9,
+                "yhat_upper": [7.5] * 9,
+            }
+        )
+
+        def run_forecast():
+            forecaster = ProphetForecaster("cap_rate", "35620")
+
+            def load():
+                forecaster.historical_data = historical_data.copy()
+
+            def fit():
+                forecaster.fitted_model = fitted_model
+
+            executor = ThreadPoolExecutor(max_workers=1)
+            with patch.object(
+                forecaster, "load_historical_data", side_effect=load
+            ), patch.object(forecaster, "fit_model", side_effect=fit), patch(
+                "forecasting.prophet_engine._background_executor",
+                return_value=executor,
+            ):
+                result = forecaster.run_complete_forecast(
+                    horizon_years=2, create_plot=False
+                )
+            # Waits for the validation and its save callback
+            executor.shutdown(wait=True)
+            return result
+
+        first = run_forecast()
+
+        assert first.model_performance == {}
+        validation = database.get_prophet_validation("cap_rate", "35620")
+        saved = database.get_cached_prophet_forecast("cap_rate", "35620", 2)
+        assert json.loads(saved["model_performance"]) == {
+            "mape": pytest.approx(validation["mape"]),
+            "rmse": pytest.approx(validation["rmse"]),
+            "mae": pytest.approx(validation["mae"]),
+        }
+        assert validation["mape"] > 0
+        assert mock_train_prophet.fit.call_count == 1
+
+        # A new process forecasting the same data reuses the stored validation
+        clear_validation_cache()
+        second = run_forecast()
+
+        assert second.model_performance["mape"] == pytest.approx(validation["mape"])
+        assert mock_train_prophet.fit.call_count == 1
+
+    @patch("forecasting.prophet_engine.db_manager")
+    @patch("forecasting.prophet_engine.Prophet")
+    def test_fit_model_uses_forecast_settings(
+        self, mock_prophet_class, mock_db_manager, monkeypatch
+    ):
+        """Test Prophet is configured from the forecast settings."""
+        mock_db_manager.get_prophet_model_params.return_value = None
+        monkeypatch.setattr(settings.forecast, "model_store", False)
+        monkeypatch.setattr(settings.forecast, "uncertainty_samples", 200)
+        monkeypatch.setattr(settings.forecast, "confidence_interval", 0.9)
+
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=6, freq="YS"),
+                "y": [5.0, 5.2, 5.5, 5.6, 5.9, 6.1],
+            }
+        )
+        forecaster.fit_model()
+
+        call_args = mock_prophet_class.call_args.kwargs
+        assert call_args["uncertainty_samples"] == 200
+        assert call_args["interval_width"] == 0.9
+        fit_kwargs = mock_prophet_class.return_value.fit.call_args.kwargs
+        assert fit_kwargs["timeout"] == settings.forecast.fit_timeout_seconds
+
+        # Analytic intervals skip trend simulation entirely
+        monkeypatch.setattr(settings.forecast, "interval_mode", "analytic")
+        forecaster.fit_model()
+        assert mock_prophet_class.call_args.kwargs["uncertainty_samples"] == 0
+
+        monkeypatch.setattr(settings.forecast, "interval_mode", "bootstrap")
+        with pytest.raises(Exception, match="Unknown interval mode"):
+            forecaster.fit_model()
+
+    def test_analytic_intervals_match_sampled_intervals(self):
+        """Test the closed-form intervals track Prophet's sampled intervals."""
+        np.random.seed(0)
+        t = np.arange(30)
+        history = pd.DataFrame(
+            {
+                "ds": pd.date_range("1990-01-01", periods=30, freq="YS"),
+                "y": 5.0 + 0.1 * t + 0.3 * np.sin(t / 2) + 0.1 * np.cos(t * 1.7),
+            }
+        )
+        model = Prophet(
+            yearly_seasonality=False,
+            weekly_seasonality=False,
+            daily_seasonality=False,
+            uncertainty_samples=4000,
+        ).fit(history)
+        future = model.make_future_dataframe(periods=5, freq="YS")
+        sampled = model.predict(future).tail(5)
+
+        lower, upper = analytic_intervals(model, sampled)
+
+        width = (sampled["yhat_upper"] - sampled["yhat_lower"]).to_numpy()
+        np.testing.assert_allclose(
+            np.asarray(upper) - np.asarray(lower), width, rtol=0.1
+        )
+        np.testing.assert_allclose(
+            lower, sampled["yhat_lower"], atol=0.1 * width.mean()
+        )
+
+    def test_interval_accuracy_compares_with_baseline_samples(self, monkeypatch):
+        """Test fast intervals are scored against 1000 samples only on request."""
+
+        class StubModel:
+            uncertainty_samples = 0
+
+            def __init__(self):
+                self.predicted_with = []
+
+            def predict(self, future):
+                self.predicted_with.append(self.uncertainty_samples)
+                return pd.DataFrame(
+                    {"yhat_lower": [4.0, 4.0], "yhat_upper": [6.0, 8.0]}
+                )
+
+        monkeypatch.setattr(settings.forecast, "interval_mode", "analytic")
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2016-01-01", periods=6, freq="YS"),
+                "y": [5.0, 5.2, 5.5, 5.6, 5.9, 6.1],
+            }
+        )
+        forecaster.fitted_model = StubModel()
+        future = pd.DataFrame({"ds": pd.date_range("2022-01-01", periods=2)})
+
+        accuracy = forecaster._interval_accuracy(
+            future, [4.5, 3.5], [5.5, 8.5], wait=True
+        )
+        cached = forecaster._interval_accuracy(future, [4.5, 3.5], [5.5, 8.5])
+
+        # Baseline widths 2 and 4, fast widths 1 and 5; every bound off by 0.5
+        assert accuracy["interval_width_ratio"] == pytest.approx(1.0)
+        assert accuracy["interval_bound_error"] == pytest.approx(100 / 6)
+        assert cached == accuracy
+        assert forecaster.fitted_model.uncertainty_samples == 0
+        assert forecaster.fitted_model.predicted_with == [INTERVAL_BASELINE_SAMPLES]
+
+        clear_validation_cache()
+        with patch("forecasting.prophet_engine._background_executor") as executor:
+            deferred = forecaster._interval_accuracy(future, [4.5, 3.5], [5.5, 8.5])
+            monkeypatch.setattr(settings.forecast, "validation_mode", "skip")
+            skipped = forecaster._interval_accuracy(future, [4.5, 3.5], [5.5, 8.5])
+        assert deferred == {} and skipped == {}
+        executor.return_value.submit.assert_called_once()
+        assert forecaster.fitted_model.predicted_with == [INTERVAL_BASELINE_SAMPLES]
+
     def test_generate_forecast_no_fitted_model_raises_error(self):
         """Test generating forecast without fitted model raises ValueError."""
         forecaster = ProphetForecaster("cap_rate", "35620")
@@ -224,9 +718,10 @@ class TestProphetForecaster:
             forecaster.generate_forecast()
 
     @patch("forecasting.prophet_engine.Prophet")
-    def test_generate_forecast_success(self, mock_prophet_class):
+    def test_generate_forecast_success(self, mock_prophet_class, monkeypatch):
         """Test successful forecast generation."""
         # Setup
+        monkeypatch.setattr(settings.forecast, "validation_mode", "eager")
         mock_prophet_instance = Mock()
 
         # Mock future dataframe creation
@@ -329,6 +824,36 @@ class TestProphetForecaster:
         )
         mock_plt.close.assert_called_once()
 
+    @patch("forecasting.prophet_engine.invalidate_forecasts")
+    @patch("forecasting.prophet_engine.db_manager")
+    def test_run_complete_forecast_invalidates_cached_forecasts_after_save(
+        self, mock_db_manager, mock_invalidate
+    ):
+        """Test a saved forecast invalidates cached Monte Carlo forecasts."""
+        forecaster = ProphetForecaster("cap_rate", "35620")
+        forecast_result = ProphetForecastResult(
+            parameter_name="cap_rate",
+            geographic_code="35620",
+            forecast_values=[6.2],
+            lower_bound=[5.8],
+            upper_bound=[6.6],
+            forecast_dates=["2025-12-31"],
+            historical_data_points=10,
+            model_performance={},
+            trend_info={"overall_trend": "increasing", "trend_strength": 1.0},
+        )
+
+        with patch.object(forecaster, "load_historical_data"), patch.object(
+            forecaster, "fit_model"
+        ), patch.object(forecaster, "generate_forecast", return_value=forecast_result):
+            forecaster.run_complete_forecast(horizon_years=1, create_plot=False)
+            mock_invalidate.assert_called_once_with("35620")
+
+            mock_invalidate.reset_mock()
+            mock_db_manager.save_prophet_forecast.side_effect = Exception("locked")
+            forecaster.run_complete_forecast(horizon_years=1, create_plot=False)
+            mock_invalidate.assert_not_called()
+
 
 class TestProFormaProphetEngine:
     """Test cases for ProFormaProphetEngine class."""
@@ -413,7 +938,7 @@ class TestProFormaProphetEngine:
         """Test forecast generation handles individual metric failures gracefully."""
 
         # Setup - first forecaster succeeds, second fails, third succeeds
-        def create_forecaster_side_effect(param_name, geo_code):
+        def create_forecaster_side_effect(param_name, geo_code, **kwargs):
             mock_forecaster = Mock()
             if param_name == "commercial_mortgage_rate":  # Make one fail
                 mock_forecaster.run_complete_forecast.side_effect = Exception(
@@ -449,6 +974,116 @@ class TestProFormaProphetEngine:
             "commercial_mortgage_rate" not in forecasts
         )  # Failed metric should be missing
 
+    @patch("forecasting.prophet_engine.ProphetForecaster")
+    def test_generate_forecasts_for_msas_shares_national_fits(
+        self, mock_forecaster_class
+    ):
+        """Test multi-MSA refresh fits national metrics once for all MSAs."""
+
+        def create_forecaster_side_effect(param_name, geo_code, **kwargs):
+            mock_forecaster = Mock()
+            mock_forecaster.run_complete_forecast.return_value = (
+                f"{param_name}:{geo_code}"
+            )
+            return mock_forecaster
+
+        mock_forecaster_class.side_effect = create_forecaster_side_effect
+
+        engine = ProFormaProphetEngine()
+        forecasts = engine.generate_forecasts_for_msas(
+            ["35620", "31080"], horizon_years=3, parallel=False
+        )
+
+        # 3 national + 8 per MSA
+        assert mock_forecaster_class.call_count == 3 + 8 * 2
+        assert forecasts["35620"]["cap_rate"] == "cap_rate:35620"
+        assert forecasts["31080"]["cap_rate"] == "cap_rate:31080"
+        assert forecasts["31080"]["treasury_10y"] == "treasury_10y:NATIONAL"
+        assert forecasts["35620"]["treasury_10y"] == "treasury_10y:NATIONAL"
+
+    @patch("forecasting.prophet_engine.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("forecasting.prophet_engine.ProphetForecaster")
+    def test_generate_forecasts_for_msa_parallel_mode(self, mock_forecaster_class):
+        """Test parallel mode submits every metric and isolates failures."""
+
+        def create_forecaster_side_effect(param_name, geo_code, **kwargs):
+            assert kwargs["fit_timeout_seconds"] == 5
+            # Pool workers must not leave validation threads behind
+            assert kwargs["validation_mode"] == "eager"
+            mock_forecaster = Mock()
+            if param_name == "vacancy_rate":
+                mock_forecaster.run_complete_forecast.side_effect = TimeoutError(
+                    "Prophet fit exceeded 5s"
+                )
+            else:
+                mock_forecaster.run_complete_forecast.return_value = param_name
+            return mock_forecaster
+
+        mock_forecaster_class.side_effect = create_forecaster_side_effect
+
+        engine = ProFormaProphetEngine()
+        forecasts = engine.generate_forecasts_for_msa(
+            "35620", parallel=True, num_workers=4, timeout_seconds=5
+        )
+
+        assert len(forecasts) == 10
+        assert "vacancy_rate" not in forecasts
+        assert forecasts["cap_rate"] == "cap_rate"
+
+    @patch("forecasting.prophet_engine.invalidate_forecasts")
+    @patch("forecasting.prophet_engine.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("forecasting.prophet_engine.ProphetForecaster")
+    def test_parallel_mode_invalidates_parent_forecast_caches(
+        self, mock_forecaster_class, mock_invalidate
+    ):
+        """Test the caller's cached forecasts are cleared for successful fits."""
+
+        def create_forecaster_side_effect(param_name, geo_code, **kwargs):
+            mock_forecaster = Mock()
+            if geo_code == "NATIONAL":
+                mock_forecaster.run_complete_forecast.return_value = param_name
+            else:
+                mock_forecaster.run_complete_forecast.side_effect = ValueError(
+                    "No historical data"
+                )
+            return mock_forecaster
+
+        mock_forecaster_class.side_effect = create_forecaster_side_effect
+
+        engine = ProFormaProphetEngine()
+        forecasts = engine.generate_forecasts_for_msa("35620", parallel=True)
+
+        # Workers invalidate in their own process; only national fits succeeded
+        assert set(forecasts) == {
+            "treasury_10y",
+            "commercial_mortgage_rate",
+            "fed_funds_rate",
+        }
+        mock_invalidate.assert_called_once_with("NATIONAL")
+
+        mock_invalidate.reset_mock()
+        engine.generate_forecasts_for_msa("35620", parallel=False)
+        mock_invalidate.assert_not_called()
+
+    @patch("forecasting.prophet_engine.db_manager")
+    def test_fit_timeout_terminates_stan_fit(self, mock_db_manager, monkeypatch):
+        """Test a Stan fit exceeding its time limit is stopped with an error."""
+        mock_db_manager.get_prophet_model_params.return_value = None
+        monkeypatch.setattr(settings.forecast, "model_store", False)
+        forecaster = ProphetForecaster("cap_rate", "35620", fit_timeout_seconds=1e-4)
+        forecaster.historical_data = pd.DataFrame(
+            {
+                "ds": pd.date_range("2000-01-01", periods=20, freq="YS"),
+                "y": 5.0 + 0.1 * np.arange(20),
+            }
+        )
+        start = time.monotonic()
+
+        with pytest.raises(Exception, match="timed out"):
+            forecaster.fit_model()
+
+        assert time.monotonic() - start < 5
+
     def test_get_forecast_values_for_monte_carlo_success(self):
         """Test extracting forecast values for Monte Carlo analysis."""
         engine = ProFormaProphetEngine()
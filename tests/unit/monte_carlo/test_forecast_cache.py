@@ -0,0 +1,131 @@
+"""
+Unit Tests for the Monte Carlo Forecast Cache
+
+Tests the monte_carlo.forecast_cache module following BDD/TDD principles.
+"""
+
+import weakref
+from unittest.mock import patch
+
+from monte_carlo import forecast_cache
+from monte_carlo.forecast_cache import (
+    ForecastCache,
+    forecast_cache_stats,
+    invalidate_forecasts,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestForecastCache:
+    """Test cases for ForecastCache."""
+
+    def test_least_recently_used_entry_should_be_evicted(self):
+        """
+        GIVEN a cache bounded to two entries
+        WHEN a third entry is stored after reading the first
+        THEN the least recently used entry should be evicted
+        """
+        # Arrange
+        cache = ForecastCache(max_entries=2, ttl_seconds=0)
+        cache["35620_5"] = {"cap_rate": 1}
+        cache["31080_5"] = {"cap_rate": 2}
+
+        # Act
+        cache.get("35620_5")
+        cache["16980_5"] = {"cap_rate": 3}
+
+        # Assert
+        assert "35620_5" in cache
+        assert "31080_5" not in cache
+        assert cache.get("31080_5") is None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_should_expire_after_ttl(self):
+        """
+        GIVEN a cache with a 60 second TTL
+        WHEN an entry is read after the TTL has elapsed
+        THEN it should be treated as missing and counted as expired
+        """
+        # Arrange
+        clock = FakeClock()
+        cache = ForecastCache(max_entries=4, ttl_seconds=60, clock=clock)
+        cache["35620_5"] = {"cap_rate": 1}
+
+        # Act
+        clock.now = 30
+        fresh = cache.get("35620_5")
+        clock.now = 91
+        stale = cache.get("35620_5")
+
+        # Assert
+        assert fresh == {"cap_rate": 1}
+        assert stale is None
+        assert len(cache) == 0
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_forecasts_should_target_msa_or_clear_for_national(self):
+        """
+        GIVEN registered caches holding several MSAs and horizons
+        WHEN invalidating an MSA and then national forecasts
+        THEN the MSA's entries should go first and every entry after NATIONAL
+        """
+        # Arrange
+        cache = ForecastCache(max_entries=8, ttl_seconds=0)
+        cache["35620_5"] = {}
+        cache["35620_10"] = {}
+        cache["31080_5"] = {}
+
+        # Act
+        invalidate_forecasts("35620")
+        remaining_after_msa = len(cache)
+        invalidate_forecasts("NATIONAL")
+
+        # Assert
+        assert remaining_after_msa == 1
+        assert len(cache) == 0
+        assert cache.stats()["invalidations"] == 3
+        assert forecast_cache_stats()["invalidations"] >= 3
+
+    def test_forecast_cache_stats_should_only_count_caches_of_the_requested_kind(
+        self,
+    ):
+        """
+        GIVEN a forecast cache and a factorization cache sharing the registry
+        WHEN reading forecast cache statistics
+        THEN only the forecast cache's counters should be reported, while
+            invalidation still reaches both
+        """
+        # Arrange
+        with patch.object(forecast_cache, "_registry", weakref.WeakSet()):
+            forecasts = ForecastCache(max_entries=4, ttl_seconds=0)
+            factorizations = ForecastCache(
+                max_entries=4, ttl_seconds=0, kind="factorization"
+            )
+            forecasts["35620_5"] = {}
+            factorizations["35620_5_correlated"] = ({}, None)
+            forecasts.get("35620_5")
+            factorizations.get("31080_5_correlated")
+
+            # Act
+            forecast_stats = forecast_cache_stats()
+            factorization_stats = forecast_cache_stats("factorization")
+            dropped = invalidate_forecasts("35620")
+
+        # Assert
+        assert forecast_stats["caches"] == 1
+        assert forecast_stats["size"] == 1
+        assert forecast_stats["hits"] == 1
+        assert forecast_stats["misses"] == 0
+        assert factorization_stats["misses"] == 1
+        assert dropped == 2
@@ -0,0 +1,98 @@
+"""
+Unit Tests for Columnar Scenario Storage
+
+Tests the monte_carlo.scenario_batch module following BDD/TDD principles.
+"""
+
+import numpy as np
+import pytest
+
+from core.exceptions import ValidationError
+from monte_carlo.scenario_batch import MonteCarloScenario, ScenarioBatch
+
+
+class TestScenarioBatch:
+    """Test cases for ScenarioBatch."""
+
+    @pytest.fixture
+    def batch(self):
+        """Three scenarios, two parameters, four years."""
+        samples = np.arange(24, dtype=float).reshape(3, 4, 2)  # (n, years, params)
+        batch = ScenarioBatch.from_tensor(samples, ["cap_rate", "rent_growth"])
+        batch.summaries = {"growth_score": np.array([0.2, 0.9, 0.5])}
+        batch.market_scenario_codes = np.array([1, 0, 4], dtype=np.int8)
+        batch.percentile_ranks = np.array([0.0, 66.7, 33.3])
+        return batch
+
+    def test_from_tensor_should_store_parameter_year_axes(self, batch):
+        """
+        GIVEN a (scenarios, years, parameters) sample tensor
+        WHEN building a batch
+        THEN values should be one contiguous (scenarios, parameters, years) array
+        """
+        assert batch.values.shape == (3, 2, 4)
+        assert batch.values.dtype == np.float64
+        assert batch.values.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(batch.parameter("cap_rate")[0], [0, 2, 4, 6])
+        assert batch.num_scenarios == 3
+        assert batch.horizon_years == 4
+
+    def test_indexing_should_build_scenario_views(self, batch):
+        """
+        GIVEN a populated batch
+        WHEN indexing into it
+        THEN it should return MonteCarloScenario views with summaries and ranks
+        """
+        scenario = batch[1]
+
+        assert isinstance(scenario, MonteCarloScenario)
+        assert scenario.scenario_id == 1
+        assert scenario.forecasted_parameters["rent_growth"] == [9.0, 11.0, 13.0, 15.0]
+        assert scenario.scenario_summary["growth_score"] == 0.9
+        assert scenario.scenario_summary["market_scenario"] == "bull_market"
+        assert scenario.percentile_rank == pytest.approx(66.7)
+        assert batch[-1].scenario_id == 2
+
+    def test_slicing_and_iteration_should_follow_sequence_protocol(self, batch):
+        """
+        GIVEN a populated batch
+        WHEN slicing or iterating
+        THEN it should behave like a list of scenarios
+        """
+        assert [s.scenario_id for s in batch[:2]] == [0, 1]
+        assert [s.scenario_id for s in batch] == [0, 1, 2]
+        assert len(batch) == 3
+        assert list(batch.market_scenarios()) == [
+            "bear_market",
+            "bull_market",
+            "neutral_market",
+        ]
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_mismatched_parameter_names_should_raise_error(self):
+        """
+        GIVEN values whose parameter axis does not match the names
+        WHEN building a batch
+        THEN it should raise ValidationError
+        """
+        with pytest.raises(ValidationError):
+            ScenarioBatch(values=np.zeros((2, 3, 5)), parameter_names=["cap_rate"])
+
+    def test_from_scenarios_should_round_trip_views(self, batch):
+        """
+        GIVEN scenario views taken from a batch
+        WHEN packing them back into a batch
+        THEN values, summaries, market codes and ranks should match
+        """
+        packed = ScenarioBatch.from_scenarios(list(batch))
+
+        np.testing.assert_array_equal(packed.values, batch.values)
+        np.testing.assert_array_equal(
+            packed.summaries["growth_score"], batch.summaries["growth_score"]
+        )
+        assert list(packed.market_scenarios()) == list(batch.market_scenarios())
+        np.testing.assert_array_equal(packed.percentile_ranks, batch.percentile_ranks)
+
+        empty = ScenarioBatch.from_scenarios([], ["cap_rate"], horizon_years=5)
+        assert empty.values.shape == (0, 1, 5)
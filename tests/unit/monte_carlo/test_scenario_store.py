@@ -0,0 +1,90 @@
+"""
+Unit Tests for the Scenario Store
+
+Tests the monte_carlo.scenario_store module following BDD/TDD principles.
+"""
+
+import numpy as np
+import pytest
+
+from core.exceptions import DataNotFoundError, ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
+from monte_carlo.scenario_store import ScenarioStore
+
+
+class TestScenarioStore:
+    """Test cases for ScenarioStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Store rooted in a temporary directory."""
+        return ScenarioStore(tmp_path / "simulations")
+
+    @pytest.fixture
+    def batch(self):
+        """Four scenarios, two parameters, three years with scores."""
+        samples = np.arange(24, dtype=float).reshape(4, 3, 2)
+        batch = ScenarioBatch.from_tensor(samples, ["cap_rate", "rent_growth"])
+        batch.summaries = {"growth_score": np.array([0.2, 0.9, 0.5, 0.1])}
+        batch.market_scenario_codes = np.array([1, 0, 4, 3], dtype=np.int8)
+        batch.percentile_ranks = np.array([25.0, 75.0, 50.0, 0.0])
+        return batch
+
+    def test_saved_batch_should_reload_memory_mapped(self, store, batch):
+        """
+        GIVEN a scored batch saved with metadata and an extra array
+        WHEN loading it back with memory mapping
+        THEN every column should round-trip without being read into memory
+        """
+        # Arrange
+        correlation = np.eye(2)
+        store.save("run_001", batch, {"msa_code": "35620"}, {"corr": correlation})
+
+        # Act
+        loaded, metadata, arrays = store.load("run_001")
+
+        # Assert
+        assert isinstance(loaded.values.base, np.memmap)
+        np.testing.assert_array_equal(loaded.values, batch.values)
+        np.testing.assert_array_equal(
+            loaded.summaries["growth_score"], batch.summaries["growth_score"]
+        )
+        assert loaded.market_scenarios().tolist() == batch.market_scenarios().tolist()
+        assert loaded[2] == batch[2]
+        assert metadata == {"msa_code": "35620"}
+        np.testing.assert_array_equal(arrays["corr"], correlation)
+        assert store.list_simulations() == ["run_001"]
+
+    def test_save_should_replace_existing_simulation(self, store, batch):
+        """
+        GIVEN a simulation id that is already stored
+        WHEN saving a different batch under the same id
+        THEN the new batch should replace the old one entirely
+        """
+        # Arrange
+        store.save("run_001", batch)
+        smaller = ScenarioBatch(
+            values=batch.values[:2], parameter_names=batch.parameter_names
+        )
+
+        # Act
+        store.save("run_001", smaller)
+        loaded, _, _ = store.load("run_001", mmap=False)
+
+        # Assert
+        assert loaded.num_scenarios == 2
+        assert loaded.summaries == {}
+        assert loaded.market_scenario_codes is None
+
+    def test_missing_or_unsafe_ids_should_raise(self, store):
+        """
+        GIVEN an unknown simulation id and one escaping the store directory
+        WHEN loading them
+        THEN DataNotFoundError and ValidationError should be raised
+        """
+        # Act & Assert
+        with pytest.raises(DataNotFoundError):
+            store.load("never_saved")
+        with pytest.raises(ValidationError):
+            store.load("../outside")
+        assert store.delete("never_saved") is False
@@ -0,0 +1,133 @@
+"""
+Unit Tests for Scenario Shocks
+
+Tests the monte_carlo.shocks module following BDD/TDD principles.
+"""
+
+import numpy as np
+import pytest
+
+from core.exceptions import ValidationError
+from monte_carlo.scenario_batch import ScenarioBatch
+from monte_carlo.shocks import ScenarioShock, shock_scenarios
+
+
+class TestShockScenarios:
+    """Test cases for shock_scenarios."""
+
+    @pytest.fixture
+    def batch(self):
+        """Correlated treasury and cap rate paths plus an unrelated parameter."""
+        rng = np.random.default_rng(0)
+        treasury = rng.normal(0.04, 0.01, size=(5000, 5))
+        cap_rate = 0.02 + 0.8 * treasury + rng.normal(0, 0.006, size=(5000, 5))
+        reserves = rng.normal(3.0, 0.5, size=(5000, 5))
+        return ScenarioBatch(
+            values=np.stack([treasury, cap_rate, reserves], axis=1),
+            parameter_names=["treasury_10y", "cap_rate", "lender_reserves"],
+        )
+
+    def test_additive_and_multiplicative_shocks_should_shift_selected_years(
+        self, batch
+    ):
+        """
+        GIVEN a +150bp treasury shock and a 10% cap rate shock in years 3-4
+        WHEN shocking the batch
+        THEN only those paths and years should move and the input stays unchanged
+        """
+        # Arrange
+        original = batch.values.copy()
+        shocks = [
+            ScenarioShock("treasury_10y", 0.015),
+            ScenarioShock("cap_rate", 1.10, mode="multiplicative", years=[3, 4]),
+        ]
+
+        # Act
+        shocked = shock_scenarios(batch, shocks)
+
+        # Assert
+        np.testing.assert_allclose(
+            shocked.parameter("treasury_10y"), batch.parameter("treasury_10y") + 0.015
+        )
+        cap_rate = batch.parameter("cap_rate")
+        np.testing.assert_array_equal(
+            shocked.parameter("cap_rate")[:, :3], cap_rate[:, :3]
+        )
+        np.testing.assert_allclose(
+            shocked.parameter("cap_rate")[:, 3:], cap_rate[:, 3:] * 1.10
+        )
+        np.testing.assert_array_equal(
+            shocked.parameter("lender_reserves"), batch.parameter("lender_reserves")
+        )
+        np.testing.assert_array_equal(batch.values, original)
+
+    def test_propagated_shock_should_move_correlated_parameters(self, batch):
+        """
+        GIVEN a treasury shock with correlation propagation
+        WHEN shocking the batch with an estimated correlation matrix
+        THEN cap rates should rise by roughly their regression beta on treasuries
+        """
+        # Arrange
+        shocks = [ScenarioShock("treasury_10y", 0.015)]
+
+        # Act
+        shocked = shock_scenarios(batch, shocks, propagate=True)
+
+        # Assert
+        cap_shift = (shocked.parameter("cap_rate") - batch.parameter("cap_rate")).mean()
+        assert cap_shift == pytest.approx(0.8 * 0.015, rel=0.1)
+        reserves_shift = (
+            shocked.parameter("lender_reserves") - batch.parameter("lender_reserves")
+        ).mean()
+        assert abs(reserves_shift) < 0.05
+
+    def test_two_correlated_shocks_should_shift_by_conditional_mean(self):
+        """
+        GIVEN +1 sigma shocks to two rates correlated 0.85 with each other and
+            0.6 with cap rates
+        WHEN propagating through that correlation matrix
+        THEN cap rates should move by Sigma_ts Sigma_ss^-1 delta, not the sum of
+            both pairwise shifts
+        """
+        # Arrange
+        rng = np.random.default_rng(1)
+        values = rng.normal(0.0, 1.0, size=(4000, 3, 2)) * np.array(
+            [0.01, 0.008, 0.005]
+        ).reshape(1, 3, 1)
+        batch = ScenarioBatch(
+            values=values,
+            parameter_names=["treasury_10y", "commercial_mortgage_rate", "cap_rate"],
+        )
+        correlation = np.array([[1.0, 0.85, 0.6], [0.85, 1.0, 0.6], [0.6, 0.6, 1.0]])
+        std = batch.values.std(axis=0)
+        shocks = [
+            ScenarioShock("treasury_10y", std[0, 0]),
+            ScenarioShock("commercial_mortgage_rate", std[1, 0]),
+        ]
+
+        # Act
+        shocked = shock_scenarios(
+            batch, shocks, correlation_matrix=correlation, propagate=True
+        )
+
+        # Assert
+        expected_z = np.array([0.6, 0.6]) @ np.linalg.solve(
+            correlation[:2, :2], np.ones(2)
+        )
+        assert expected_z == pytest.approx(0.6486, abs=1e-4)
+        cap_shift = shocked.parameter("cap_rate") - batch.parameter("cap_rate")
+        np.testing.assert_allclose(cap_shift[:, 0], expected_z * std[2, 0])
+
+    def test_invalid_shocks_should_raise_validation_error(self, batch):
+        """
+        GIVEN shocks on an unknown parameter, year or mode
+        WHEN building or applying them
+        THEN a ValidationError should be raised
+        """
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            shock_scenarios(batch, [ScenarioShock("gdp_growth", 0.01)])
+        with pytest.raises(ValidationError):
+            shock_scenarios(batch, [ScenarioShock("cap_rate", 0.01, years=[5])])
+        with pytest.raises(ValidationError):
+            ScenarioShock("cap_rate", 0.01, mode="exponential")
@@ -5,12 +5,17 @@ Tests the monte_carlo.simulation_engine module following BDD/TDD principles.
 """
 
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
 
-from core.exceptions import MonteCarloError
+from config.settings import settings
+from core.exceptions import MonteCarloError, ValidationError
+from monte_carlo.forecast_cache import invalidate_forecasts
+from monte_carlo.scenario_batch import ScenarioBatch
+from monte_carlo.scenario_store import ScenarioStore
+from monte_carlo.shocks import ScenarioShock
 from monte_carlo.simulation_engine import (
     MonteCarloEngine,
     MonteCarloResults,
@@ -25,6 +30,18 @@ from src.domain.entities.property_data import (
 )
 
 
+def _bulk_lookup(single_lookup):
+    """Adapt a per-pair forecast mock to the bulk loader's signature."""
+
+    def lookup(pairs, horizon_years, max_age_days):
+        return {
+            (param, geo): single_lookup(param, geo, horizon_years, max_age_days)
+            for param, geo in pairs
+        }
+
+    return lookup
+
+
 class TestMonteCarloEngine:
     """Test cases for MonteCarloEngine."""
 
@@ -172,7 +189,9 @@ class TestMonteCarloEngine:
                 "trend_info": f'{{"trend": "{data["trend_info"]["trend"]}"}}',
             }
 
-        mock_db_manager.get_cached_prophet_forecast.side_effect = mock_forecast_data
+        mock_db_manager.get_cached_prophet_forecasts.side_effect = _bulk_lookup(
+            mock_forecast_data
+        )
 
         # Act
         forecasts = engine.load_forecasts_for_msa("35620", 5)
@@ -208,7 +227,7 @@ class TestMonteCarloEngine:
         THEN it should raise DataNotFoundError
         """
         # Arrange - return None for missing data
-        mock_db_manager.get_cached_prophet_forecast.return_value = None
+        mock_db_manager.get_cached_prophet_forecasts.return_value = {}
 
         # Act & Assert
         with pytest.raises(MonteCarloError) as exc_info:
@@ -270,7 +289,9 @@ class TestMonteCarloEngine:
                 "trend_info": f'{{"trend": "{data["trend_info"]["trend"]}"}}',
             }
 
-        mock_db_manager.get_cached_prophet_forecast.side_effect = mock_forecast_data
+        mock_db_manager.get_cached_prophet_forecasts.side_effect = _bulk_lookup(
+            mock_forecast_data
+        )
 
         # Act
         results = engine.generate_scenarios(
@@ -287,6 +308,8 @@ class TestMonteCarloEngine:
         assert results.num_scenarios == 10
         assert results.horizon_years == 5
         assert len(results.scenarios) == 10
+        assert isinstance(results.scenarios, ScenarioBatch)
+        assert results.scenarios.values.shape == (10, 11, 5)
 
         # Verify scenario structure
         scenario = results.scenarios[0]
@@ -334,7 +357,9 @@ class TestMonteCarloEngine:
                 "trend_info": f'{{"trend": "{data["trend_info"]["trend"]}"}}',
             }
 
-        mock_db_manager.get_cached_prophet_forecast.side_effect = mock_forecast_data
+        mock_db_manager.get_cached_prophet_forecasts.side_effect = _bulk_lookup(
+            mock_forecast_data
+        )
 
         # Act
         results = engine.generate_scenarios(
@@ -349,6 +374,98 @@ class TestMonteCarloEngine:
         assert len(results.scenarios) == 5
         assert results.correlation_matrix is None  # No correlation matrix when disabled
 
+    def test_sample_scenario_tensor_should_match_forecast_moments(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN forecast means, intervals and a correlation matrix
+        WHEN drawing the vectorized scenario tensor
+        THEN draws should reproduce the forecast means, spreads and correlations
+        """
+        # Arrange
+        correlation_matrix, param_names = engine.estimate_correlation_matrix(
+            sample_forecast_data
+        )
+        param_stats = {
+            name: {
+                "mean": np.array(data["values"]),
+                "std": (np.array(data["upper_bound"]) - np.array(data["lower_bound"]))
+                / (2 * 1.96),
+            }
+            for name, data in sample_forecast_data.items()
+        }
+
+        # Act
+        samples = engine._sample_scenario_tensor(
+            param_names,
+            param_stats,
+            50000,
+            5,
+            correlation_matrix,
+            np.random.default_rng(7),
+        )
+
+        # Assert
+        assert samples.shape == (50000, 5, 11)
+        treasury_idx = param_names.index("treasury_10y")
+        mortgage_idx = param_names.index("commercial_mortgage_rate")
+        year_3 = samples[:, 2, :]
+        np.testing.assert_allclose(
+            year_3.mean(axis=0),
+            [param_stats[name]["mean"][2] for name in param_names],
+            atol=1e-3,
+        )
+        expected_std = np.array([param_stats[name]["std"][2] for name in param_names])
+        expected_std *= np.sqrt(np.diag(correlation_matrix))
+        np.testing.assert_allclose(year_3.std(axis=0), expected_std, rtol=0.02)
+        observed_corr = np.corrcoef(year_3[:, treasury_idx], year_3[:, mortgage_idx])
+        expected_corr = correlation_matrix[treasury_idx, mortgage_idx] / np.sqrt(
+            correlation_matrix[treasury_idx, treasury_idx]
+            * correlation_matrix[mortgage_idx, mortgage_idx]
+        )
+        assert observed_corr[0, 1] == pytest.approx(expected_corr, abs=0.02)
+
+    @patch("monte_carlo.simulation_engine.db_manager")
+    def test_generate_scenarios_legacy_sampling_should_still_work(
+        self, mock_db_manager, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN vectorized sampling disabled
+        WHEN generating Monte Carlo scenarios
+        THEN the per-scenario sampling path should produce the same structure
+        """
+
+        # Arrange
+        def mock_forecast_data(param_name, geo_code, horizon_years, max_age_days):
+            data = sample_forecast_data[param_name]
+            dates_json = "[" + ", ".join(f'"{d}"' for d in data["dates"]) + "]"
+            return {
+                "forecast_values": f'[{", ".join(map(str, data["values"]))}]',
+                "lower_bound": f'[{", ".join(map(str, data["lower_bound"]))}]',
+                "upper_bound": f'[{", ".join(map(str, data["upper_bound"]))}]',
+                "forecast_dates": dates_json,
+                "model_performance": f'{{"mape": {data["performance"]["mape"]}}}',
+                "trend_info": f'{{"trend": "{data["trend_info"]["trend"]}"}}',
+            }
+
+        mock_db_manager.get_cached_prophet_forecasts.side_effect = _bulk_lookup(
+            mock_forecast_data
+        )
+
+        # Act
+        results = engine.generate_scenarios(
+            sample_property_data,
+            num_scenarios=5,
+            horizon_years=5,
+            use_correlations=True,
+            vectorized=False,
+        )
+
+        # Assert
+        assert len(results.scenarios) == 5
+        assert len(results.scenarios[0].forecasted_parameters["cap_rate"]) == 5
+        assert "growth_score" in results.scenarios[0].scenario_summary
+
     def test_classify_market_scenario_should_return_correct_classification(
         self, engine
     ):
@@ -453,6 +570,42 @@ class TestMonteCarloEngine:
         assert 0.0 <= risk_score <= 1.0
         assert risk_score < 0.4  # Should be low
 
+    def test_batch_scoring_should_match_scalar_scoring(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN a batch of widely dispersed scenarios
+        WHEN scoring and classifying the whole batch at once
+        THEN results should equal the per-scenario scalar calculations
+        """
+        # Arrange
+        param_names = list(sample_forecast_data.keys())
+        means = np.array([sample_forecast_data[p]["values"] for p in param_names])
+        rng = np.random.default_rng(3)
+        values = means[np.newaxis] * rng.uniform(0.0, 2.5, size=(2000, 11, 5))
+        batch = ScenarioBatch(values=values, parameter_names=param_names)
+
+        # Act
+        growth_scores = engine._calculate_growth_scores(batch)
+        risk_scores = engine._calculate_risk_scores(batch)
+        codes = engine._classify_market_scenarios(growth_scores, risk_scores)
+
+        # Assert
+        batch.market_scenario_codes = codes
+        labels = batch.market_scenarios()
+        for i in range(batch.num_scenarios):
+            params = {
+                name: list(values[i, idx]) for idx, name in enumerate(param_names)
+            }
+            assert growth_scores[i] == pytest.approx(
+                engine._calculate_growth_score(params), abs=1e-12
+            )
+            assert risk_scores[i] == pytest.approx(
+                engine._calculate_risk_score(params), abs=1e-12
+            )
+            assert labels[i] == engine._classify_market_scenario(params)
+        assert len(set(labels)) == 5  # Every market regime is exercised
+
     def test_identify_extreme_scenarios_should_find_extremes(self, engine):
         """
         GIVEN list of scenarios with varying characteristics
@@ -502,8 +655,8 @@ class TestMonteCarloEngine:
     ):
         """
         GIVEN Monte Carlo results
-        WHEN saving results
-        THEN it should store in database
+        WHEN saving results twice
+        THEN each save should store a database row under its own id
         """
         # Arrange
         results = MonteCarloResults(
@@ -520,15 +673,128 @@ class TestMonteCarloEngine:
         )
 
         # Act
-        engine.save_results(results)
+        first_id = engine.save_results(results)
+        second_id = engine.save_results(results)
 
         # Assert
-        mock_db_manager.insert_data.assert_called_once()
+        assert mock_db_manager.insert_data.call_count == 2
         call_args = mock_db_manager.insert_data.call_args
         assert call_args[0][0] == "forecast_cache"
         assert call_args[0][1] == "monte_carlo_results"
-        assert "simulation_id" in call_args[0][2]
+        assert call_args[0][2]["simulation_id"] == second_id
         assert "result_statistics" in call_args[0][2]
+        assert first_id.startswith(f"test_property_001_{date.today().isoformat()}_")
+        assert first_id != second_id
+
+    @patch("monte_carlo.simulation_engine.db_manager")
+    def test_save_results_should_skip_scenarios_when_insert_fails(
+        self, mock_db_manager, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN a database that rejects the results row
+        WHEN saving results with scenario persistence enabled
+        THEN no simulation id should be returned and no scenarios written
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+        results = engine.generate_scenarios(
+            sample_property_data, num_scenarios=20, seed=3
+        )
+        mock_db_manager.insert_data.side_effect = RuntimeError("disk full")
+        store = Mock()
+
+        # Act
+        simulation_id = engine.save_results(
+            results, persist_scenarios=True, store=store
+        )
+
+        # Assert
+        assert simulation_id is None
+        store.save.assert_not_called()
+
+    @patch("monte_carlo.simulation_engine.db_manager")
+    def test_persisted_results_should_reload_without_resimulating(
+        self,
+        mock_db_manager,
+        engine,
+        sample_property_data,
+        sample_forecast_data,
+        tmp_path,
+    ):
+        """
+        GIVEN results saved with scenario persistence enabled
+        WHEN loading them back by simulation id
+        THEN scenarios, scores and run statistics should match the original run
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+        results = engine.generate_scenarios(
+            sample_property_data, num_scenarios=200, seed=3
+        )
+        store = ScenarioStore(tmp_path)
+
+        # Act
+        simulation_id = engine.save_results(
+            results, persist_scenarios=True, store=store
+        )
+        loaded = engine.load_results(simulation_id, store=store)
+
+        # Assert
+        assert mock_db_manager.insert_data.call_args[0][2]["simulation_id"] == (
+            simulation_id
+        )
+        np.testing.assert_array_equal(loaded.scenarios.values, results.scenarios.values)
+        np.testing.assert_array_equal(
+            loaded.scenarios.percentile_ranks, results.scenarios.percentile_ranks
+        )
+        assert loaded.scenarios[7] == results.scenarios[7]
+        assert loaded.summary_statistics == results.summary_statistics
+        best_growth = results.extreme_scenarios["best_growth"]
+        assert loaded.extreme_scenarios["best_growth"].scenario_id == (
+            best_growth.scenario_id
+        )
+        np.testing.assert_array_equal(
+            loaded.correlation_matrix, results.correlation_matrix
+        )
+        assert loaded.seed == 3
+
+    def test_apply_shocks_should_rescore_without_resampling(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN a generated run
+        WHEN applying a rent growth shock
+        THEN scores should be recomputed on the shocked paths only
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+        results = engine.generate_scenarios(
+            sample_property_data, num_scenarios=500, seed=8
+        )
+        baseline_scores = results.scenarios.summaries["growth_score"].copy()
+
+        # Act
+        shocked = engine.apply_shocks(results, [ScenarioShock("rent_growth", 0.02)])
+
+        # Assert
+        np.testing.assert_allclose(
+            shocked.scenarios.parameter("rent_growth"),
+            results.scenarios.parameter("rent_growth") + 0.02,
+        )
+        np.testing.assert_array_equal(
+            shocked.scenarios.parameter("cap_rate"),
+            results.scenarios.parameter("cap_rate"),
+        )
+        assert (shocked.scenarios.summaries["growth_score"] >= baseline_scores).all()
+        assert shocked.scenarios.summaries["growth_score"].mean() > (
+            baseline_scores.mean()
+        )
+        assert shocked.summary_statistics["rent_growth"]["mean"] == pytest.approx(
+            results.summary_statistics["rent_growth"]["mean"] + 0.02
+        )
+        np.testing.assert_array_equal(
+            results.scenarios.summaries["growth_score"], baseline_scores
+        )
 
     def test_make_positive_definite_should_ensure_positive_eigenvalues(self, engine):
         """
@@ -574,3 +840,514 @@ class TestMonteCarloEngine:
         assert scenarios[4].percentile_rank == 80.0
         # Scenario with growth_score 0.5 should be at 40th percentile
         assert scenarios[2].percentile_rank == 40.0
+
+    def test_calculate_percentile_ranks_should_count_ties_as_not_lower(self, engine):
+        """
+        GIVEN a batch with tied growth scores
+        WHEN calculating percentile ranks
+        THEN tied scenarios should share the rank of the strictly lower count
+        """
+        # Arrange
+        batch = ScenarioBatch(values=np.zeros((5, 1, 5)), parameter_names=["cap_rate"])
+        batch.summaries = {"growth_score": np.array([0.5, 0.1, 0.5, 0.9, 0.1])}
+
+        # Act
+        engine._calculate_percentile_ranks(batch)
+
+        # Assert
+        np.testing.assert_array_equal(batch.percentile_ranks, [40, 0, 40, 80, 0])
+        assert batch[3].percentile_rank == 80.0
+
+    def test_identify_extreme_scenarios_should_match_for_batch_and_list(self, engine):
+        """
+        GIVEN the same scenarios as a batch and as a list, including ties
+        WHEN identifying extreme scenarios
+        THEN both should pick the first minimum and the last maximum
+        """
+        # Arrange
+        rng = np.random.default_rng(11)
+        values = np.round(rng.uniform(0.03, 0.07, size=(200, 2, 5)), 2)
+        batch = ScenarioBatch(
+            values=values, parameter_names=["cap_rate", "rent_growth"]
+        )
+        engine._summarize_scenarios(batch)
+        batch.summaries["growth_score"] = np.round(batch.summaries["growth_score"], 1)
+        scenario_list = list(batch)
+
+        # Act
+        batch_extremes = engine._identify_extreme_scenarios(batch)
+        list_extremes = engine._identify_extreme_scenarios(scenario_list)
+
+        # Assert
+        assert set(batch_extremes) == set(list_extremes)
+        for label, scenario in list_extremes.items():
+            assert batch_extremes[label].scenario_id == scenario.scenario_id
+        growth = batch.summaries["growth_score"]
+        assert batch_extremes["worst_growth"].scenario_id == int(np.argmin(growth))
+        assert batch_extremes["best_growth"].scenario_id == int(
+            np.flatnonzero(growth == growth.max())[-1]
+        )
+
+    def test_summary_statistics_should_agree_across_percentile_methods(self, engine):
+        """
+        GIVEN a scenario batch
+        WHEN summarizing with exact percentiles and with the t-digest sketch
+        THEN both should report the same moments and close percentiles
+        """
+        # Arrange
+        values = np.random.default_rng(9).normal(0.05, 0.01, size=(20000, 1, 5))
+        batch = ScenarioBatch(values=values, parameter_names=["cap_rate"])
+
+        # Act
+        exact = engine._calculate_summary_statistics(batch, ["cap_rate"])["cap_rate"]
+        with patch.object(settings.monte_carlo, "percentile_method", "tdigest"):
+            sketch = engine._calculate_summary_statistics(batch, ["cap_rate"])[
+                "cap_rate"
+            ]
+
+        # Assert
+        assert exact["p95"] == pytest.approx(np.percentile(values, 95))
+        assert sketch["mean"] == pytest.approx(exact["mean"])
+        assert sketch["std"] == pytest.approx(exact["std"])
+        for p in settings.monte_carlo.percentiles:
+            assert sketch[f"p{p}"] == pytest.approx(exact[f"p{p}"], abs=1e-4)
+
+    def test_sharded_generation_should_not_depend_on_worker_count(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN the same root seed and shard size
+        WHEN generating sharded scenarios with one and with several workers
+        THEN scenarios and merged statistics should be identical
+        """
+        # Arrange
+        correlation_matrix, param_names = engine.estimate_correlation_matrix(
+            sample_forecast_data
+        )
+        param_stats = {
+            name: {
+                "mean": np.array(data["values"]),
+                "std": (np.array(data["upper_bound"]) - np.array(data["lower_bound"]))
+                / (2 * 1.96),
+            }
+            for name, data in sample_forecast_data.items()
+        }
+
+        # Act
+        with patch.object(settings.monte_carlo, "shard_size", 400):
+            runs = [
+                engine._generate_sharded(
+                    param_names,
+                    param_stats,
+                    1000,
+                    5,
+                    correlation_matrix,
+                    np.random.SeedSequence(2024),
+                    num_workers=workers,
+                )
+                for workers in (1, 3)
+            ]
+
+        # Assert
+        (serial_batch, serial_stats), (pooled_batch, pooled_stats) = runs
+        assert serial_batch.num_scenarios == 1000
+        np.testing.assert_array_equal(serial_batch.values, pooled_batch.values)
+        np.testing.assert_array_equal(
+            serial_batch.summaries["growth_score"],
+            pooled_batch.summaries["growth_score"],
+        )
+        serial_cap = serial_stats["cap_rate"].to_dict([5, 95])
+        assert serial_cap == pooled_stats["cap_rate"].to_dict([5, 95])
+        all_cap_rates = serial_batch.parameter("cap_rate")
+        assert serial_cap["mean"] == pytest.approx(all_cap_rates.mean())
+        assert serial_cap["p95"] == pytest.approx(np.percentile(all_cap_rates, 95))
+
+    def test_generate_scenarios_in_parallel_mode_should_return_full_batch(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN parallel execution enabled
+        WHEN generating Monte Carlo scenarios
+        THEN the merged batch should carry every scenario with ranks and extremes
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        with patch.object(settings.monte_carlo, "shard_size", 250):
+            results = engine.generate_scenarios(
+                sample_property_data, num_scenarios=1000, parallel=True
+            )
+
+        # Assert
+        assert len(results.scenarios) == 1000
+        assert results.scenarios.percentile_ranks.shape == (1000,)
+        assert "best_growth" in results.extreme_scenarios
+        assert set(results.summary_statistics) == set(sample_forecast_data)
+
+    def test_streamed_chunks_should_match_sharded_generation(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN the same seed and a chunk size equal to the shard size
+        WHEN streaming scenario chunks
+        THEN the chunks should concatenate to the sharded run's scenarios
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+        with patch.object(settings.monte_carlo, "shard_size", 250):
+            sharded = engine.generate_scenarios(
+                sample_property_data, num_scenarios=600, parallel=True, seed=99
+            )
+
+        # Act
+        chunks = list(
+            engine.iter_scenario_chunks(
+                sample_property_data, num_scenarios=600, chunk_size=250, seed=99
+            )
+        )
+
+        # Assert
+        assert [chunk.num_scenarios for chunk in chunks] == [250, 250, 100]
+        streamed = ScenarioBatch.concatenate(chunks)
+        np.testing.assert_array_equal(streamed.values, sharded.scenarios.values)
+        np.testing.assert_array_equal(
+            streamed.market_scenario_codes, sharded.scenarios.market_scenario_codes
+        )
+
+    @pytest.mark.parametrize(
+        "mode", [{"vectorized": True}, {"vectorized": False}, {"parallel": True}]
+    )
+    def test_same_seed_should_reproduce_scenarios(
+        self, engine, sample_property_data, sample_forecast_data, mode
+    ):
+        """
+        GIVEN two runs with the same seed
+        WHEN generating scenarios in any sampling mode
+        THEN the scenarios should be identical and the seed recorded
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        first, second = (
+            engine.generate_scenarios(
+                sample_property_data, num_scenarios=50, seed=1234, **mode
+            )
+            for _ in range(2)
+        )
+        other = engine.generate_scenarios(
+            sample_property_data, num_scenarios=50, seed=4321, **mode
+        )
+
+        # Assert
+        assert first.seed == 1234
+        np.testing.assert_array_equal(first.scenarios.values, second.scenarios.values)
+        assert not np.array_equal(first.scenarios.values, other.scenarios.values)
+
+    def test_configured_seed_should_be_default_seed(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN a default seed in the Monte Carlo settings
+        WHEN generating scenarios without a seed
+        THEN the configured seed should drive and be recorded for the run
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        with patch.object(settings.monte_carlo, "seed", 99):
+            configured = engine.generate_scenarios(
+                sample_property_data, num_scenarios=20
+            )
+        explicit = engine.generate_scenarios(
+            sample_property_data, num_scenarios=20, seed=99
+        )
+
+        # Assert
+        assert configured.seed == 99
+        np.testing.assert_array_equal(
+            configured.scenarios.values, explicit.scenarios.values
+        )
+
+    def test_recorded_seed_should_replay_unseeded_and_generator_runs(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN runs seeded from OS entropy or from a Generator
+        WHEN re-running with the seed recorded in the results
+        THEN the replay should reproduce the original scenarios
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        for seed in (None, np.random.default_rng(5)):
+            # Act
+            original = engine.generate_scenarios(
+                sample_property_data, num_scenarios=20, seed=seed
+            )
+            replay = engine.generate_scenarios(
+                sample_property_data, num_scenarios=20, seed=original.seed
+            )
+
+            # Assert
+            assert isinstance(original.seed, int)
+            np.testing.assert_array_equal(
+                original.scenarios.values, replay.scenarios.values
+            )
+
+    @pytest.mark.parametrize("sampler", ["sobol", "latin_hypercube"])
+    def test_quasi_random_samplers_should_preserve_forecast_moments(
+        self, engine, sample_forecast_data, sampler
+    ):
+        """
+        GIVEN a quasi-random sampler
+        WHEN drawing the scenario tensor
+        THEN draws should keep the forecast means and be reproducible per seed
+        """
+        # Arrange
+        correlation_matrix, param_names = engine.estimate_correlation_matrix(
+            sample_forecast_data
+        )
+        param_stats = engine._forecast_parameter_stats(sample_forecast_data)
+
+        # Act
+        draws = [
+            engine._sample_scenario_tensor(
+                param_names,
+                param_stats,
+                3000,
+                5,
+                correlation_matrix,
+                np.random.default_rng(8),
+                sampler,
+            )
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert draws[0].shape == (3000, 5, 11)
+        np.testing.assert_array_equal(draws[0], draws[1])
+        np.testing.assert_allclose(
+            draws[0][:, 0, :].mean(axis=0),
+            [param_stats[name]["mean"][0] for name in param_names],
+            atol=2e-3,
+        )
+
+    def test_generate_scenarios_should_reject_unknown_sampler(
+        self, engine, sample_property_data
+    ):
+        """
+        GIVEN an unsupported sampler name
+        WHEN generating scenarios
+        THEN it should raise ValidationError
+        """
+        with pytest.raises(ValidationError):
+            engine.generate_scenarios(sample_property_data, sampler="halton")
+
+    def test_sampler_convergence_report_should_compare_against_pseudo_random(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN forecasts for the property's MSA
+        WHEN comparing Sobol convergence against pseudo-random sampling
+        THEN the report should give standard errors and variance reductions
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        report = engine.compare_sampler_convergence(
+            sample_property_data,
+            "sobol",
+            sample_sizes=(64, 256),
+            replications=8,
+            seed=3,
+        )
+
+        # Assert
+        assert report.baseline_sampler == "pseudo_random"
+        assert set(report.standard_errors) == {"pseudo_random", "sobol"}
+        cap_errors = report.standard_errors["sobol"]["avg_cap_rate"]["p95"]
+        assert len(cap_errors) == 2 and all(e > 0 for e in cap_errors)
+        assert len(report.variance_reduction["growth_score"]["p5"]) == 2
+
+    def test_antithetic_draws_should_mirror_scenario_pairs(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN antithetic sampling
+        WHEN drawing the scenario tensor
+        THEN scenarios 2k and 2k+1 should mirror each other around the mean
+        """
+        # Arrange
+        correlation_matrix, param_names = engine.estimate_correlation_matrix(
+            sample_forecast_data
+        )
+        param_stats = engine._forecast_parameter_stats(sample_forecast_data)
+
+        # Act
+        samples = engine._sample_scenario_tensor(
+            param_names,
+            param_stats,
+            101,
+            5,
+            correlation_matrix,
+            np.random.default_rng(4),
+            antithetic=True,
+        )
+
+        # Assert
+        means = np.column_stack([param_stats[name]["mean"] for name in param_names])
+        np.testing.assert_allclose(
+            samples[0:100:2] - means, -(samples[1:100:2] - means), atol=1e-12
+        )
+        assert samples.shape == (101, 5, 11)
+
+    @pytest.mark.parametrize(
+        "variance_reduction", [{"antithetic": True}, {"control_variates": True}]
+    )
+    def test_variance_reduction_should_shrink_standard_error(
+        self, engine, sample_property_data, sample_forecast_data, variance_reduction
+    ):
+        """
+        GIVEN a fixed scenario budget
+        WHEN enabling antithetic pairs or control variates
+        THEN the risk score standard error should shrink and the ESS grow
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        plain = engine.generate_scenarios(
+            sample_property_data, num_scenarios=2000, seed=10
+        )
+        reduced = engine.generate_scenarios(
+            sample_property_data, num_scenarios=2000, seed=10, **variance_reduction
+        )
+
+        # Assert
+        plain_risk = plain.precision["risk_score"]
+        reduced_risk = reduced.precision["risk_score"]
+        assert plain_risk["effective_sample_size"] == pytest.approx(2000)
+        assert reduced_risk["standard_error"] < plain_risk["standard_error"] / 2
+        assert reduced_risk["effective_sample_size"] > 4 * 2000
+        assert reduced_risk["estimate"] == pytest.approx(
+            plain_risk["estimate"], abs=5 * plain_risk["standard_error"]
+        )
+
+    def test_adaptive_generation_should_stop_once_percentiles_converge(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN a loose convergence tolerance
+        WHEN generating scenarios adaptively
+        THEN it should stop well before the scenario cap and report convergence
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        results = engine.generate_scenarios_adaptive(
+            sample_property_data,
+            tolerance=0.2,
+            batch_size=500,
+            max_scenarios=20000,
+            seed=11,
+        )
+
+        # Assert
+        convergence = results.convergence
+        assert convergence["converged"] is True
+        assert convergence["scenarios_used"] < 20000
+        assert results.num_scenarios == convergence["scenarios_used"]
+        assert len(results.scenarios) == convergence["scenarios_used"]
+        assert convergence["batches"] >= settings.monte_carlo.adaptive_min_batches
+        assert max(convergence["relative_standard_errors"].values()) <= 0.2
+        assert "growth_score_p95" in convergence["relative_standard_errors"]
+
+    def test_adaptive_generation_should_respect_scenario_cap(
+        self, engine, sample_property_data, sample_forecast_data
+    ):
+        """
+        GIVEN a tolerance that cannot be met within the scenario cap
+        WHEN generating scenarios adaptively
+        THEN it should stop at the cap and report that it did not converge
+        """
+        # Arrange
+        engine.cached_forecasts["35620_5"] = sample_forecast_data
+
+        # Act
+        results = engine.generate_scenarios_adaptive(
+            sample_property_data,
+            tolerance=1e-6,
+            batch_size=300,
+            max_scenarios=1000,
+            seed=12,
+        )
+
+        # Assert
+        assert results.convergence["converged"] is False
+        assert results.num_scenarios == 1000
+        assert results.convergence["batches"] == 4
+        assert results.scenarios.percentile_ranks is not None
+
+    def test_sampling_factorization_should_be_cached_per_forecast_version(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN forecasts for an MSA and horizon
+        WHEN requesting the sampling factorization repeatedly
+        THEN it should be reused until the forecast values change or the
+        MSA's forecasts are invalidated
+        """
+        # Arrange
+        first = engine.get_sampling_factorization("35620", 5, sample_forecast_data)
+
+        # Act
+        with patch.object(engine, "estimate_correlation_matrix") as estimate:
+            second = engine.get_sampling_factorization("35620", 5, sample_forecast_data)
+        revised = {name: dict(data) for name, data in sample_forecast_data.items()}
+        revised["cap_rate"]["values"] = [0.07] * 5
+        third = engine.get_sampling_factorization("35620", 5, revised)
+
+        # Assert
+        assert second is first
+        estimate.assert_not_called()
+        assert third is not first
+        assert len(engine.factorization_cache) == 1
+        invalidate_forecasts("35620")
+        assert len(engine.factorization_cache) == 0
+
+    def test_sampling_factorization_should_hold_year_covariances_and_factors(
+        self, engine, sample_forecast_data
+    ):
+        """
+        GIVEN forecasts with per-year confidence intervals
+        WHEN building the sampling factorization
+        THEN each year's Cholesky factor should reproduce its covariance matrix
+        """
+        # Act
+        factorization = engine.get_sampling_factorization(
+            "35620", 5, sample_forecast_data
+        )
+
+        # Assert
+        factors = factorization.year_factors
+        assert factorization.year_covariances.shape == (5, 11, 11)
+        np.testing.assert_allclose(
+            factors @ factors.transpose(0, 2, 1),
+            factorization.year_covariances,
+            atol=1e-15,
+        )
+        stds = np.array(
+            [
+                factorization.param_stats[name]["std"]
+                for name in factorization.param_names
+            ]
+        ).T
+        np.testing.assert_allclose(
+            factorization.year_covariances[2],
+            np.outer(stds[2], stds[2]) * factorization.correlation_matrix,
+        )
@@ -0,0 +1,118 @@
+"""
+Unit Tests for Streaming Summary Statistics
+
+Tests the monte_carlo.statistics module following BDD/TDD principles.
+"""
+
+import numpy as np
+import pytest
+
+from core.exceptions import ConfigurationError
+from monte_carlo.statistics import RunningStatistics, StreamingSummary, TDigest
+
+
+class TestRunningStatistics:
+    """Test cases for RunningStatistics."""
+
+    def test_chunked_updates_should_match_numpy(self):
+        """
+        GIVEN values fed in uneven chunks
+        WHEN accumulating running statistics
+        THEN mean, std, min and max should match NumPy on the full array
+        """
+        values = np.random.default_rng(1).normal(0.05, 0.01, size=10007)
+        stats = RunningStatistics()
+        for start in range(0, values.size, 1000):
+            stats.update(values[start : start + 1000])
+
+        assert stats.count == values.size
+        assert stats.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert stats.std == pytest.approx(np.std(values), rel=1e-10)
+        assert stats.min == values.min()
+        assert stats.max == values.max()
+
+    def test_merge_should_equal_single_pass(self):
+        """
+        GIVEN two accumulators built on disjoint shards
+        WHEN merging them
+        THEN the result should equal one accumulator over all values
+        """
+        rng = np.random.default_rng(2)
+        left, right = rng.normal(size=300), rng.normal(3.0, 2.0, size=700)
+        merged, shard = RunningStatistics(), RunningStatistics()
+        merged.update(left)
+        shard.update(right)
+        merged.merge(shard)
+
+        combined = np.concatenate([left, right])
+        assert merged.mean == pytest.approx(combined.mean(), rel=1e-12)
+        assert merged.variance == pytest.approx(combined.var(), rel=1e-12)
+
+
+class TestTDigest:
+    """Test cases for TDigest."""
+
+    def test_percentiles_should_approximate_exact_values(self):
+        """
+        GIVEN a large sample
+        WHEN estimating tail and central percentiles with a t-digest
+        THEN estimates should be close to the exact percentiles
+        """
+        values = np.random.default_rng(3).normal(0.06, 0.01, size=200000)
+        digest = TDigest(compression=200, buffer_size=20000)
+        digest.update(values)
+
+        for p in (5, 25, 50, 75, 95):
+            assert digest.percentile(p) == pytest.approx(
+                np.percentile(values, p), abs=0.0005
+            )
+        assert digest.weights.size < 300  # Compressed, not retaining samples
+        assert digest.count == values.size
+
+    def test_merged_digests_should_match_single_digest(self):
+        """
+        GIVEN digests built on separate shards
+        WHEN merging them
+        THEN percentiles should match the exact percentiles of all values
+        """
+        rng = np.random.default_rng(4)
+        shards = [rng.lognormal(size=25000) for _ in range(4)]
+        merged = TDigest()
+        for shard in shards:
+            digest = TDigest()
+            digest.update(shard)
+            merged.merge(digest)
+
+        combined = np.concatenate(shards)
+        for p in (5, 50, 95):
+            exact = np.percentile(combined, p)
+            assert merged.percentile(p) == pytest.approx(exact, rel=0.01)
+
+
+class TestStreamingSummary:
+    """Test cases for StreamingSummary."""
+
+    def test_exact_summary_should_match_numpy_percentiles(self):
+        """
+        GIVEN exact percentile mode
+        WHEN summarizing chunked values
+        THEN the summary should match np.percentile exactly
+        """
+        values = np.random.default_rng(5).uniform(size=5000)
+        summary = StreamingSummary("exact")
+        summary.update(values[:2500])
+        summary.update(values[2500:])
+
+        stats = summary.to_dict([5, 50, 95])
+
+        assert set(stats) == {"mean", "std", "min", "max", "p5", "p50", "p95"}
+        assert stats["p95"] == np.percentile(values, 95)
+
+    def test_unknown_percentile_method_should_raise_error(self):
+        """
+        GIVEN an unsupported percentile method
+        WHEN creating a summary
+        THEN it should raise ConfigurationError
+        """
+        with pytest.raises(ConfigurationError):
+            StreamingSummary("histogram")
@@ -1,15 +1,24 @@
 """
 Basic Simulation Router Tests
 
-Tests for the implemented Monte Carlo simulation endpoint only.
+Tests for the implemented Monte Carlo simulation endpoints.
 """
 
+import json
 from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
-from src.presentation.api.routers.simulation import router
+from config.settings import settings
+from core.exceptions import MonteCarloError
+from monte_carlo.scenario_batch import ScenarioBatch
+from monte_carlo.simulation_engine import MonteCarloEngine, MonteCarloResults
+from monte_carlo.statistics import StreamingSummary
+from src.presentation.api.routers.simulation import _stream_monte_carlo_events, router
 
 
 class TestBasicSimulationRouter:
@@ -115,6 +124,7 @@ class TestBasicSimulationRouter:
             {"correlation_window_years": 2},  # Below minimum
             {"correlation_window_years": 16},  # Above maximum
             {"percentiles": [-5, 50, 105]},  # Invalid percentiles
+            {"sampler": "halton"},  # Unsupported sampler
         ]
 
         base_request = {
@@ -148,3 +158,416 @@ class TestBasicSimulationRouter:
                 "/api/v1/simulation/monte-carlo", json=request, headers=auth_headers
             )
             assert response.status_code == 422  # Validation error
+
+    def test_monte_carlo_seed_should_be_passed_to_engine_and_echoed(
+        self, client, auth_headers, sample_monte_carlo_request
+    ):
+        """Test that the request seed and sampler reach the engine."""
+        engine_results = Mock(scenarios=[], seed=77)
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine"
+        ) as mock_engine:
+            mock_engine.generate_scenarios.return_value = engine_results
+            response = client.post(
+                "/api/v1/simulation/monte-carlo",
+                json={**sample_monte_carlo_request, "seed": 77, "sampler": "sobol"},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert mock_engine.generate_scenarios.call_args.kwargs["seed"] == 77
+        assert mock_engine.generate_scenarios.call_args.kwargs["sampler"] == "sobol"
+        assert response.json()["seed"] == "77"
+
+
+def _scenario_chunks(chunk_sizes, seed=11):
+    """Summarized scenario chunks scattered around plausible market paths."""
+    base_paths = {
+        "commercial_mortgage_rate": [0.045, 0.047, 0.048, 0.049, 0.050, 0.051],
+        "treasury_10y": [0.035, 0.036, 0.037, 0.038, 0.039, 0.040],
+        "fed_funds_rate": [0.025, 0.026, 0.027, 0.028, 0.029, 0.030],
+        "cap_rate": [0.055, 0.056, 0.057, 0.058, 0.059, 0.060],
+        "rent_growth": [0.035, 0.038, 0.040, 0.042, 0.045, 0.048],
+        "expense_growth": [0.025, 0.027, 0.028, 0.030, 0.032, 0.034],
+        "property_growth": [0.040, 0.042, 0.045, 0.047, 0.050, 0.052],
+        "vacancy_rate": [0.050, 0.048, 0.045, 0.043, 0.040, 0.038],
+        "ltv_ratio": [0.75] * 6,
+        "closing_cost_pct": [0.025] * 6,
+        "lender_reserves": [6.0] * 6,
+    }
+    engine = MonteCarloEngine()
+    rng = np.random.default_rng(seed)
+    names = list(base_paths)
+    base = np.array([base_paths[name] for name in names])
+    chunks = []
+    for size in chunk_sizes:
+        batch = ScenarioBatch(
+            values=base * rng.normal(1.0, 0.1, size=(size, *base.shape)),
+            parameter_names=names,
+        )
+        engine._summarize_scenarios(batch)
+        chunks.append(batch)
+    return chunks
+
+
+class TestMonteCarloStreaming:
+    """Test the streaming Monte Carlo endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with main app."""
+        from src.presentation.api.main import app
+
+        return TestClient(app)
+
+    @pytest.fixture
+    def auth_headers(self):
+        """Get authentication headers for API requests."""
+        return {"X-API-Key": "dev_test_key_12345678901234567890123"}
+
+    @pytest.fixture
+    def stream_request(self):
+        """Monte Carlo request for a 600 scenario stream."""
+        return {
+            "property_data": {
+                "property_id": "STREAM_001",
+                "property_name": "Streaming Test Property",
+                "analysis_date": date.today().isoformat(),
+                "residential_units": {
+                    "total_units": 20,
+                    "average_rent_per_unit": 2200,
+                    "unit_types": "2BR",
+                },
+                "renovation_info": {
+                    "status": "not_needed",
+                    "anticipated_duration_months": 0,
+                },
+                "equity_structure": {
+                    "investor_equity_share_pct": 80.0,
+                    "self_cash_percentage": 25.0,
+                    "number_of_investors": 1,
+                },
+                "city": "New York",
+                "state": "NY",
+                "msa_code": "35620",
+                "purchase_price": 3000000.0,
+            },
+            "simulation_count": 600,
+            "include_distributions": True,
+            "percentiles": [5, 50, 95],
+            "seed": 5,
+        }
+
+    def test_stream_should_emit_scenario_chunks_then_summary(
+        self, client, auth_headers, stream_request
+    ):
+        """
+        GIVEN an engine producing three scenario chunks
+        WHEN streaming a Monte Carlo simulation as NDJSON
+        THEN every scenario should arrive in order before a summary of all of them
+        """
+        # Arrange
+        chunks = _scenario_chunks([250, 250, 100])
+        all_scenarios = ScenarioBatch.concatenate(chunks)
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine"
+        ) as mock_engine:
+            mock_engine.iter_scenario_chunks.return_value = iter(chunks)
+            response = client.post(
+                "/api/v1/simulation/monte-carlo/stream",
+                json=stream_request,
+                headers=auth_headers,
+            )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [event["type"] for event in events] == [
+            "scenarios",
+            "scenarios",
+            "scenarios",
+            "summary",
+        ]
+        scenario_ids = [
+            scenario["scenario_id"]
+            for event in events[:-1]
+            for scenario in event["scenarios"]
+        ]
+        assert scenario_ids == list(range(600))
+        assert events[2]["offset"] == 500
+        assert events[0]["scenarios"][0]["dcf_metrics"]["irr"] is not None
+
+        summary = events[-1]
+        assert summary["simulation_count"] == 600
+        assert summary["chunks"] == 3
+        assert summary["seed"] == "5"
+        assert sum(summary["scenario_classification"].values()) == 600
+        assert summary["summary_statistics"]["cap_rate"]["mean"] == pytest.approx(
+            all_scenarios.parameter("cap_rate").mean()
+        )
+        assert "value_at_risk_5" in summary["risk_metrics"]
+        assert [d["parameter_name"] for d in summary["distributions"]] == [
+            "npv",
+            "irr",
+            "equity_multiple",
+        ]
+        assert mock_engine.iter_scenario_chunks.call_args.kwargs["num_scenarios"] == 600
+
+    def test_stream_should_use_server_sent_events_when_requested(
+        self, client, auth_headers, stream_request
+    ):
+        """
+        GIVEN a client accepting text/event-stream
+        WHEN streaming a Monte Carlo simulation
+        THEN events should be framed as Server-Sent Events
+        """
+        # Arrange
+        chunks = _scenario_chunks([300, 300])
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine"
+        ) as mock_engine:
+            mock_engine.iter_scenario_chunks.return_value = iter(chunks)
+            response = client.post(
+                "/api/v1/simulation/monte-carlo/stream",
+                json=stream_request,
+                headers={**auth_headers, "Accept": "text/event-stream"},
+            )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert [frame.splitlines()[0] for frame in frames] == [
+            "event: scenarios",
+            "event: scenarios",
+            "event: summary",
+        ]
+        summary = json.loads(frames[-1].splitlines()[1][len("data: ") :])
+        assert summary["simulation_count"] == 600
+
+    def test_stream_should_fail_before_streaming_when_generation_cannot_start(
+        self, client, auth_headers, stream_request
+    ):
+        """
+        GIVEN an engine that cannot load forecasts
+        WHEN streaming a Monte Carlo simulation
+        THEN a 500 error should be returned instead of a truncated stream
+        """
+
+        # Arrange
+        def failing_chunks(**kwargs):
+            raise MonteCarloError("No forecasts available")
+            yield  # pragma: no cover
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine"
+        ) as mock_engine:
+            mock_engine.iter_scenario_chunks.side_effect = failing_chunks
+            response = client.post(
+                "/api/v1/simulation/monte-carlo/stream",
+                json=stream_request,
+                headers=auth_headers,
+            )
+
+        # Assert
+        assert response.status_code == 500
+
+    def test_stream_accumulators_should_stay_bounded_as_chunks_arrive(self):
+        """
+        GIVEN a default-configured stream of 60 chunks of 1000 scenarios
+        WHEN consuming the stream one event at a time
+        THEN no accumulator should retain raw values and each t-digest should
+            hold a bounded number of centroids
+        """
+        # Arrange
+        chunk = _scenario_chunks([1000])[0]
+        created = []
+
+        class RecordingSummary(StreamingSummary):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        simulation_request = SimpleNamespace(
+            property_data=SimpleNamespace(
+                property_id="STREAM_002", property_name="Streaming Test Property"
+            ),
+            percentiles=[5, 50, 95],
+            include_distributions=False,
+        )
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.StreamingSummary",
+            RecordingSummary,
+        ), patch(
+            "src.presentation.api.routers.simulation.monte_carlo_dcf_service"
+        ) as mock_dcf, patch(
+            "src.presentation.api.routers.simulation._scenario_chunk_event",
+            return_value={"type": "scenarios"},
+        ):
+            mock_dcf.evaluate_scenarios.side_effect = ValueError("DCF skipped")
+            events = _stream_monte_carlo_events(
+                (chunk for _ in range(60)),
+                simulation_request,
+                "req",
+                "1",
+                0.0,
+                "ndjson",
+            )
+            retained = []
+            for _ in events:
+                retained.append(
+                    max(
+                        (
+                            summary.digest.means.size + summary.digest._buffered
+                            for summary in created
+                        ),
+                        default=0,
+                    )
+                )
+
+        # Assert
+        assert settings.monte_carlo.stream_percentile_method == "tdigest"
+        assert len(created) == len(chunk.parameter_names)
+        assert all(summary._chunks == [] for summary in created)
+        assert max(retained) <= created[0].digest.buffer_size
+        assert all(summary.digest.means.size < 200 for summary in created)
+        assert created[0].running.count == 60 * chunk.parameter("cap_rate").size
+
+
+class TestShockAnalysis:
+    """Test the stored-simulation shock endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with main app."""
+        from src.presentation.api.main import app
+
+        return TestClient(app)
+
+    @pytest.fixture
+    def auth_headers(self):
+        """Get authentication headers for API requests."""
+        return {"X-API-Key": "dev_test_key_12345678901234567890123"}
+
+    @pytest.fixture
+    def stored_simulation(self, tmp_path):
+        """A persisted 400 scenario run in a temporary scenario store."""
+        engine = MonteCarloEngine()
+        batch = ScenarioBatch.concatenate(_scenario_chunks([400]))
+        engine._calculate_percentile_ranks(batch)
+        results = MonteCarloResults(
+            property_id="SHOCK_001",
+            msa_code="35620",
+            simulation_date=date.today(),
+            num_scenarios=batch.num_scenarios,
+            horizon_years=batch.horizon_years,
+            scenarios=batch,
+            summary_statistics={},
+            parameter_names=batch.parameter_names,
+        )
+        with patch.object(
+            settings.monte_carlo, "scenario_store_path", str(tmp_path)
+        ), patch("monte_carlo.simulation_engine.db_manager"):
+            simulation_id = engine.save_results(results, persist_scenarios=True)
+            yield engine, batch, simulation_id
+
+    def test_shock_should_rescore_stored_simulation(
+        self, client, auth_headers, stored_simulation
+    ):
+        """
+        GIVEN a stored simulation
+        WHEN applying a +150bp treasury shock with correlation propagation
+        THEN shocked classifications and statistics should be returned
+        """
+        # Arrange
+        engine, batch, simulation_id = stored_simulation
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine", engine
+        ):
+            response = client.post(
+                f"/api/v1/simulation/{simulation_id}/shocks",
+                json={
+                    "shocks": [{"parameter": "treasury_10y", "shift": 0.015}],
+                    "propagate_correlations": True,
+                    "msa_code": "35620",
+                    "horizon_years": batch.horizon_years,
+                },
+                headers=auth_headers,
+            )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulation_count"] == 400
+        assert sum(data["scenario_classification"].values()) == 400
+        assert sum(data["baseline_classification"].values()) == 400
+        assert data["summary_statistics"]["treasury_10y"]["mean"] == pytest.approx(
+            batch.parameter("treasury_10y").mean() + 0.015
+        )
+        assert set(data["score_changes"]) == {"growth_score", "risk_score"}
+
+    def test_shock_on_unknown_simulation_should_return_404(
+        self, client, auth_headers, stored_simulation
+    ):
+        """
+        GIVEN no stored scenarios under a simulation id
+        WHEN requesting a shock analysis for it
+        THEN a 404 should be returned
+        """
+        # Arrange
+        engine, _, _ = stored_simulation
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine", engine
+        ):
+            response = client.post(
+                "/api/v1/simulation/missing_run/shocks",
+                json={"shocks": [{"parameter": "cap_rate", "shift": 0.01}]},
+                headers=auth_headers,
+            )
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_shock_on_mismatched_simulation_should_return_409(
+        self, client, auth_headers, stored_simulation
+    ):
+        """
+        GIVEN a stored simulation for MSA 35620
+        WHEN requesting a shock analysis for another MSA or horizon
+        THEN a 409 should be returned for each mismatch
+        """
+        # Arrange
+        engine, batch, simulation_id = stored_simulation
+        shocks = [{"parameter": "cap_rate", "shift": 0.01}]
+
+        # Act
+        with patch(
+            "src.presentation.api.routers.simulation.monte_carlo_engine", engine
+        ):
+            wrong_msa = client.post(
+                f"/api/v1/simulation/{simulation_id}/shocks",
+                json={"shocks": shocks, "msa_code": "31080"},
+                headers=auth_headers,
+            )
+            wrong_horizon = client.post(
+                f"/api/v1/simulation/{simulation_id}/shocks",
+                json={"shocks": shocks, "horizon_years": batch.horizon_years + 1},
+                headers=auth_headers,
+            )
+
+        # Assert
+        assert wrong_msa.status_code == 409
+        assert "msa_code 31080 (stored 35620)" in wrong_msa.json()["message"]
+        assert wrong_horizon.status_code == 409